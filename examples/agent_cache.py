@@ -0,0 +1,144 @@
+"""
+Disk-backed response cache for the example crews.
+
+Re-running an example with the same prompts and agent configuration serves
+the stored completion instead of calling the LLM again.
+
+Controlled by the MM_CACHE environment variable:
+- MM_CACHE=0: never cache
+- MM_CACHE=1: cache every agent, even with temperature > 0
+- unset: cache only deterministic agents (temperature == 0)
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Optional
+
+import orjson
+
+from manus_machina.agents.simple_agent import SimpleAgent, StreamError
+
+
+CACHE_DIR = Path.home() / ".manus_machina" / "cache"
+
+
+def cache_key(agent: SimpleAgent, task: str, context: Optional[Dict[str, Any]]) -> str:
+    """Build a content hash for an agent call."""
+    config = agent.config
+    payload = {
+        "name": config.name,
+        "role": config.role,
+        "goal": config.goal,
+        "backstory": config.backstory,
+        "model": config.model,
+        "temperature": config.temperature,
+        "max_tokens": config.max_tokens,
+        "task": task,
+        "context": context,
+    }
+    raw = orjson.dumps(
+        payload,
+        default=str,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    )
+    return hashlib.sha256(raw).hexdigest()
+
+
+def _cache_enabled(agent: SimpleAgent) -> bool:
+    """Check whether calls to this agent may be served from cache."""
+    setting = os.getenv("MM_CACHE")
+    if setting == "0":
+        return False
+    if setting == "1":
+        return True
+    return agent.config.temperature == 0
+
+
+async def cached_execute(
+    agent: SimpleAgent,
+    task: str,
+    context: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Execute a task, serving the result from disk when available.
+
+    Only successful results are stored.
+
+    Args:
+        agent: Agent to execute
+        task: Task description
+        context: Optional context
+
+    Returns:
+        Result dictionary
+    """
+    if not _cache_enabled(agent):
+        return await agent.execute(task=task, context=context)
+
+    path = CACHE_DIR / f"{cache_key(agent, task, context)}.json"
+    if path.exists():
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    result = await agent.execute(task=task, context=context)
+    if result.get("status") == "success":
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(result), encoding="utf-8")
+
+    return result
+
+
+class CachedAgent:
+    """Thin wrapper that routes SimpleAgent.execute through the disk cache."""
+
+    def __init__(self, agent: SimpleAgent):
+        self.agent = agent
+        self.config = agent.config
+
+    async def execute(self, task: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Execute a task with caching."""
+        return await cached_execute(self.agent, task=task, context=context)
+
+    async def execute_stream(
+        self,
+        task: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """Stream a task's response; a cache hit is yielded as one chunk."""
+        if not _cache_enabled(self.agent):
+            async for chunk in self.agent.execute_stream(task=task, context=context):
+                yield chunk
+            return
+
+        path = CACHE_DIR / f"{cache_key(self.agent, task, context)}.json"
+        if path.exists():
+            yield json.loads(path.read_text(encoding="utf-8"))["response"]
+            return
+
+        chunks = []
+        failed = False
+        async for chunk in self.agent.execute_stream(task=task, context=context):
+            # A stream can fail midway, after yielding part of the response
+            failed = failed or isinstance(chunk, StreamError)
+            chunks.append(chunk)
+            yield chunk
+
+        if not failed:
+            response = "".join(chunks)
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps({
+                "agent": self.config.name,
+                "task": task,
+                "response": response,
+                "result": response,
+                "status": "success"
+            }), encoding="utf-8")
+
+    def __getattr__(self, name: str) -> Any:
+        # Everything except execute() and execute_stream() goes straight
+        # to the wrapped agent
+        return getattr(self.agent, name)
+
+    def __repr__(self) -> str:
+        return f"CachedAgent({self.agent!r})"
@@ -11,6 +11,11 @@ This example shows:
 """
 
 import asyncio
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
 from manus_machina.core.agent import Agent, AgentConfig
 from manus_machina.core.crew import Crew, CrewConfig, ProcessType
 from manus_machina.memory.vector_store import VectorMemory, VectorStoreProvider
@@ -21,6 +26,35 @@ from manus_machina.guardrails.guards import PromptInjectionGuard, ToxicityGuard
 from manus_machina.guardrails.engine import GuardrailEngine
 
 
+class EmbeddingCache:
+    """
+    Persistent embedding cache keyed by SHA256(model + content).
+    
+    Seed documents are re-added on every run; with this cache their
+    embeddings are computed once and read back from disk afterwards.
+    """
+    
+    def __init__(self, path: str = "~/.manus_machina/embed_cache.sqlite"):
+        db_path = Path(path).expanduser()
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(db_path)
+        self.db.execute("CREATE TABLE IF NOT EXISTS e(k TEXT PRIMARY KEY, v BLOB)")
+    
+    def key(self, text: str, model: str) -> str:
+        """Build the cache key for a text under an embedding model."""
+        return hashlib.sha256(f"{model}|{text}".encode("utf-8")).hexdigest()
+    
+    def get(self, k: str) -> Optional[bytes]:
+        """Return the stored float32 vector bytes, or None on a miss."""
+        row = self.db.execute("SELECT v FROM e WHERE k = ?", (k,)).fetchone()
+        return row[0] if row else None
+    
+    def set(self, k: str, vec_bytes: bytes) -> None:
+        """Store float32 vector bytes."""
+        self.db.execute("INSERT OR REPLACE INTO e(k, v) VALUES (?, ?)", (k, vec_bytes))
+        self.db.commit()
+
+
 async def main():
     print("=" * 80)
     print("Manus Machina v2.0 - Complete Example")
@@ -31,7 +65,8 @@ async def main():
     memory = VectorMemory(
         provider=VectorStoreProvider.FAISS,
         index_name="demo_memory",
-        embedding_model="text-embedding-3-large"
+        embedding_model="text-embedding-3-large",
+        embedding_cache=EmbeddingCache()
     )
     
     # Add some initial knowledge
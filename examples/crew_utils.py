@@ -0,0 +1,179 @@
+"""
+Shared helpers for the example crews.
+"""
+
+import asyncio
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+from collections import namedtuple
+from typing import Any, Dict, List, Optional
+
+
+# One node of a crew workflow. `task` is a string.Template filled from the
+# run parameters; `deps` names the phases whose outputs go into its context.
+Phase = namedtuple(
+    "Phase",
+    "name agent task deps title done limit",
+    defaults=(None,)
+)
+
+class _LazyQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues the raw record instead of pre-formatting it."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The listener runs in-process, so exc_info can cross the queue as-is
+        return record
+
+
+# Error logging goes through a queue: log.exception() only enqueues the
+# record, and the listener thread formats the traceback off the event loop.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+log = logging.getLogger("mm.example")
+log.addHandler(_LazyQueueHandler(_log_queue))
+log.propagate = False
+
+# Shared across run_dag calls so concurrent workflows (several features or
+# topics in flight) never stream on top of each other.
+_stdout_lock = asyncio.Lock()
+_running = 0
+
+
+def load_jobs(path: str, field: str) -> List[str]:
+    """
+    Read one job per line from a JSONL file.
+
+    Each line is either a JSON string or an object holding the job under
+    `field` (e.g. {"feature": "..."}). Blank lines are skipped.
+
+    Args:
+        path: Path to the JSONL file
+        field: Key to read from object lines
+
+    Returns:
+        List of job descriptions
+    """
+    jobs = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            jobs.append(item[field] if isinstance(item, dict) else item)
+    return jobs
+
+
+async def stream_phase(
+    agent: Any,
+    task: str,
+    context: Optional[Dict[str, Any]] = None,
+    limit: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Stream an agent's response to stdout as it is generated.
+
+    Args:
+        agent: Agent exposing execute_stream()
+        task: Task description
+        context: Optional context
+        limit: Print at most this many characters (the full text is still returned)
+
+    Returns:
+        Result dictionary with the agent name and the full response
+    """
+    chunks = []
+    printed = 0
+
+    async for chunk in agent.execute_stream(task=task, context=context):
+        chunks.append(chunk)
+        if limit is None:
+            sys.stdout.write(chunk)
+        elif printed < limit:
+            sys.stdout.write(chunk[:limit - printed])
+            printed += len(chunk)
+            if printed >= limit:
+                sys.stdout.write("...")
+        sys.stdout.flush()
+
+    sys.stdout.write("\n")
+
+    return {
+        "agent": agent.config.name,
+        "task": task,
+        "response": "".join(chunks),
+    }
+
+
+def write_block(*lines: str) -> None:
+    """Write several lines to stdout in a single call (same output as print per line)."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+async def run_dag(phases: List[Phase], params: Dict[str, Any], rule: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Execute a workflow of phases, starting each one as soon as its deps finish.
+
+    Independent phases run concurrently, so wall time follows the critical
+    path of the DAG instead of the sum of all phases. A phase that starts
+    while nothing else is running is streamed to stdout; phases that overlap
+    run silently and are written as one block when they complete. Context
+    sections are ordered as the phases are listed, so `phases` should be in
+    topological order.
+
+    Args:
+        phases: Workflow nodes
+        params: Values substituted into every task template
+        rule: Separator line written under each phase title
+
+    Returns:
+        Result dictionary per phase name
+    """
+    order = [phase.name for phase in phases]
+    outputs: Dict[str, str] = {}
+    tasks: Dict[str, asyncio.Task] = {}
+
+    async def run_phase(phase: Phase) -> Dict[str, Any]:
+        global _running
+        await asyncio.gather(*[tasks[dep] for dep in phase.deps])
+
+        task = phase.task.substitute(params)
+        context = {name: outputs[name] for name in order if name in phase.deps} or None
+
+        _running += 1
+        try:
+            if _running == 1:
+                async with _stdout_lock:
+                    write_block(f"\n{phase.title}", rule)
+                    result = await stream_phase(phase.agent, task=task, context=context, limit=phase.limit)
+                    print(f"\n✅ {phase.done} by {result['agent']}")
+            else:
+                result = await phase.agent.execute(task=task, context=context)
+                response = result['response']
+                if phase.limit is not None and len(response) > phase.limit:
+                    response = response[:phase.limit] + "..."
+                async with _stdout_lock:
+                    write_block(
+                        f"\n{phase.title}",
+                        rule,
+                        response,
+                        f"\n✅ {phase.done} by {result['agent']}",
+                    )
+        finally:
+            _running -= 1
+
+        outputs[phase.name] = result['response']
+        return result
+
+    # Tasks are registered before any of them runs, so deps always resolve
+    async with asyncio.TaskGroup() as tg:
+        for phase in phases:
+            tasks[phase.name] = tg.create_task(run_phase(phase))
+
+    return {name: task.result() for name, task in tasks.items()}
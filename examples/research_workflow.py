@@ -65,6 +65,9 @@ async def main():
     # 2. Create Agents
     print("\n2. Creating Agents...")
     
+    # One client (and connection pool) shared by all agents
+    llm_client = MockLLMClient()
+    
     # Research Agent
     researcher_config = AgentConfig(
         name="researcher",
@@ -80,7 +83,7 @@ async def main():
         output_guards=["toxicity", "factuality"],
     )
     researcher = Agent(config=researcher_config)
-    researcher.set_llm_client(MockLLMClient())
+    researcher.set_llm_client(llm_client)
     researcher.set_guardrail_engine(guardrail_engine)
     
     print(f"   ✓ Created agent: {researcher.config.name} ({researcher.config.role})")
@@ -97,7 +100,7 @@ async def main():
         output_guards=["toxicity"],
     )
     writer = Agent(config=writer_config)
-    writer.set_llm_client(MockLLMClient())
+    writer.set_llm_client(llm_client)
     writer.set_guardrail_engine(guardrail_engine)
     
     print(f"   ✓ Created agent: {writer.config.name} ({writer.config.role})")
@@ -196,8 +199,9 @@ async def main():
     
     # Create saga
     booking_saga = Saga(name="trip_booking")
-    booking_saga.add_step("book_flight", book_flight, cancel_flight)
-    booking_saga.add_step("book_hotel", book_hotel, cancel_hotel)
+    # Flight and hotel are independent, so they book concurrently
+    booking_saga.add_step("book_flight", book_flight, cancel_flight, depends_on=[])
+    booking_saga.add_step("book_hotel", book_hotel, cancel_hotel, depends_on=[])
     booking_saga.add_step("charge_payment", charge_payment, refund_payment)
     
     try:
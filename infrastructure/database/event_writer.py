@@ -0,0 +1,195 @@
+"""
+Batched Event Writer
+
+Buffers domain events and writes them to the events table in bulk.
+One multi-row INSERT per batch replaces a round trip per event, which
+keeps lifecycle-hook event streams from bottlenecking on the database.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID
+import asyncio
+
+from sqlalchemy import insert
+
+from infrastructure.database.models import EventModel, uuid7
+from manus_machina.events import DomainEvent, EventType
+from manus_machina.observability.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class EventWriter:
+    """
+    Background writer that flushes queued events in batches.
+    
+    A batch is written when `batch_size` events are queued or
+    `flush_interval` seconds after its first event, whichever comes first.
+    
+    For PostgreSQL, create the engine with
+    `executemany_mode="values_plus_batch"` so psycopg2 sends each batch
+    as a single statement.
+    
+    Usage:
+        writer = EventWriter(async_sessionmaker(engine))
+        await writer.start()
+        writer.attach(agent)
+        ...
+        await writer.stop()
+    """
+    
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        batch_size: int = 500,
+        flush_interval: float = 0.2
+    ):
+        """
+        Initialize writer.
+        
+        Args:
+            session_factory: Callable returning an AsyncSession context manager
+            batch_size: Maximum events per INSERT
+            flush_interval: Maximum seconds an event waits before being written
+        """
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        
+        # Metrics
+        self._events_written = 0
+        self._batches_written = 0
+        self._failed_batches = 0
+    
+    async def start(self) -> None:
+        """Start the background flush task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Flush pending events and stop the background task."""
+        if self._task is None:
+            return
+        
+        await self._queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+    
+    def emit(self, event: Dict[str, Any]) -> None:
+        """
+        Queue an event row for writing (never blocks).
+        
+        Args:
+            event: Row with at least `event_type`; `id` is generated when
+                missing and `timestamp` is left to the database default
+        """
+        row = {
+            "id": event.get("id") or uuid7(),
+            "session_id": event.get("session_id"),
+            "event_type": event["event_type"],
+            "agent_name": event.get("agent_name"),
+            "data": event.get("data") or {},
+            "correlation_id": event.get("correlation_id"),
+        }
+        if event.get("timestamp") is not None:
+            row["timestamp"] = event["timestamp"]
+        self._queue.put_nowait(row)
+    
+    def emit_event(self, event: DomainEvent) -> None:
+        """Queue a DomainEvent for writing."""
+        self.emit({
+            "id": event.id,
+            "session_id": event.session_id,
+            "event_type": event.event_type.value,
+            "agent_name": event.agent_name,
+            "data": event.data,
+            "correlation_id": str(event.correlation_id) if event.correlation_id else None,
+            "timestamp": event.timestamp,
+        })
+    
+    def attach(self, agent: Any, session_id: Optional[UUID] = None) -> None:
+        """
+        Record an agent's lifecycle events through this writer.
+        
+        Args:
+            agent: Agent exposing on_start/on_message/on_error/on_complete
+            session_id: Session the events belong to
+        """
+        def record(event_type: EventType, data: Optional[Dict[str, Any]] = None) -> None:
+            self.emit({
+                "session_id": session_id,
+                "event_type": event_type.value,
+                "agent_name": agent.config.name,
+                "data": data,
+            })
+        
+        async def on_start(a: Any) -> None:
+            record(EventType.AGENT_STARTED)
+        
+        async def on_message(a: Any, message: Dict[str, Any]) -> None:
+            record(EventType.MESSAGE_RECEIVED, {"message": message})
+        
+        async def on_error(a: Any, error: Exception) -> None:
+            record(EventType.AGENT_FAILED, {"error": str(error)})
+        
+        async def on_complete(a: Any) -> None:
+            record(EventType.AGENT_COMPLETED)
+        
+        agent.on_start(on_start)
+        agent.on_message(on_message)
+        agent.on_error(on_error)
+        agent.on_complete(on_complete)
+    
+    async def _run(self) -> None:
+        """Drain the queue in batches until cancelled."""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+            
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                await self._flush(batch)
+            except Exception as e:
+                # Keep draining; a failed batch must not stall later events
+                self._failed_batches += 1
+                logger.error("event_batch_failed", batch_size=len(batch), exc_info=e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+    
+    async def _flush(self, rows: List[Dict[str, Any]]) -> None:
+        """Write one batch with a single executemany INSERT."""
+        async with self.session_factory() as session:
+            await session.execute(insert(EventModel), rows)
+            await session.commit()
+        
+        self._events_written += len(rows)
+        self._batches_written += 1
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get writer metrics."""
+        return {
+            "events_written": self._events_written,
+            "batches_written": self._batches_written,
+            "failed_batches": self._failed_batches,
+            "pending": self._queue.qsize(),
+            "avg_batch_size": self._events_written / self._batches_written
+                if self._batches_written > 0 else 0,
+        }
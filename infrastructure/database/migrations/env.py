@@ -14,7 +14,7 @@ import sys
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from models import Base
+from models import Base, json_serializer, json_deserializer
 
 # Alembic Config object
 config = context.config
@@ -55,6 +55,8 @@ def run_migrations_online() -> None:
         configuration,
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
     )
 
     with connectable.connect() as connection:
@@ -3,28 +3,61 @@ Database Models - SQLAlchemy ORM
 
 Defines the database schema for sessions, state, events, and artifacts.
 Supports PostgreSQL, MySQL, and SQLite.
+
+Timestamps are assigned by the database (func.now()), so the DB clock is
+authoritative; run the server in UTC to match the naive DateTime columns.
 """
 
-from datetime import datetime
 from sqlalchemy import (
     Column, String, DateTime, Boolean, Integer, Text,
-    ForeignKey, Index, JSON
+    ForeignKey, Index, JSON, Uuid, text, func
 )
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
-from uuid import uuid4
+import os
+import time
 import uuid
+import orjson
 
 Base = declarative_base()
 
 
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+    
+    The leading 48 bits are the Unix time in milliseconds, so new rows
+    append to the tail of the primary key index instead of landing on
+    random B-tree pages like uuid4.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76                          # version
+    value |= ((rand >> 62) & 0xFFF) << 64       # rand_a
+    value |= 0b10 << 62                         # variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF       # rand_b
+    return uuid.UUID(int=value)
+
+
+def json_serializer(value) -> str:
+    """Serialize JSON columns with orjson (pass as create_engine(json_serializer=...))."""
+    return orjson.dumps(value).decode()
+
+
+def json_deserializer(value):
+    """Deserialize JSON columns with orjson (pass as create_engine(json_deserializer=...))."""
+    return orjson.loads(value)
+
+
 class SessionModel(Base):
     """Session table"""
     __tablename__ = "sessions"
     
     # Primary key
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
+    id = Column(Uuid, primary_key=True, default=uuid7)
     
     # Metadata
     user_id = Column(String(255), nullable=True, index=True)
@@ -36,8 +69,8 @@ class SessionModel(Base):
     is_active = Column(Boolean, nullable=False, default=True, index=True)
     
     # Timestamps
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+    created_at = Column(DateTime, nullable=False, server_default=func.now(), index=True)
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now(), index=True)
     
     # Relationships
     state_entries = relationship("StateModel", back_populates="session", cascade="all, delete-orphan")
@@ -47,7 +80,8 @@ class SessionModel(Base):
     # Indexes
     __table_args__ = (
         Index('idx_session_user_app', 'user_id', 'app_name'),
-        Index('idx_session_active_updated', 'is_active', 'updated_at'),
+        # Active sessions by recency; partial on PostgreSQL, plain index elsewhere
+        Index('idx_session_active_partial', 'updated_at', postgresql_where=text('is_active')),
     )
 
 
@@ -59,7 +93,7 @@ class StateModel(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     
     # Foreign key
-    session_id = Column(String(36), ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False, index=True)
+    session_id = Column(Uuid, ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Key-value
     key = Column(String(255), nullable=False, index=True)
@@ -69,8 +103,8 @@ class StateModel(Base):
     scope = Column(String(50), nullable=False, default="session", index=True)  # session, user, app, temp
     
     # Timestamps
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
     
     # Relationship
     session = relationship("SessionModel", back_populates="state_entries")
@@ -87,10 +121,10 @@ class EventModel(Base):
     __tablename__ = "events"
     
     # Primary key
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
+    id = Column(Uuid, primary_key=True, default=uuid7)
     
     # Foreign key
-    session_id = Column(String(36), ForeignKey("sessions.id", ondelete="CASCADE"), nullable=True, index=True)
+    session_id = Column(Uuid, ForeignKey("sessions.id", ondelete="CASCADE"), nullable=True, index=True)
     
     # Event data
     event_type = Column(String(100), nullable=False, index=True)
@@ -101,14 +135,18 @@ class EventModel(Base):
     correlation_id = Column(String(36), nullable=True, index=True)
     
     # Timestamp
-    timestamp = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+    timestamp = Column(DateTime, nullable=False, server_default=func.now(), index=True)
     
     # Relationship
     session = relationship("SessionModel", back_populates="events")
     
     # Indexes
     __table_args__ = (
-        Index('idx_event_session_type', 'session_id', 'event_type'),
+        # Covers "session + type, newest first" lookups without a heap fetch on PostgreSQL
+        Index(
+            'idx_event_session_type_ts', 'session_id', 'event_type', 'timestamp',
+            postgresql_include=['agent_name']
+        ),
         Index('idx_event_timestamp', 'timestamp'),
     )
 
@@ -118,28 +156,29 @@ class ArtifactModel(Base):
     __tablename__ = "artifacts"
     
     # Primary key
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
+    id = Column(Uuid, primary_key=True, default=uuid7)
     
     # Foreign key
-    session_id = Column(String(36), ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False, index=True)
+    session_id = Column(Uuid, ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Artifact data
     type = Column(String(100), nullable=False, index=True)
     title = Column(String(500), nullable=False)
     description = Column(Text, nullable=True)
     content = Column(Text, nullable=False)
-    metadata = Column(JSON, nullable=False, default=dict)
+    # "metadata" is reserved by declarative Base; the DB column keeps the name
+    extra_metadata = Column("metadata", JSON, nullable=False, default=dict)
     
     # Versioning
     version = Column(Integer, nullable=False, default=1)
-    parent_id = Column(String(36), nullable=True, index=True)
+    parent_id = Column(Uuid, nullable=True, index=True)
     
     # Context
     agent_name = Column(String(255), nullable=True, index=True)
     tags = Column(JSON, nullable=False, default=list)
     
     # Timestamp
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+    created_at = Column(DateTime, nullable=False, server_default=func.now(), index=True)
     
     # Relationship
     session = relationship("SessionModel", back_populates="artifacts")
@@ -167,8 +206,8 @@ class UserStateModel(Base):
     value = Column(JSON, nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
     
     # Indexes
     __table_args__ = (
@@ -191,8 +230,8 @@ class AppStateModel(Base):
     value = Column(JSON, nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
     
     # Indexes
     __table_args__ = (
@@ -4,8 +4,9 @@ from typing import Any, Dict, List, Optional, Callable, Awaitable
 from pydantic import BaseModel, Field
 from enum import Enum
 import asyncio
+import orjson
 
-from manus_machina.core.state import State
+from manus_machina.agents.state import State
 from manus_machina.tools.base import Tool
 
 
@@ -63,6 +64,9 @@ class AgentConfig(BaseModel):
     input_guards: List[str] = Field(default_factory=list)
     output_guards: List[str] = Field(default_factory=list)
     action_guards: List[str] = Field(default_factory=list)
+    
+    class Config:
+        frozen = True  # Read on every execute; never mutated after construction
 
 
 class AgentStatus(str, Enum):
@@ -87,6 +91,26 @@ class Agent:
     - Execute tasks with resilience patterns
     """
     
+    # Agents can be short-lived and numerous; no per-instance __dict__
+    __slots__ = (
+        "config",
+        "tools",
+        "state",
+        "status",
+        "_system_prompt_cached",
+        "_on_start_hooks",
+        "_on_message_hooks",
+        "_on_error_hooks",
+        "_on_complete_hooks",
+        "_llm_client",
+        "_memory_store",
+        "_communication_bus",
+        "_resilience_engine",
+        "_guardrail_engine",
+        "_input_guards_active",
+        "_output_guards_active",
+    )
+    
     def __init__(
         self,
         config: AgentConfig,
@@ -98,6 +122,9 @@ class Agent:
         self.state = state or State()
         self.status = AgentStatus.IDLE
         
+        # Static part of every prompt; rebuilt when tools change
+        self._system_prompt_cached = self._compute_system_prompt()
+        
         # Lifecycle hooks
         self._on_start_hooks: List[Callable[[Agent], Awaitable[None]]] = []
         self._on_message_hooks: List[Callable[[Agent, Dict[str, Any]], Awaitable[None]]] = []
@@ -110,6 +137,20 @@ class Agent:
         self._communication_bus: Optional[Any] = None
         self._resilience_engine: Optional[Any] = None
         self._guardrail_engine: Optional[Any] = None
+        
+        # Guardrail fast path, recomputed when an engine is attached
+        self._input_guards_active = False
+        self._output_guards_active = False
+    
+    def add_tool(self, tool: Tool) -> None:
+        """Add a tool to the agent."""
+        self.tools.append(tool)
+        self._system_prompt_cached = self._compute_system_prompt()
+    
+    def set_tools(self, tools: List[Tool]) -> None:
+        """Replace the agent's tools."""
+        self.tools = list(tools)
+        self._system_prompt_cached = self._compute_system_prompt()
     
     def set_llm_client(self, client: Any) -> None:
         """Set the LLM client."""
@@ -130,6 +171,11 @@ class Agent:
     def set_guardrail_engine(self, engine: Any) -> None:
         """Set the guardrail engine."""
         self._guardrail_engine = engine
+        
+        # An empty guard list selects no guards, so skip the call entirely
+        enabled = engine is not None and self.config.enable_guardrails
+        self._input_guards_active = bool(enabled and self.config.input_guards)
+        self._output_guards_active = bool(enabled and self.config.output_guards)
     
     def on_start(self, hook: Callable[["Agent"], Awaitable[None]]) -> None:
         """Register a hook to be called when agent starts."""
@@ -150,60 +196,135 @@ class Agent:
     async def start(self) -> None:
         """Start the agent."""
         self.status = AgentStatus.RUNNING
-        for hook in self._on_start_hooks:
-            await hook(self)
+        await self._run_hooks(self._on_start_hooks, self)
     
     async def stop(self) -> None:
         """Stop the agent."""
         self.status = AgentStatus.STOPPED
     
-    async def execute(self, task: str, context: Optional[Dict[str, Any]] = None) -> Any:
+    async def execute(
+        self,
+        task: str,
+        context: Optional[Dict[str, Any]] = None,
+        _skip_lifecycle: bool = False
+    ) -> Any:
         """
         Execute a task.
         
         Args:
             task: Task description
             context: Additional context for the task
+            _skip_lifecycle: Leave status and start/complete hooks to the
+                caller (used by execute_batch)
             
         Returns:
             Task result
         """
         try:
-            await self.start()
+            if not _skip_lifecycle:
+                await self.start()
             
             # Build prompt
             prompt = self._build_prompt(task, context or {})
             
             # Apply input guardrails
-            if self._guardrail_engine and self.config.enable_guardrails:
+            if self._input_guards_active:
                 prompt = await self._guardrail_engine.validate_input(prompt, self.config.input_guards)
             
             # Execute with LLM
             result = await self._execute_with_llm(prompt)
             
             # Apply output guardrails
-            if self._guardrail_engine and self.config.enable_guardrails:
+            if self._output_guards_active:
                 result = await self._guardrail_engine.validate_output(result, self.config.output_guards)
             
             # Update state
             self.state = self.state.set("last_result", result)
             
-            self.status = AgentStatus.COMPLETED
-            for hook in self._on_complete_hooks:
-                await hook(self)
+            if not _skip_lifecycle:
+                await self._complete()
             
             return result
             
         except Exception as e:
-            self.status = AgentStatus.FAILED
-            for hook in self._on_error_hooks:
-                await hook(self, e)
+            if not _skip_lifecycle:
+                self.status = AgentStatus.FAILED
+            await self._run_hooks(self._on_error_hooks, self, e)
             raise
     
+    async def execute_batch(
+        self,
+        tasks: List[str],
+        contexts: Optional[List[Optional[Dict[str, Any]]]] = None,
+        max_concurrency: int = 16
+    ) -> List[Any]:
+        """
+        Execute many tasks concurrently.
+        
+        Up to `max_concurrency` LLM calls are in flight at once. The agent
+        goes through start/complete once for the whole batch, so concurrent
+        executions don't overwrite each other's status.
+        
+        Args:
+            tasks: Task descriptions
+            contexts: Optional context per task (same length as tasks)
+            max_concurrency: Maximum concurrent executions
+            
+        Returns:
+            Result per task, in order; failed tasks hold their exception
+        """
+        if contexts is not None and len(contexts) != len(tasks):
+            raise ValueError("contexts must have the same length as tasks")
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run_one(i: int) -> Any:
+            async with semaphore:
+                return await self.execute(
+                    tasks[i],
+                    contexts[i] if contexts else None,
+                    _skip_lifecycle=True
+                )
+        
+        await self.start()
+        results = await asyncio.gather(
+            *(run_one(i) for i in range(len(tasks))),
+            return_exceptions=True
+        )
+        
+        if any(isinstance(result, Exception) for result in results):
+            self.status = AgentStatus.FAILED
+        else:
+            await self._complete()
+        
+        return results
+    
+    async def _complete(self) -> None:
+        """Mark the agent completed and run completion hooks."""
+        self.status = AgentStatus.COMPLETED
+        await self._run_hooks(self._on_complete_hooks, self)
+    
+    @staticmethod
+    async def _run_hooks(hooks: List[Callable[..., Awaitable[None]]], *args: Any) -> None:
+        """
+        Run independent lifecycle hooks concurrently.
+        
+        A single hook is awaited directly, so its exception propagates
+        unchanged; with several, failures surface as an ExceptionGroup.
+        """
+        if not hooks:
+            return
+        if len(hooks) == 1:
+            await hooks[0](*args)
+            return
+        
+        async with asyncio.TaskGroup() as tg:
+            for hook in hooks:
+                tg.create_task(hook(*args))
+    
     async def receive_message(self, message: Dict[str, Any]) -> None:
         """Receive a message from another agent or external source."""
-        for hook in self._on_message_hooks:
-            await hook(self, message)
+        await self._run_hooks(self._on_message_hooks, self, message)
     
     async def send_message(self, recipient: str, message: Dict[str, Any]) -> None:
         """Send a message to another agent."""
@@ -214,8 +335,8 @@ class Agent:
                 message=message
             )
     
-    def _build_prompt(self, task: str, context: Dict[str, Any]) -> str:
-        """Build the prompt for the LLM."""
+    def _compute_system_prompt(self) -> str:
+        """Build the system part of the prompt (everything but task and context)."""
         system_prompt = f"""You are {self.config.name}, a {self.config.role}.
 
 Goal: {self.config.goal}
@@ -228,11 +349,16 @@ Goal: {self.config.goal}
             for tool in self.tools:
                 system_prompt += f"- {tool.name}: {tool.description}\n"
         
-        user_prompt = f"Task: {task}"
+        return system_prompt
+    
+    def _build_prompt(self, task: str, context: Dict[str, Any]) -> str:
+        """Build the prompt for the LLM."""
+        prompt = f"{self._system_prompt_cached}\n\nTask: {task}"
         if context:
-            user_prompt += f"\n\nContext:\n{context}"
-        
-        return f"{system_prompt}\n\n{user_prompt}"
+            # Compact and deterministic, unlike str(dict)
+            context_json = orjson.dumps(context, default=str, option=orjson.OPT_NON_STR_KEYS)
+            prompt += f"\n\nContext:\n{context_json.decode()}"
+        return prompt
     
     async def _execute_with_llm(self, prompt: str) -> str:
         """Execute the prompt with the LLM."""
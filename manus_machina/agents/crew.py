@@ -3,9 +3,10 @@
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 from enum import Enum
+import asyncio
 
-from manus_machina.core.agent import Agent
-from manus_machina.core.task import Task
+from manus_machina.agents.agent import Agent
+from manus_machina.agents.task import Task
 
 
 class ProcessType(str, Enum):
@@ -24,6 +25,9 @@ class CrewConfig(BaseModel):
     verbose: bool = Field(default=False)
     memory: bool = Field(default=False)
     cache: bool = Field(default=True)
+    
+    class Config:
+        frozen = True
 
 
 class Crew:
@@ -33,15 +37,37 @@ class Crew:
     Similar to CrewAI's Crew concept.
     """
     
+    __slots__ = ("config", "agents", "tasks", "_agent_by_name")
+    
     def __init__(self, config: CrewConfig, agents: Optional[List[Agent]] = None):
         self.config = config
         self.agents = agents or []
         self.tasks: List[Task] = []
+        self._agent_by_name: Dict[str, Agent] = {}
+        for agent in self.agents:
+            self._index_agent(agent)
     
     def add_agent(self, agent: Agent) -> None:
         """Add an agent to the crew."""
+        self._index_agent(agent)
         self.agents.append(agent)
     
+    def _index_agent(self, agent: Agent) -> None:
+        """Register an agent for lookup by name."""
+        if agent.config.name in self._agent_by_name:
+            raise ValueError(f"Duplicate agent name in crew: {agent.config.name}")
+        self._agent_by_name[agent.config.name] = agent
+    
+    def set_shared_llm_client(self, client: Any) -> None:
+        """
+        Give every agent in the crew the same LLM client.
+        
+        Sharing one client (e.g. HTTPXLLMClient) shares its connection
+        pool, so agents don't each open their own connections.
+        """
+        for agent in self.agents:
+            agent.set_llm_client(client)
+    
     def add_task(self, task: Task) -> None:
         """Add a task to the crew."""
         self.tasks.append(task)
@@ -64,49 +90,125 @@ class Crew:
             raise NotImplementedError(f"Process type {self.config.process} not implemented")
     
     async def _execute_sequential(self, inputs: Dict[str, Any]) -> Any:
-        """Execute tasks sequentially."""
+        """
+        Execute tasks in dependency order.
+        
+        Tasks are grouped into levels by their `depends_on` declarations and
+        each level runs concurrently. By default a task depends on every task
+        before it, which keeps the original one-at-a-time behavior; tasks that
+        declare fewer dependencies overlap with their siblings.
+        
+        Each result is stored in the context under its task name, and
+        `previous_result` holds the result of the last task of the previous
+        level.
+        
+        Raises:
+            ValueError: If task names are duplicated, reserved, or collide
+                with an input key, or if the dependencies are invalid
+        """
+        levels = self._task_levels()
+        for i in range(len(self.tasks)):
+            if self._task_name(i) in inputs:
+                raise ValueError(f"Task name {self._task_name(i)} collides with an input key")
+        
         context = inputs.copy()
-        results = []
+        results: Dict[int, Any] = {}
         
-        for task in self.tasks:
-            # Find agent for task
-            agent = self._find_agent(task.config.agent)
-            if not agent:
-                raise ValueError(f"Agent {task.config.agent} not found in crew")
+        for level in levels:
+            runs = []
+            for index in level:
+                task = self.tasks[index]
+                agent = self._find_agent(task.config.agent)
+                if not agent:
+                    raise ValueError(f"Agent {task.config.agent} not found in crew")
+                runs.append(agent.execute(task.config.description, context.copy()))
             
-            # Execute task
-            result = await agent.execute(task.config.description, context)
-            results.append(result)
+            level_results = await asyncio.gather(*runs)
             
-            # Update context for next task
-            context["previous_result"] = result
+            # Update context for the next level
+            for index, result in zip(level, level_results):
+                results[index] = result
+                context[self._task_name(index)] = result
+            context["previous_result"] = level_results[-1]
+        
+        return results[len(self.tasks) - 1] if results else None
+    
+    def _task_name(self, index: int) -> str:
+        """Name a task is referenced by in `depends_on` and in the context."""
+        return self.tasks[index].config.name or f"task_{index}"
+    
+    def _task_levels(self) -> List[List[int]]:
+        """Group task indices into dependency levels (Kahn's algorithm)."""
+        # depends_on and the context refer to tasks by name, so names must be unique
+        index_by_name: Dict[str, int] = {}
+        for i in range(len(self.tasks)):
+            name = self._task_name(i)
+            if name == "previous_result":
+                raise ValueError("Task name previous_result is reserved")
+            if name in index_by_name:
+                raise ValueError(f"Duplicate task name in crew: {name}")
+            index_by_name[name] = i
         
-        return results[-1] if results else None
+        dependents: Dict[int, List[int]] = {i: [] for i in range(len(self.tasks))}
+        pending: Dict[int, int] = {}
+        for i, task in enumerate(self.tasks):
+            if task.config.depends_on is None:
+                deps = list(range(i))
+            else:
+                deps = []
+                for name in task.config.depends_on:
+                    if name not in index_by_name:
+                        raise ValueError(f"Task {self._task_name(i)} depends on unknown task {name}")
+                    deps.append(index_by_name[name])
+            pending[i] = len(deps)
+            for dep in deps:
+                dependents[dep].append(i)
+        
+        levels = []
+        ready = [i for i, count in pending.items() if count == 0]
+        while ready:
+            levels.append(ready)
+            next_ready = []
+            for i in ready:
+                for dependent in dependents[i]:
+                    pending[dependent] -= 1
+                    if pending[dependent] == 0:
+                        next_ready.append(dependent)
+            ready = sorted(next_ready)
+        
+        if sum(len(level) for level in levels) != len(self.tasks):
+            raise ValueError("Task dependencies contain a cycle")
+        
+        return levels
     
     async def _execute_parallel(self, inputs: Dict[str, Any]) -> List[Any]:
-        """Execute tasks in parallel."""
-        import asyncio
+        """
+        Execute tasks in parallel.
         
-        tasks_coroutines = []
+        The first failing task cancels the rest (asyncio.TaskGroup).
+        """
+        assignments = []
         for task in self.tasks:
             agent = self._find_agent(task.config.agent)
             if not agent:
                 raise ValueError(f"Agent {task.config.agent} not found in crew")
             
-            tasks_coroutines.append(agent.execute(task.config.description, inputs))
+            assignments.append((agent, task))
+        
+        async with asyncio.TaskGroup() as tg:
+            running = [
+                tg.create_task(agent.execute(task.config.description, inputs))
+                for agent, task in assignments
+            ]
         
-        results = await asyncio.gather(*tasks_coroutines)
-        return results
+        return [task.result() for task in running]
     
     def _find_agent(self, agent_name: Optional[str]) -> Optional[Agent]:
         """Find agent by name."""
         if not agent_name:
             return self.agents[0] if self.agents else None
         
-        for agent in self.agents:
-            if agent.config.name == agent_name:
-                return agent
-        return None
+        return self._agent_by_name.get(agent_name)
     
     def __repr__(self) -> str:
         return f"Crew(name={self.config.name}, agents={len(self.agents)}, tasks={len(self.tasks)})"
@@ -1,30 +1,62 @@
 """LLM integration for agents."""
 
 import os
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 import google.generativeai as genai
 
+from manus_machina.agents.simple_agent import configure_genai
+from manus_machina.llm.cache import LLMCache, SemanticCache
+from manus_machina.observability.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+@lru_cache(maxsize=32)
+def _generation_config(temperature: float, max_tokens: int) -> Any:
+    """Shared GenerationConfig per (temperature, max_tokens) pair."""
+    return genai.types.GenerationConfig(
+        temperature=temperature,
+        max_output_tokens=max_tokens
+    )
+
 
 class LLMClient:
     """Client for interacting with LLMs."""
     
-    def __init__(self, model: str = "gemini-2.0-flash-exp", api_key: Optional[str] = None):
+    def __init__(
+        self,
+        model: str = "gemini-2.0-flash-exp",
+        api_key: Optional[str] = None,
+        cache: Optional[LLMCache] = None,
+        semantic_cache: Optional[SemanticCache] = None
+    ):
         """
         Initialize LLM client.
         
         Args:
             model: Model name
             api_key: API key (defaults to GOOGLE_API_KEY env var)
+            cache: Response cache for deterministic (temperature=0) calls
+            semantic_cache: Cache matching paraphrases of earlier prompts,
+                also used only for temperature=0 calls
         """
         self.model_name = model
         self.api_key = api_key or os.getenv("GOOGLE_API_KEY")
+        self.cache = cache
+        self.semantic_cache = semantic_cache
         
         if not self.api_key:
             raise ValueError("GOOGLE_API_KEY not found in environment")
         
-        # Configure Gemini
-        genai.configure(api_key=self.api_key)
+        # Configure Gemini (shared client, reused across instances)
+        configure_genai(self.api_key)
         self.model = genai.GenerativeModel(model)
+        
+        # One model per system instruction, so the instruction is sent
+        # through its dedicated channel as a stable, cacheable prefix
+        self._models: Dict[str, Any] = {}
     
     async def generate(
         self,
@@ -45,36 +77,59 @@ class LLMClient:
         Returns:
             Response dict with text and metadata
         """
+        # Deterministic calls are served from the caches when possible;
+        # sampled calls are expected to vary
+        deterministic = temperature == 0.0
+        cache_key = None
+        if self.cache is not None and deterministic:
+            cache_key = LLMCache.make_key(
+                self.model_name, system_instruction, prompt, temperature, max_tokens
+            )
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        use_semantic = self.semantic_cache is not None and deterministic
+        namespace = f"{self.model_name}:{system_instruction}:{temperature}:{max_tokens}"
+        
         try:
-            # Build full prompt
-            if system_instruction:
-                full_prompt = f"{system_instruction}\n\nUser: {prompt}\n\nAssistant:"
-            else:
-                full_prompt = prompt
+            # Paraphrases of an earlier prompt reuse its response
+            if use_semantic:
+                cached = await self._semantic_lookup(prompt, namespace)
+                if cached is not None:
+                    return cached
             
             # Generate response
-            response = self.model.generate_content(
-                full_prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=temperature,
-                    max_output_tokens=max_tokens
-                )
+            model = self._model_for(system_instruction)
+            response = await model.generate_content_async(
+                prompt,
+                generation_config=_generation_config(temperature, max_tokens)
             )
             
             # Extract text
             text = response.text if hasattr(response, 'text') else str(response)
+            prompt_tokens = len(prompt.split())
+            if system_instruction:
+                prompt_tokens += len(system_instruction.split())
             
-            return {
+            result = {
                 "text": text,
                 "model": self.model_name,
                 "finish_reason": "stop",
                 "usage": {
-                    "prompt_tokens": len(full_prompt.split()),
+                    "prompt_tokens": prompt_tokens,
                     "completion_tokens": len(text.split()),
-                    "total_tokens": len(full_prompt.split()) + len(text.split())
+                    "total_tokens": prompt_tokens + len(text.split())
                 }
             }
             
+            if cache_key is not None:
+                await self.cache.set(cache_key, result)
+            if use_semantic:
+                await self._semantic_store(prompt, result, namespace)
+            
+            return result
+            
         except Exception as e:
             return {
                 "text": f"Error: {str(e)}",
@@ -82,4 +137,32 @@ class LLMClient:
                 "finish_reason": "error",
                 "error": str(e)
             }
-
+    
+    async def _semantic_lookup(self, prompt: str, namespace: str) -> Optional[Dict[str, Any]]:
+        """Semantic cache lookup; a failing embedding or cache counts as a miss."""
+        try:
+            return await self.semantic_cache.get(prompt, namespace)
+        except Exception as e:
+            logger.warning("semantic_cache_lookup_failed", model=self.model_name, exc_info=e)
+            return None
+    
+    async def _semantic_store(self, prompt: str, result: Dict[str, Any], namespace: str) -> None:
+        """Semantic cache store; a failure only loses the cache entry."""
+        try:
+            await self.semantic_cache.set(prompt, result, namespace)
+        except Exception as e:
+            logger.warning("semantic_cache_store_failed", model=self.model_name, exc_info=e)
+    
+    def _model_for(self, system_instruction: Optional[str]) -> Any:
+        """Get the model configured with a system instruction."""
+        if not system_instruction:
+            return self.model
+        
+        model = self._models.get(system_instruction)
+        if model is None:
+            model = genai.GenerativeModel(
+                self.model_name,
+                system_instruction=system_instruction
+            )
+            self._models[system_instruction] = model
+        return model
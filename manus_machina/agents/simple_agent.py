@@ -1,9 +1,83 @@
 """Simplified functional agent implementation."""
 
+import asyncio
 import os
-from typing import Any, Dict, List, Optional
+import weakref
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 from pydantic import BaseModel, Field
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
+
+from manus_machina.governance.safety import RateLimiter
+from manus_machina.llm.cache import LLMCache, SemanticCache
+from manus_machina.resilience.retry import RetryConfig, RetryPolicy
+
+
+# API key the shared Gemini client is currently configured with.
+# genai.configure() rebuilds the SDK's global client (and its connections),
+# so it is only called again when the key actually changes.
+_configured_api_key: Optional[str] = None
+
+
+def configure_genai(api_key: str) -> None:
+    """Configure the shared Gemini client once per API key."""
+    global _configured_api_key
+    if api_key != _configured_api_key:
+        genai.configure(api_key=api_key)
+        _configured_api_key = api_key
+
+
+def gemini_embed(text: str, model: str = "models/text-embedding-004") -> List[float]:
+    """Embed text with Gemini (blocking; embed_fn for SemanticCache)."""
+    return genai.embed_content(model=model, content=text)["embedding"]
+
+
+# Shared by every SimpleAgent so concurrent crews stay within provider limits.
+# MM_MAX_CONCURRENCY bounds in-flight Gemini calls, MM_RPM bounds requests per minute.
+_MAX_CONCURRENCY = int(os.getenv("MM_MAX_CONCURRENCY", "8"))
+# A semaphore binds to the loop it is first contended on, so there is one per loop
+_api_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_rate_limiter = RateLimiter(requests_per_minute=int(os.getenv("MM_RPM", "60")))
+_RATE_LIMIT_POLL_SECONDS = 0.5
+
+# Back off and retry when the provider answers 429 anyway
+# (TooManyRequests also covers Gemini's ResourceExhausted)
+_rate_limit_retry = RetryPolicy(
+    "gemini_rate_limit",
+    RetryConfig(max_attempts=5, retry_on_exceptions=(google_exceptions.TooManyRequests,))
+)
+
+
+def _api_semaphore() -> asyncio.Semaphore:
+    """The shared concurrency limit for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _api_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _api_semaphores[loop] = asyncio.Semaphore(_MAX_CONCURRENCY)
+    return semaphore
+
+
+async def _throttled(call: Callable[[], Any]) -> Any:
+    """Run a Gemini call under the shared concurrency and rate limits."""
+    async def attempt() -> Any:
+        # Every attempt, retries included, is admitted by both limits; a
+        # call backing off after a 429 holds no concurrency slot
+        async with _api_semaphore():
+            while not _rate_limiter.check_request():
+                await asyncio.sleep(_RATE_LIMIT_POLL_SECONDS)
+            return await call()
+    
+    return await _rate_limit_retry.execute(attempt)
+
+
+class StreamError(str):
+    """
+    Final chunk of a failed execute_stream: the "Error: ..." text.
+    
+    A str, so the stream can still be printed or joined as is; callers
+    tell a failure apart with isinstance instead of matching the text.
+    """
 
 
 class SimpleAgentConfig(BaseModel):
@@ -24,24 +98,52 @@ class SimpleAgent:
     This is a working implementation that uses Google Gemini API.
     """
     
-    def __init__(self, config: SimpleAgentConfig, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        config: SimpleAgentConfig,
+        api_key: Optional[str] = None,
+        cache: Optional[LLMCache] = None,
+        semantic_cache: Optional[SemanticCache] = None
+    ):
         """
         Initialize agent.
         
         Args:
             config: Agent configuration
             api_key: Google API key (defaults to GOOGLE_API_KEY env var)
+            cache: Response cache, used when config.temperature is 0
+            semantic_cache: Cache matching paraphrases of earlier tasks, also
+                used only when config.temperature is 0
         """
         self.config = config
         self.memory: List[Dict[str, Any]] = []
+        self.cache = cache
+        self.semantic_cache = semantic_cache
+        
+        # Depends only on the config, so build it once
+        self._system_instruction = self._build_system_instruction()
         
         # Setup Gemini
         api_key = api_key or os.getenv("GOOGLE_API_KEY")
         if not api_key:
             raise ValueError("GOOGLE_API_KEY not found")
         
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(config.model)
+        configure_genai(api_key)
+        self._gen_config = genai.types.GenerationConfig(
+            temperature=config.temperature,
+            max_output_tokens=config.max_tokens
+        )
+        
+        # The system instruction travels in its own channel, so every call
+        # starts with the same byte-identical prefix for provider caching
+        self.model = genai.GenerativeModel(
+            config.model,
+            system_instruction=self._system_instruction
+        )
+    
+    async def warmup(self) -> None:
+        """Fetch model metadata so the first task does not pay connection setup."""
+        await asyncio.to_thread(genai.get_model, f"models/{self.config.model}")
     
     async def execute(self, task: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -54,26 +156,10 @@ class SimpleAgent:
         Returns:
             Result dictionary
         """
-        # Build system instruction
-        system_instruction = self._build_system_instruction()
-        
-        # Build full prompt
-        full_prompt = f"{system_instruction}\n\nTask: {task}"
-        if context:
-            full_prompt += f"\n\nContext: {context}"
+        full_prompt = self._build_prompt(task, context)
         
         try:
-            # Generate response
-            response = self.model.generate_content(
-                full_prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=self.config.temperature,
-                    max_output_tokens=self.config.max_tokens
-                )
-            )
-            
-            # Extract text
-            result_text = response.text if hasattr(response, 'text') else str(response)
+            result_text = await self._generate(full_prompt)
             
             # Store in memory
             self.memory.append({
@@ -100,6 +186,131 @@ class SimpleAgent:
                 "error": str(e)
             }
     
+    async def _generate(self, full_prompt: str) -> str:
+        """Generate response text, serving cache hits without calling Gemini."""
+        cached, cache_key = await self._cache_lookup(full_prompt)
+        if cached is not None:
+            return cached
+        
+        # Native async call: the sync generate_content would block the loop
+        # for the whole round trip and serialize concurrent agents
+        response = await _throttled(partial(
+            self.model.generate_content_async,
+            full_prompt,
+            generation_config=self._gen_config
+        ))
+        
+        # Extract text
+        result_text = response.text if hasattr(response, 'text') else str(response)
+        
+        await self._cache_store(full_prompt, cache_key, result_text)
+        return result_text
+    
+    async def _cache_lookup(self, full_prompt: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Look a prompt up in the exact and semantic caches.
+        
+        Returns:
+            The cached response (None on a miss) and the exact-cache key
+            to store a fresh response under (None when not cached)
+        """
+        # Sampled calls (temperature > 0) are expected to vary, so neither
+        # cache serves them
+        if self.config.temperature != 0.0:
+            return None, None
+        
+        cache_key = None
+        if self.cache is not None:
+            cache_key = LLMCache.make_key(
+                self.config.model, self._system_instruction, full_prompt,
+                self.config.temperature, self.config.max_tokens
+            )
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                return cached, cache_key
+        
+        # Paraphrases of an earlier task reuse its response
+        if self.semantic_cache is not None:
+            cached = await self.semantic_cache.get(full_prompt, self._semantic_namespace())
+            if cached is not None:
+                return cached, cache_key
+        
+        return None, cache_key
+    
+    async def _cache_store(self, full_prompt: str, cache_key: Optional[str], result_text: str) -> None:
+        """Store a fresh response in the caches _cache_lookup missed in."""
+        if self.config.temperature != 0.0:
+            return
+        
+        if cache_key is not None:
+            await self.cache.set(cache_key, result_text)
+        if self.semantic_cache is not None:
+            await self.semantic_cache.set(full_prompt, result_text, self._semantic_namespace())
+    
+    def _semantic_namespace(self) -> str:
+        """Call parameters a semantically cached response depends on."""
+        return f"{self.config.model}:{self._system_instruction}:{self.config.temperature}:{self.config.max_tokens}"
+    
+    async def execute_stream(
+        self,
+        task: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Execute a task, yielding response text as it is generated.
+        
+        Args:
+            task: Task description
+            context: Optional context
+            
+        Yields:
+            Response text chunks; on failure, a final StreamError chunk
+        """
+        full_prompt = self._build_prompt(task, context)
+        chunks: List[str] = []
+        
+        try:
+            cached, cache_key = await self._cache_lookup(full_prompt)
+            if cached is not None:
+                # A cache hit arrives as a single chunk
+                chunks.append(cached)
+                yield cached
+            else:
+                # Limits apply to opening the stream, not to reading it
+                response = await _throttled(partial(
+                    self.model.generate_content_async,
+                    full_prompt,
+                    generation_config=self._gen_config,
+                    stream=True
+                ))
+                
+                async for chunk in response:
+                    text = chunk.text
+                    chunks.append(text)
+                    yield text
+                
+                # Only a complete response is cached
+                await self._cache_store(full_prompt, cache_key, "".join(chunks))
+            
+        except Exception as e:
+            yield StreamError(f"Error: {str(e)}")
+            return
+        
+        # Store in memory
+        self.memory.append({
+            "task": task,
+            "response": "".join(chunks),
+            "context": context
+        })
+    
+    def _build_prompt(self, task: str, context: Optional[Dict[str, Any]]) -> str:
+        """Build the user content for a task (the system instruction is sent separately)."""
+        # Dynamic content only: context goes before the task so calls sharing
+        # the same leading context sections also extend the cached prefix.
+        if not context:
+            return f"Task: {task}"
+        return f"Context:\n{self._format_context(context)}\n\nTask: {task}"
+    
     def _build_system_instruction(self) -> str:
         """Build system instruction."""
         instruction = f"""You are {self.config.name}, a {self.config.role}.
@@ -113,6 +324,11 @@ Your goal: {self.config.goal}"""
         
         return instruction
     
+    @staticmethod
+    def _format_context(context: Dict[str, Any]) -> str:
+        """Render context as labelled sections, in the dict's own order."""
+        return "\n\n".join(f"[{key.upper()}]\n{value}" for key, value in context.items())
+    
     def get_memory(self) -> List[Dict[str, Any]]:
         """Get agent memory."""
         return self.memory
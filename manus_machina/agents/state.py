@@ -1,8 +1,33 @@
 """State management for agents and workflows."""
 
-from typing import Any, Dict, Optional
-from pydantic import BaseModel, Field
-from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from collections import OrderedDict
+from pydantic import BaseModel, Field, computed_field, field_serializer, field_validator, model_validator
+from datetime import datetime, timedelta, timezone
+import time
+
+try:
+    # HAMT (the structure behind contextvars): O(log n) updates that share
+    # structure with the previous version instead of copying the whole dict
+    from immutables import Map
+    IMMUTABLES_AVAILABLE = True
+except ImportError:
+    IMMUTABLES_AVAILABLE = False
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _to_ns(timestamp: datetime) -> int:
+    """UTC datetime (naive, or aware in any zone) to integer nanoseconds since the epoch."""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return (timestamp - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def _empty_data() -> Mapping[str, Any]:
+    """Empty state data (a persistent map when available)."""
+    return Map() if IMMUTABLES_AVAILABLE else {}
 
 
 class State(BaseModel):
@@ -10,63 +35,131 @@ class State(BaseModel):
     Represents the state of an agent or workflow.
     
     State is immutable by default and creates new instances on updates.
+    Updates build the new instance with model_construct: the data was
+    validated when it entered the state, so only external entry points
+    (the constructor, from_dict) pay for validation. The update time is
+    kept as integer nanoseconds and only turned into a datetime on access.
+    
+    With the optional `immutables` package installed, `data` is an
+    immutables.Map, so each update is O(log n) and shares structure with
+    the previous version; otherwise it falls back to copying a dict.
+    Either way `data` is a read-only Mapping, and dumps as a plain dict.
+    
+    Key order is only guaranteed by the dict fallback. A Map iterates in
+    hash order, not insertion order, so iterating or dumping `data` may
+    list keys in a different order than they were set (merging {a, b}
+    with {c} can dump as c, a, b). Don't rely on the order of `data`.
     """
     
-    data: Dict[str, Any] = Field(default_factory=dict, description="State data")
+    data: Mapping[str, Any] = Field(default_factory=_empty_data, description="State data (read-only mapping)")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="State metadata")
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_ns: int = Field(
+        default_factory=time.time_ns,
+        exclude=True,  # dumped as updated_at
+        description="Last update time (ns since epoch)"
+    )
     version: int = Field(default=1, description="State version for optimistic locking")
     
     class Config:
         frozen = False  # Allow mutation for performance
     
+    @field_validator("data", mode="after")
+    @classmethod
+    def _to_persistent(cls, value: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Store validated data (a dict) as a persistent map when available."""
+        if IMMUTABLES_AVAILABLE:
+            return Map(value)
+        return value
+    
+    @field_serializer("data")
+    def _serialize_data(self, data: Mapping[str, Any]) -> Dict[str, Any]:
+        """Dump data as a plain dict, whatever mapping holds it."""
+        return dict(data)
+    
+    @model_validator(mode="before")
+    @classmethod
+    def _updated_at_to_ns(cls, data: Any) -> Any:
+        """Store an updated_at argument (datetime or ISO string) as updated_ns."""
+        if isinstance(data, dict) and "updated_at" in data:
+            data = dict(data)
+            updated_at = data.pop("updated_at")
+            if isinstance(updated_at, str):
+                updated_at = datetime.fromisoformat(updated_at)
+            data.setdefault("updated_ns", _to_ns(updated_at))
+        return data
+    
+    @computed_field
+    @property
+    def updated_at(self) -> datetime:
+        """Last update time (naive UTC, like created_at)."""
+        return _EPOCH + timedelta(microseconds=self.updated_ns // 1000)
+    
+    @updated_at.setter
+    def updated_at(self, value: datetime) -> None:
+        self.updated_ns = _to_ns(value)
+    
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False) -> "State":
+        """Copy the state, accepting updated_at in `update` like the constructor does."""
+        if update and "updated_at" in update:
+            update = self._updated_at_to_ns(dict(update))
+        return super().model_copy(update=update, deep=deep)
+    
     def get(self, key: str, default: Any = None) -> Any:
         """Get a value from state."""
         return self.data.get(key, default)
     
     def set(self, key: str, value: Any) -> "State":
         """Set a value in state (creates new state instance)."""
-        new_data = self.data.copy()
-        new_data[key] = value
-        return State(
+        if IMMUTABLES_AVAILABLE:
+            new_data = self.data.set(key, value)
+        else:
+            new_data = self.data.copy()
+            new_data[key] = value
+        return State.model_construct(
             data=new_data,
             metadata=self.metadata.copy(),
             created_at=self.created_at,
-            updated_at=datetime.utcnow(),
+            updated_ns=time.time_ns(),
             version=self.version + 1
         )
     
     def update(self, updates: Dict[str, Any]) -> "State":
         """Update multiple values in state."""
-        new_data = self.data.copy()
-        new_data.update(updates)
-        return State(
+        if IMMUTABLES_AVAILABLE:
+            new_data = self.data.update(updates)
+        else:
+            new_data = self.data.copy()
+            new_data.update(updates)
+        return State.model_construct(
             data=new_data,
             metadata=self.metadata.copy(),
             created_at=self.created_at,
-            updated_at=datetime.utcnow(),
+            updated_ns=time.time_ns(),
             version=self.version + 1
         )
     
     def merge(self, other: "State") -> "State":
         """Merge with another state."""
-        merged_data = self.data.copy()
-        merged_data.update(other.data)
+        if IMMUTABLES_AVAILABLE:
+            merged_data = self.data.update(other.data)
+        else:
+            merged_data = self.data.copy()
+            merged_data.update(other.data)
         merged_metadata = self.metadata.copy()
         merged_metadata.update(other.metadata)
-        return State(
+        return State.model_construct(
             data=merged_data,
             metadata=merged_metadata,
             created_at=self.created_at,
-            updated_at=datetime.utcnow(),
+            updated_ns=time.time_ns(),
             version=self.version + 1
         )
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert state to dictionary."""
         return {
-            "data": self.data,
+            "data": dict(self.data),
             "metadata": self.metadata,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
@@ -101,28 +194,85 @@ class StateStore:
     async def exists(self, key: str) -> bool:
         """Check if state exists."""
         raise NotImplementedError
+    
+    async def save_many(self, items: Dict[str, State]) -> None:
+        """Save several states (stores may override with a bulk write)."""
+        for key, state in items.items():
+            await self.save(key, state)
+    
+    async def load_many(self, keys: List[str]) -> Dict[str, Optional[State]]:
+        """Load several states (stores may override with a bulk read)."""
+        return {key: await self.load(key) for key in keys}
 
 
 class InMemoryStateStore(StateStore):
-    """In-memory state store for development and testing."""
+    """
+    In-memory state store for development and testing.
+    
+    Bounded: least recently used entries are evicted past `max_size`,
+    and entries older than `ttl` seconds expire.
+    """
     
-    def __init__(self) -> None:
-        self._store: Dict[str, State] = {}
+    def __init__(self, max_size: int = 10_000, ttl: Optional[float] = 3600.0) -> None:
+        """
+        Initialize store.
+        
+        Args:
+            max_size: Maximum number of stored states
+            ttl: Seconds a state is kept after it was saved (None = forever)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._store: "OrderedDict[str, Tuple[State, Optional[float]]]" = OrderedDict()
     
     async def save(self, key: str, state: State) -> None:
         """Save state to memory."""
-        self._store[key] = state
+        self._put(key, state)
+        self._evict()
     
     async def load(self, key: str) -> Optional[State]:
         """Load state from memory."""
-        return self._store.get(key)
+        return self._get(key)
     
     async def delete(self, key: str) -> None:
         """Delete state from memory."""
-        if key in self._store:
-            del self._store[key]
+        self._store.pop(key, None)
     
     async def exists(self, key: str) -> bool:
         """Check if state exists in memory."""
-        return key in self._store
-
+        return self._get(key) is not None
+    
+    async def save_many(self, items: Dict[str, State]) -> None:
+        """Save several states in one call."""
+        for key, state in items.items():
+            self._put(key, state)
+        self._evict()
+    
+    async def load_many(self, keys: List[str]) -> Dict[str, Optional[State]]:
+        """Load several states in one call."""
+        return {key: self._get(key) for key in keys}
+    
+    def _put(self, key: str, state: State) -> None:
+        """Store an entry as most recently used."""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._store[key] = (state, expires_at)
+        self._store.move_to_end(key)
+    
+    def _get(self, key: str) -> Optional[State]:
+        """Get a live entry, marking it most recently used."""
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        
+        state, expires_at = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._store[key]
+            return None
+        
+        self._store.move_to_end(key)
+        return state
+    
+    def _evict(self) -> None:
+        """Drop least recently used entries beyond max_size."""
+        while len(self._store) > self.max_size:
+            self._store.popitem(last=False)
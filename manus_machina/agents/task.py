@@ -1,6 +1,6 @@
 """Task implementation for agents."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 from enum import Enum
 
@@ -17,10 +17,15 @@ class TaskConfig(BaseModel):
     """Configuration for a task."""
     
     description: str = Field(..., description="Task description")
+    name: Optional[str] = Field(None, description="Task name, used as its key in crew context")
     expected_output: Optional[str] = Field(None, description="Expected output format")
     agent: Optional[str] = Field(None, description="Agent assigned to task")
     context: Dict[str, Any] = Field(default_factory=dict, description="Task context")
     output_file: Optional[str] = Field(None, description="File to save output")
+    depends_on: Optional[List[str]] = Field(
+        None,
+        description="Names of tasks whose results this task needs (None = all prior tasks, [] = independent)"
+    )
 
 
 class Task:
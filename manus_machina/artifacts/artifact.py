@@ -187,7 +187,17 @@ class Artifact(BaseModel):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Artifact":
         """Create artifact from dictionary"""
-        return cls(
+        return cls(**cls._parse_dict(data))
+    
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]) -> "Artifact":
+        """Create artifact from a dictionary produced by to_dict, skipping validation"""
+        return cls.model_construct(**cls._parse_dict(data))
+    
+    @staticmethod
+    def _parse_dict(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Field values parsed from their to_dict form"""
+        return dict(
             id=UUID(data["id"]),
             type=ArtifactType(data["type"]),
             title=data["title"],
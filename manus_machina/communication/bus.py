@@ -1,10 +1,21 @@
 """Communication bus for agent-to-agent communication."""
 
-from typing import Any, Dict, List, Optional, Callable, Awaitable
+from typing import Any, Deque, Dict, List, Optional, Callable, Awaitable
 from pydantic import BaseModel, Field
+from collections import deque
+from contextvars import ContextVar
 from enum import Enum
 import asyncio
 
+from manus_machina.observability.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# Bus whose delivery round the current task belongs to (handlers and the
+# tasks they spawn inherit it)
+_delivering: ContextVar[Optional["CommunicationBus"]] = ContextVar("_delivering", default=None)
+
 
 class MessageProtocol(str, Enum):
     """Supported communication protocols."""
@@ -23,6 +34,9 @@ class Message(BaseModel):
     content: Dict[str, Any] = Field(..., description="Message content")
     protocol: MessageProtocol = Field(default=MessageProtocol.A2A)
     metadata: Dict[str, Any] = Field(default_factory=dict)
+    
+    class Config:
+        frozen = True
 
 
 class CommunicationBus:
@@ -32,10 +46,22 @@ class CommunicationBus:
     Supports multiple protocols and routing strategies.
     """
     
-    def __init__(self):
+    def __init__(self, max_queue_size: int = 10_000):
+        """
+        Initialize bus.
+        
+        Args:
+            max_queue_size: Maximum undelivered messages; senders wait for
+                room once it is reached, bounding memory under bursts.
+                Handlers are exempt: the processor is waiting on them, so
+                a handler blocked on a full queue would never get room.
+        """
         self.subscribers: Dict[str, List[Callable[[Message], Awaitable[None]]]] = {}
-        self.message_queue: asyncio.Queue = asyncio.Queue()
+        self.message_queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        # Sent by handlers while the queue was full, delivered after it
+        self._overflow: Deque[Message] = deque()
         self._running = False
+        self._task: Optional[asyncio.Task] = None
     
     def subscribe(
         self,
@@ -69,14 +95,15 @@ class CommunicationBus:
             message: Message content
             protocol: Communication protocol
         """
-        msg = Message(
+        # Arguments are already typed; skip validation on the hot path
+        msg = Message.model_construct(
             sender=sender,
             recipient=recipient,
             content=message,
             protocol=protocol
         )
         
-        await self.message_queue.put(msg)
+        await self._put(msg)
     
     async def broadcast(
         self,
@@ -92,36 +119,101 @@ class CommunicationBus:
             message: Message content
             protocol: Communication protocol
         """
-        for recipient in self.subscribers.keys():
+        # One template message, shallow-copied per recipient
+        base = Message.model_construct(
+            sender=sender,
+            recipient="",
+            content=message,
+            protocol=protocol
+        )
+        
+        # _put() waits while the queue is full (backpressure)
+        for recipient in list(self.subscribers):
             if recipient != sender:
-                await self.send(sender, recipient, message, protocol)
+                await self._put(base.model_copy(update={"recipient": recipient}))
+    
+    async def _put(self, msg: Message) -> None:
+        """Queue a message, waiting for room unless sent from a handler."""
+        if _delivering.get() is not self:
+            await self.message_queue.put(msg)
+        elif self._overflow or self.message_queue.full():
+            # Behind anything this handler already overflowed, to keep order.
+            # The queue is full, so the processor wakes up and drains both.
+            self._overflow.append(msg)
+        else:
+            self.message_queue.put_nowait(msg)
     
     async def start(self) -> None:
         """Start the communication bus."""
         self._running = True
-        asyncio.create_task(self._process_messages())
+        self._task = asyncio.create_task(self._process_messages())
     
     async def stop(self) -> None:
-        """Stop the communication bus."""
+        """
+        Stop the communication bus after delivering queued messages.
+        
+        Messages that handlers send while those are delivered are
+        delivered as well.
+        """
+        if not self._running:
+            return
+        
         self._running = False
+        # Sentinel wakes the processor immediately instead of a polling timeout
+        await self.message_queue.put(None)
+        if self._task is not None:
+            await self._task
+            self._task = None
     
     async def _process_messages(self) -> None:
         """Process messages from the queue."""
-        while self._running:
-            try:
-                message = await asyncio.wait_for(
-                    self.message_queue.get(),
-                    timeout=1.0
-                )
-                
-                # Deliver to subscribers
-                handlers = self.subscribers.get(message.recipient, [])
-                for handler in handlers:
-                    await handler(message)
-                
-            except asyncio.TimeoutError:
-                continue
+        _delivering.set(self)
+        stopping = False
+        while True:
+            # After stop(), keep going until the messages handlers sent
+            # during the last rounds are delivered too
+            if stopping and self.message_queue.empty():
+                return
+            
+            # Drain everything already queued into one delivery round
+            batch = [await self.message_queue.get()]
+            while not self.message_queue.empty():
+                batch.append(self.message_queue.get_nowait())
+            batch.extend(self._overflow)
+            self._overflow.clear()
+            
+            by_recipient: Dict[str, List[Message]] = {}
+            for message in batch:
+                if message is None:
+                    stopping = True
+                else:
+                    by_recipient.setdefault(message.recipient, []).append(message)
+            
+            # Recipients are independent; each one's messages go in order
+            await asyncio.gather(*(self._deliver(messages) for messages in by_recipient.values()))
+    
+    async def _deliver(self, messages: List[Message]) -> None:
+        """Deliver one recipient's messages in order, to all its handlers at once."""
+        for message in messages:
+            handlers = self.subscribers.get(message.recipient, [])
+            # One failing handler doesn't block the rest
+            results = await asyncio.gather(
+                *(handler(message) for handler in handlers),
+                return_exceptions=True
+            )
+            for handler, result in zip(handlers, results):
+                if isinstance(result, BaseException):
+                    logger.error(
+                        "message_handler_failed",
+                        sender=message.sender,
+                        recipient=message.recipient,
+                        handler=getattr(handler, "__qualname__", repr(handler)),
+                        exc_info=result
+                    )
     
     def __repr__(self) -> str:
-        return f"CommunicationBus(subscribers={len(self.subscribers)})"
+        return (
+            f"CommunicationBus(subscribers={len(self.subscribers)}, "
+            f"queued={self.message_queue.qsize()})"
+        )
 
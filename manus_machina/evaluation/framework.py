@@ -1,9 +1,13 @@
 """Evaluation framework for agents."""
 
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Awaitable, Dict, List, Optional, Callable
 from pydantic import BaseModel, Field
 from enum import Enum
-import json
+from functools import cached_property
+from pathlib import Path
+import asyncio
+
+from manus_machina.llm.batch import LLMBatchProcessor
 
 
 class EvaluationCriteria(str, Enum):
@@ -29,6 +33,21 @@ class Turn(BaseModel):
         description="Expected intermediate agent responses"
     )
     expected_final_response: str = Field(..., description="Expected final response")
+    
+    class Config:
+        frozen = True
+    
+    @cached_property
+    def expected_tokens(self) -> frozenset:
+        """Lowercased words of the expected final response (computed once)."""
+        return frozenset(self.expected_final_response.lower().split())
+    
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "Turn":
+        """Copy the turn; the copy recomputes its own expected tokens."""
+        copy = super().model_copy(update=update, deep=deep)
+        # The cached tokens came along in __dict__ and describe this turn
+        copy.__dict__.pop("expected_tokens", None)
+        return copy
 
 
 class TestCase(BaseModel):
@@ -41,12 +60,14 @@ class TestCase(BaseModel):
         description="Initial session state"
     )
     
+    class Config:
+        frozen = True
+    
     @classmethod
     def from_file(cls, path: str) -> "TestCase":
         """Load test case from JSON file."""
-        with open(path, 'r') as f:
-            data = json.load(f)
-        return cls(**data)
+        # Parse and validate in one pass, without an intermediate dict
+        return cls.model_validate_json(Path(path).read_bytes())
 
 
 class EvalSet(BaseModel):
@@ -58,9 +79,8 @@ class EvalSet(BaseModel):
     @classmethod
     def from_file(cls, path: str) -> "EvalSet":
         """Load eval set from JSON file."""
-        with open(path, 'r') as f:
-            data = json.load(f)
-        return cls(**data)
+        # Parse and validate in one pass, without an intermediate dict
+        return cls.model_validate_json(Path(path).read_bytes())
 
 
 class EvaluationResult(BaseModel):
@@ -70,6 +90,9 @@ class EvaluationResult(BaseModel):
     scores: Dict[str, float] = Field(default_factory=dict)
     details: Dict[str, Any] = Field(default_factory=dict)
     errors: List[str] = Field(default_factory=list)
+    
+    class Config:
+        frozen = True
 
 
 class Evaluator:
@@ -85,7 +108,11 @@ class Evaluator:
         eval_set: Optional[EvalSet] = None,
         test_case: Optional[TestCase] = None,
         criteria: Optional[List[str]] = None,
-        thresholds: Optional[Dict[str, float]] = None
+        thresholds: Optional[Dict[str, float]] = None,
+        max_concurrency: int = 16,
+        ordered: bool = True,
+        concurrent: bool = False,
+        processor: Optional[LLMBatchProcessor] = None
     ):
         """
         Initialize evaluator.
@@ -96,10 +123,35 @@ class Evaluator:
             test_case: Single test case to use
             criteria: List of criteria to evaluate
             thresholds: Threshold for each criterion
+            max_concurrency: Maximum agent executions in flight
+            ordered: Run a test case's turns one after another; set False
+                when turns are independent so they run concurrently (the
+                agent caveat of `concurrent` applies)
+            concurrent: Evaluate test cases concurrently. Only for agents
+                whose execute() may overlap with itself: a lifecycle Agent
+                flips its status and runs its hooks per call, so concurrent
+                calls would interleave them
+            processor: Rate-limited, retrying executor for agent calls
+                (replaces the plain max_concurrency bound)
         """
         self.agent = agent
         self.eval_set = eval_set
         self.test_case = test_case
+        self.ordered = ordered
+        self.concurrent = concurrent
+        self.processor = processor
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        
+        # Criterion -> scorer, resolved once instead of an if/elif chain per call
+        self._sync_scorers: Dict[str, Callable[[Turn, Any], float]] = {
+            EvaluationCriteria.TOOL_TRAJECTORY_MATCH: self._evaluate_tool_trajectory,
+            EvaluationCriteria.RESPONSE_MATCH: self._evaluate_response_match,
+        }
+        self._async_scorers: Dict[str, Callable[[Turn, Any], Awaitable[float]]] = {
+            EvaluationCriteria.FINAL_RESPONSE_MATCH: self._evaluate_final_response_llm,
+            EvaluationCriteria.HALLUCINATION_DETECTION: self._evaluate_hallucination,
+            EvaluationCriteria.SAFETY_SCORE: self._evaluate_safety,
+        }
         
         # Default criteria
         self.criteria = criteria or [
@@ -123,16 +175,35 @@ class Evaluator:
         Returns:
             List of evaluation results
         """
-        results = []
-        
+        test_cases = []
         if self.test_case:
-            result = await self._evaluate_test_case(self.test_case)
-            results.append(result)
-        
+            test_cases.append(self.test_case)
         if self.eval_set:
-            for test_case in self.eval_set.test_cases:
-                result = await self._evaluate_test_case(test_case)
-                results.append(result)
+            test_cases.extend(self.eval_set.test_cases)
+        
+        if self.concurrent:
+            # Agent calls overlap up to max_concurrency
+            outcomes = await asyncio.gather(
+                *(self._evaluate_test_case(test_case) for test_case in test_cases),
+                return_exceptions=True
+            )
+        else:
+            outcomes = []
+            for test_case in test_cases:
+                try:
+                    outcomes.append(await self._evaluate_test_case(test_case))
+                except Exception as e:
+                    outcomes.append(e)
+        
+        results = []
+        for test_case, outcome in zip(test_cases, outcomes):
+            if isinstance(outcome, BaseException):
+                outcome = EvaluationResult(
+                    test_case_name=test_case.name,
+                    passed=False,
+                    errors=[f"Execution error: {str(outcome)}"]
+                )
+            results.append(outcome)
         
         return results
     
@@ -144,20 +215,26 @@ class Evaluator:
         
         try:
             # Run agent for each turn
-            for turn in test_case.turns:
-                # Execute agent
-                result = await self.agent.execute(
-                    task=turn.user_content,
-                    context=test_case.initial_state
-                )
-                
-                # Evaluate each criterion
-                for criterion in self.criteria:
-                    score = await self._evaluate_criterion(
-                        criterion,
-                        turn,
-                        result
+            if self.ordered:
+                turn_results = []
+                for turn in test_case.turns:
+                    turn_results.append(
+                        await self._execute_turn(turn, test_case.initial_state)
                     )
+            else:
+                turn_results = await asyncio.gather(*(
+                    self._execute_turn(turn, test_case.initial_state)
+                    for turn in test_case.turns
+                ))
+            
+            for turn, result in zip(test_case.turns, turn_results):
+                # Evaluate all criteria concurrently (LLM judges overlap)
+                turn_scores = await asyncio.gather(*(
+                    self._evaluate_criterion(criterion, turn, result)
+                    for criterion in self.criteria
+                ))
+                
+                for criterion, score in zip(self.criteria, turn_scores):
                     scores[criterion] = score
                     
                     # Check threshold
@@ -173,7 +250,7 @@ class Evaluator:
             passed = False
             errors.append(f"Execution error: {str(e)}")
         
-        return EvaluationResult(
+        return EvaluationResult.model_construct(
             test_case_name=test_case.name,
             passed=passed,
             scores=scores,
@@ -181,6 +258,21 @@ class Evaluator:
             errors=errors
         )
     
+    async def _execute_turn(self, turn: Turn, context: Dict[str, Any]) -> Any:
+        """Execute the agent for one turn under the concurrency limit."""
+        if self.processor is not None:
+            return await self.processor.run(
+                self.agent.execute,
+                task=turn.user_content,
+                context=context
+            )
+        
+        async with self._semaphore:
+            return await self.agent.execute(
+                task=turn.user_content,
+                context=context
+            )
+    
     async def _evaluate_criterion(
         self,
         criterion: str,
@@ -188,20 +280,13 @@ class Evaluator:
         result: Any
     ) -> float:
         """Evaluate a single criterion."""
-        if criterion == EvaluationCriteria.TOOL_TRAJECTORY_MATCH:
-            return self._evaluate_tool_trajectory(turn, result)
-        
-        elif criterion == EvaluationCriteria.RESPONSE_MATCH:
-            return self._evaluate_response_match(turn, result)
-        
-        elif criterion == EvaluationCriteria.FINAL_RESPONSE_MATCH:
-            return await self._evaluate_final_response_llm(turn, result)
-        
-        elif criterion == EvaluationCriteria.HALLUCINATION_DETECTION:
-            return await self._evaluate_hallucination(turn, result)
+        sync_scorer = self._sync_scorers.get(criterion)
+        if sync_scorer is not None:
+            return sync_scorer(turn, result)
         
-        elif criterion == EvaluationCriteria.SAFETY_SCORE:
-            return await self._evaluate_safety(turn, result)
+        async_scorer = self._async_scorers.get(criterion)
+        if async_scorer is not None:
+            return await async_scorer(turn, result)
         
         return 0.0
     
@@ -225,17 +310,14 @@ class Evaluator:
     
     def _evaluate_response_match(self, turn: Turn, result: Any) -> float:
         """Evaluate response match using ROUGE."""
-        expected = turn.expected_final_response
+        expected_words = turn.expected_tokens
         actual = result.get("response", "")
         
-        # Simple word overlap (ROUGE-1 approximation)
-        expected_words = set(expected.lower().split())
-        actual_words = set(actual.lower().split())
-        
         if not expected_words:
             return 1.0
         
-        overlap = len(expected_words & actual_words)
+        # Simple word overlap (ROUGE-1 approximation)
+        overlap = len(expected_words.intersection(actual.lower().split()))
         return overlap / len(expected_words)
     
     async def _evaluate_final_response_llm(self, turn: Turn, result: Any) -> float:
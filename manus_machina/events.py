@@ -7,9 +7,53 @@ They are immutable and provide a complete audit trail.
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional
-from uuid import UUID, uuid4
+from functools import cached_property
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
 from pydantic import BaseModel, Field
+import orjson
+import os
+import threading
+import time
+
+
+# Random bytes are drawn from the OS in 4 KiB chunks and handed out 10 at a
+# time, instead of one urandom syscall per id
+_RANDOM_POOL_SIZE = 4096
+_random_pool = b""
+_random_offset = 0
+_random_lock = threading.Lock()
+
+
+def _random_bits() -> int:
+    """Take 80 random bits from the shared pool."""
+    global _random_pool, _random_offset
+    with _random_lock:
+        if _random_offset + 10 > len(_random_pool):
+            _random_pool = os.urandom(_RANDOM_POOL_SIZE)
+            _random_offset = 0
+        chunk = _random_pool[_random_offset:_random_offset + 10]
+        _random_offset += 10
+    return int.from_bytes(chunk, "big")
+
+
+def uuid7() -> UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+    
+    The leading 48 bits are the Unix time in milliseconds, so ids sort by
+    creation time and persisted rows append to the tail of the primary key
+    index instead of landing on random B-tree pages like uuid4.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = _random_bits()
+    
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76                          # version
+    value |= ((rand >> 62) & 0xFFF) << 64       # rand_a
+    value |= 0b10 << 62                         # variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF       # rand_b
+    return UUID(int=value)
 
 
 class EventType(str, Enum):
@@ -58,6 +102,9 @@ class EventType(str, Enum):
     MEMORY_RETRIEVED = "memory.retrieved"
 
 
+_EVENT_TYPE_BY_VALUE: Dict[str, EventType] = {e.value: e for e in EventType}
+
+
 class DomainEvent(BaseModel):
     """
     Domain Event represents something that happened in the domain.
@@ -70,7 +117,7 @@ class DomainEvent(BaseModel):
     """
     
     # Identity
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=uuid7)
     event_type: EventType
     
     # Context
@@ -87,25 +134,70 @@ class DomainEvent(BaseModel):
     class Config:
         frozen = True  # Make immutable
         arbitrary_types_allowed = True
+        extra = "forbid"  # Misspelled fields fail loudly instead of being dropped
+    
+    @cached_property
+    def _string_fields(self) -> Tuple[str, str, Optional[str], str, Optional[str]]:
+        """String forms of the scalar fields, computed once (events are frozen)."""
+        return (
+            str(self.id),
+            self.event_type.value,
+            str(self.session_id) if self.session_id else None,
+            self.timestamp.isoformat(),
+            str(self.correlation_id) if self.correlation_id else None,
+        )
+    
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "DomainEvent":
+        """Copy the event; the copy recomputes its own string forms."""
+        copy = super().model_copy(update=update, deep=deep)
+        # The cached strings came along in __dict__ and describe this event
+        copy.__dict__.pop("_string_fields", None)
+        return copy
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert event to dictionary"""
+        id_str, event_type, session_id, timestamp, correlation_id = self._string_fields
         return {
-            "id": str(self.id),
-            "event_type": self.event_type.value,
-            "session_id": str(self.session_id) if self.session_id else None,
+            "id": id_str,
+            "event_type": event_type,
+            "session_id": session_id,
             "agent_name": self.agent_name,
             "data": self.data,
-            "timestamp": self.timestamp.isoformat(),
-            "correlation_id": str(self.correlation_id) if self.correlation_id else None,
+            "timestamp": timestamp,
+            "correlation_id": correlation_id,
         }
     
+    def to_json_bytes(self) -> bytes:
+        """Serialize event to JSON bytes (same shape as to_dict)."""
+        # orjson formats UUIDs and datetimes natively, without str() calls
+        return orjson.dumps(
+            {
+                "id": self.id,
+                "event_type": self.event_type.value,
+                "session_id": self.session_id,
+                "agent_name": self.agent_name,
+                "data": self.data,
+                "timestamp": self.timestamp,
+                "correlation_id": self.correlation_id,
+            },
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS
+        )
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "DomainEvent":
         """Create event from dictionary"""
-        return cls(
+        try:
+            event_type = _EVENT_TYPE_BY_VALUE[data["event_type"]]
+        except KeyError:
+            # Unknown value: let EventType raise its usual ValueError
+            event_type = EventType(data["event_type"])
+        
+        # Every field is parsed (and thereby checked) explicitly above and
+        # below, so the model itself skips a second validation pass
+        return cls.model_construct(
             id=UUID(data["id"]),
-            event_type=EventType(data["event_type"]),
+            event_type=event_type,
             session_id=UUID(data["session_id"]) if data.get("session_id") else None,
             agent_name=data.get("agent_name"),
             data=data.get("data", {}),
@@ -115,10 +207,13 @@ class DomainEvent(BaseModel):
 
 
 # Event factories for common events
+#
+# Inputs here are already typed, so events are built with model_construct
+# (defaults for id/timestamp still apply, validation is skipped).
 
 def session_created_event(session_id: UUID, user_id: Optional[str] = None) -> DomainEvent:
     """Create a session created event"""
-    return DomainEvent(
+    return DomainEvent.model_construct(
         event_type=EventType.SESSION_CREATED,
         session_id=session_id,
         data={"user_id": user_id}
@@ -131,7 +226,7 @@ def agent_started_event(
     task_description: str
 ) -> DomainEvent:
     """Create an agent started event"""
-    return DomainEvent(
+    return DomainEvent.model_construct(
         event_type=EventType.AGENT_STARTED,
         session_id=session_id,
         agent_name=agent_name,
@@ -146,7 +241,7 @@ def agent_completed_event(
     duration_ms: float
 ) -> DomainEvent:
     """Create an agent completed event"""
-    return DomainEvent(
+    return DomainEvent.model_construct(
         event_type=EventType.AGENT_COMPLETED,
         session_id=session_id,
         agent_name=agent_name,
@@ -164,7 +259,7 @@ def tool_call_started_event(
     arguments: Dict[str, Any]
 ) -> DomainEvent:
     """Create a tool call started event"""
-    return DomainEvent(
+    return DomainEvent.model_construct(
         event_type=EventType.TOOL_CALL_STARTED,
         session_id=session_id,
         agent_name=agent_name,
@@ -183,7 +278,7 @@ def tool_call_completed_event(
     duration_ms: float
 ) -> DomainEvent:
     """Create a tool call completed event"""
-    return DomainEvent(
+    return DomainEvent.model_construct(
         event_type=EventType.TOOL_CALL_COMPLETED,
         session_id=session_id,
         agent_name=agent_name,
@@ -202,7 +297,7 @@ def state_updated_event(
     agent_name: Optional[str] = None
 ) -> DomainEvent:
     """Create a state updated event"""
-    return DomainEvent(
+    return DomainEvent.model_construct(
         event_type=EventType.STATE_UPDATED,
         session_id=session_id,
         agent_name=agent_name,
@@ -221,7 +316,7 @@ def artifact_created_event(
     agent_name: Optional[str] = None
 ) -> DomainEvent:
     """Create an artifact created event"""
-    return DomainEvent(
+    return DomainEvent.model_construct(
         event_type=EventType.ARTIFACT_CREATED,
         session_id=session_id,
         agent_name=agent_name,
@@ -239,7 +334,7 @@ def message_received_event(
     user_id: Optional[str] = None
 ) -> DomainEvent:
     """Create a message received event"""
-    return DomainEvent(
+    return DomainEvent.model_construct(
         event_type=EventType.MESSAGE_RECEIVED,
         session_id=session_id,
         data={
@@ -255,7 +350,7 @@ def message_sent_event(
     agent_name: str
 ) -> DomainEvent:
     """Create a message sent event"""
-    return DomainEvent(
+    return DomainEvent.model_construct(
         event_type=EventType.MESSAGE_SENT,
         session_id=session_id,
         agent_name=agent_name,
@@ -270,7 +365,7 @@ def llm_request_started_event(
     prompt_tokens: int
 ) -> DomainEvent:
     """Create an LLM request started event"""
-    return DomainEvent(
+    return DomainEvent.model_construct(
         event_type=EventType.LLM_REQUEST_STARTED,
         session_id=session_id,
         agent_name=agent_name,
@@ -290,7 +385,7 @@ def llm_request_completed_event(
     duration_ms: float
 ) -> DomainEvent:
     """Create an LLM request completed event"""
-    return DomainEvent(
+    return DomainEvent.model_construct(
         event_type=EventType.LLM_REQUEST_COMPLETED,
         session_id=session_id,
         agent_name=agent_name,
@@ -303,3 +398,32 @@ def llm_request_completed_event(
         }
     )
 
+
+
+def llm_request_completed_event_from_data(
+    session_id: UUID,
+    agent_name: str,
+    data: Dict[str, Any]
+) -> DomainEvent:
+    """
+    Create an LLM request completed event from an existing payload.
+    
+    For callers that already hold the response metadata as a dict (e.g.
+    an LLM response's "usage" plus model and duration); the dict becomes
+    the event's data as-is, without being copied.
+    
+    Args:
+        session_id: Session ID
+        agent_name: Agent that made the request
+        data: Event payload (model, prompt_tokens, completion_tokens,
+            total_tokens, duration_ms)
+        
+    Returns:
+        LLM request completed event
+    """
+    return DomainEvent.model_construct(
+        event_type=EventType.LLM_REQUEST_COMPLETED,
+        session_id=session_id,
+        agent_name=agent_name,
+        data=data
+    )
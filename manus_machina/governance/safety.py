@@ -1,10 +1,19 @@
 """Safety and governance mechanisms."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from collections import deque
 from pydantic import BaseModel, Field
 from enum import Enum
+import math
 import time
 
+try:
+    # C Aho-Corasick automaton; falls back to a substring test per keyword
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 
 class SafetyCategory(str, Enum):
     """Safety categories for content filtering."""
@@ -32,6 +41,24 @@ class SafetyResult(BaseModel):
     reason: Optional[str] = None
 
 
+# Placeholder keyword lists; in production this would use ML models
+_CATEGORY_KEYWORDS: Dict[SafetyCategory, Tuple[str, ...]] = {
+    SafetyCategory.HATE: ("hate", "racist", "discriminat"),
+    SafetyCategory.VIOLENCE: ("kill", "murder", "attack"),
+    SafetyCategory.SEXUAL: ("sexual", "explicit"),
+    SafetyCategory.DANGEROUS: ("bomb", "weapon", "poison"),
+}
+
+
+# Minimum score that blocks content at each threshold level
+_BLOCK_THRESHOLDS: Dict[SafetyThreshold, float] = {
+    SafetyThreshold.BLOCK_NONE: math.inf,
+    SafetyThreshold.BLOCK_LOW_AND_ABOVE: 0.25,
+    SafetyThreshold.BLOCK_MEDIUM_AND_ABOVE: 0.5,
+    SafetyThreshold.BLOCK_HIGH_AND_ABOVE: 0.75,
+}
+
+
 class SafetyFilter:
     """
     Safety filter for content moderation.
@@ -58,6 +85,27 @@ class SafetyFilter:
             SafetyCategory.DANGEROUS
         ]
         self.threshold = threshold
+        self._block_threshold = _BLOCK_THRESHOLDS.get(threshold, math.inf)
+        
+        # One matcher over every keyword of every category, so content is
+        # scanned once instead of once per keyword
+        self._keyword_categories: Dict[str, SafetyCategory] = {
+            keyword: category
+            for category in self.categories
+            for keyword in _CATEGORY_KEYWORDS.get(category, ())
+        }
+        if AHOCORASICK_AVAILABLE and self._keyword_categories:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self._keyword_categories:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+        else:
+            self._automaton = None
+        
+        # Most content matches no keyword; such checks copy precomputed
+        # all-zero scores instead of scoring each category. Each gets its
+        # own result, as callers may modify the scores dict or list.
+        self._clean_scores: Dict[SafetyCategory, float] = {category: 0.0 for category in self.categories}
     
     async def check(self, content: str) -> SafetyResult:
         """
@@ -69,57 +117,81 @@ class SafetyFilter:
         Returns:
             Safety result
         """
+        # In production, this would call a safety API
+        # For now, use simple keyword detection
+        return self._check_content(content)
+    
+    async def check_many(self, contents: List[str]) -> List[SafetyResult]:
+        """
+        Check several contents in one call.
+        
+        Args:
+            contents: Contents to check
+            
+        Returns:
+            Safety results, in input order
+        """
+        return [self._check_content(content) for content in contents]
+    
+    def _check_content(self, content: str) -> SafetyResult:
+        """Check one content, skipping the scoring when nothing matches."""
+        counts = self._category_counts(content)
+        if not counts:
+            return SafetyResult.model_construct(
+                passed=True,
+                blocked_categories=[],
+                scores=self._clean_scores.copy(),
+                reason=None
+            )
+        return self._result(counts)
+    
+    def _result(self, counts: Dict[SafetyCategory, int]) -> SafetyResult:
+        """Score keyword counts and build the safety result."""
         scores = {}
         blocked = []
         
-        # In production, this would call a safety API
-        # For now, use simple keyword detection
         for category in self.categories:
-            score = self._check_category(content, category)
+            score = min(counts.get(category, 0) * 0.3, 1.0)
             scores[category] = score
             
-            if self._should_block(score):
+            if score >= self._block_threshold:
                 blocked.append(category)
         
         passed = len(blocked) == 0
         reason = None if passed else f"Blocked categories: {', '.join(blocked)}"
         
-        return SafetyResult(
+        # Built from our own computed values; no validation needed
+        return SafetyResult.model_construct(
             passed=passed,
             blocked_categories=blocked,
             scores=scores,
             reason=reason
         )
     
-    def _check_category(self, content: str, category: SafetyCategory) -> float:
-        """Check content for a specific category."""
-        # Placeholder implementation
-        # In production, this would use ML models
+    def _category_counts(self, content: str) -> Dict[SafetyCategory, int]:
+        """Count distinct keywords found per category in one pass."""
         content_lower = content.lower()
         
-        keywords = {
-            SafetyCategory.HATE: ["hate", "racist", "discriminat"],
-            SafetyCategory.VIOLENCE: ["kill", "murder", "attack"],
-            SafetyCategory.SEXUAL: ["sexual", "explicit"],
-            SafetyCategory.DANGEROUS: ["bomb", "weapon", "poison"]
-        }
+        if self._automaton is not None:
+            # Reports every match, overlapping ones included
+            found = {keyword for _, keyword in self._automaton.iter(content_lower)}
+        else:
+            # Not a regex alternation: findall skips matches overlapping an
+            # earlier one ("attackill"), which would let content through
+            found = {keyword for keyword in self._keyword_categories if keyword in content_lower}
         
-        category_keywords = keywords.get(category, [])
-        matches = sum(1 for kw in category_keywords if kw in content_lower)
+        if not found:
+            return {}
         
-        return min(matches * 0.3, 1.0)
+        counts: Dict[SafetyCategory, int] = {}
+        for keyword in found:
+            category = self._keyword_categories[keyword]
+            counts[category] = counts.get(category, 0) + 1
+        return counts
     
     def _should_block(self, score: float) -> bool:
         """Determine if score should trigger blocking."""
-        if self.threshold == SafetyThreshold.BLOCK_NONE:
-            return False
-        elif self.threshold == SafetyThreshold.BLOCK_LOW_AND_ABOVE:
-            return score >= 0.25
-        elif self.threshold == SafetyThreshold.BLOCK_MEDIUM_AND_ABOVE:
-            return score >= 0.5
-        elif self.threshold == SafetyThreshold.BLOCK_HIGH_AND_ABOVE:
-            return score >= 0.75
-        return False
+        return score >= self._block_threshold
 
 
 class RateLimiter:
@@ -144,18 +216,16 @@ class RateLimiter:
         self.requests_per_minute = requests_per_minute
         self.tokens_per_minute = tokens_per_minute
         
-        self.request_timestamps: List[float] = []
-        self.token_usage: List[tuple] = []  # (timestamp, tokens)
+        # Sliding windows of monotonic timestamps, oldest first: expiry
+        # pops from the left in O(1)
+        self.request_timestamps: Deque[float] = deque()
+        self.token_usage: Deque[tuple] = deque()  # (timestamp, tokens)
+        self._tokens_in_window = 0
     
     def check_request(self) -> bool:
         """Check if a new request is allowed."""
-        now = time.time()
-        minute_ago = now - 60
-        
-        # Remove old timestamps
-        self.request_timestamps = [
-            ts for ts in self.request_timestamps if ts > minute_ago
-        ]
+        now = time.monotonic()
+        self._expire_requests(now - 60)
         
         # Check limit
         if len(self.request_timestamps) >= self.requests_per_minute:
@@ -166,23 +236,55 @@ class RateLimiter:
     
     def check_tokens(self, tokens: int) -> bool:
         """Check if token usage is within limit."""
-        now = time.time()
-        minute_ago = now - 60
+        now = time.monotonic()
+        self._expire_tokens(now - 60)
         
-        # Remove old usage
-        self.token_usage = [
-            (ts, t) for ts, t in self.token_usage if ts > minute_ago
-        ]
+        # Check limit
+        if self._tokens_in_window + tokens > self.tokens_per_minute:
+            return False
         
-        # Calculate current usage
-        current_usage = sum(t for _, t in self.token_usage)
+        self.token_usage.append((now, tokens))
+        self._tokens_in_window += tokens
+        return True
+    
+    def check(self, tokens: int) -> bool:
+        """
+        Admit a request only if both the request and token limits allow it.
         
-        # Check limit
-        if current_usage + tokens > self.tokens_per_minute:
+        Unlike calling check_request() then check_tokens(), nothing is
+        recorded when either limit refuses, so a refused request does
+        not use up request budget.
+        
+        Args:
+            tokens: Tokens the request will use
+            
+        Returns:
+            Whether the request was admitted
+        """
+        now = time.monotonic()
+        minute_ago = now - 60
+        self._expire_requests(minute_ago)
+        self._expire_tokens(minute_ago)
+        
+        if len(self.request_timestamps) >= self.requests_per_minute:
+            return False
+        if self._tokens_in_window + tokens > self.tokens_per_minute:
             return False
         
+        self.request_timestamps.append(now)
         self.token_usage.append((now, tokens))
+        self._tokens_in_window += tokens
         return True
+    
+    def _expire_requests(self, cutoff: float) -> None:
+        """Drop request timestamps at or before cutoff."""
+        while self.request_timestamps and self.request_timestamps[0] <= cutoff:
+            self.request_timestamps.popleft()
+    
+    def _expire_tokens(self, cutoff: float) -> None:
+        """Drop token usage at or before cutoff, keeping the running total in step."""
+        while self.token_usage and self.token_usage[0][0] <= cutoff:
+            self._tokens_in_window -= self.token_usage.popleft()[1]
 
 
 class CostTracker:
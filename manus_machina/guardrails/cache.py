@@ -0,0 +1,127 @@
+"""LFU cache for guardrail decisions."""
+
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+from hashlib import blake2b
+import asyncio
+import heapq
+import re
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_prompt(text: str) -> str:
+    """Collapse whitespace and lowercase text."""
+    return _WHITESPACE.sub(" ", text).strip().lower()
+
+
+def prompt_key(text: str, normalize: bool = True) -> bytes:
+    """
+    Build a compact cache key for a prompt.
+    
+    Args:
+        text: Prompt text
+        normalize: Whether to normalize the text before hashing
+        
+    Returns:
+        16-byte blake2b digest
+    """
+    if normalize:
+        text = normalize_prompt(text)
+    return blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class LFUCache:
+    """
+    Least-frequently-used cache with least-recently-used tiebreaking.
+    
+    Entries live in a dict; eviction order is kept in a heap of
+    (frequency, last_access, key) with stale heap entries skipped lazily.
+    """
+    
+    def __init__(self, capacity: int = 50000):
+        """
+        Initialize cache.
+        
+        Args:
+            capacity: Maximum number of entries
+        """
+        self.capacity = capacity
+        self._entries: Dict[Hashable, Tuple[Any, int, int]] = {}
+        self._heap: List[Tuple[int, int, Hashable]] = []
+        self._tick = 0
+        self._lock = asyncio.Lock()
+        
+        # Metrics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+    
+    async def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value, or None on a miss."""
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            
+            self._hits += 1
+            value, frequency, _ = entry
+            self._touch(key, value, frequency + 1)
+            return value
+    
+    async def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least frequently used entry if full."""
+        if self.capacity <= 0:
+            return
+        
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._touch(key, value, entry[1] + 1)
+                return
+            
+            if len(self._entries) >= self.capacity:
+                self._evict()
+            self._touch(key, value, 1)
+    
+    def _touch(self, key: Hashable, value: Any, frequency: int) -> None:
+        """Record an access to key."""
+        self._tick += 1
+        self._entries[key] = (value, frequency, self._tick)
+        heapq.heappush(self._heap, (frequency, self._tick, key))
+        
+        # Drop stale heap entries once they outnumber live ones
+        if len(self._heap) > 2 * max(len(self._entries), 1) + 64:
+            self._heap = [
+                (freq, tick, k) for k, (_, freq, tick) in self._entries.items()
+            ]
+            heapq.heapify(self._heap)
+    
+    def _evict(self) -> None:
+        """Remove the least frequently (then least recently) used entry."""
+        while self._heap:
+            frequency, tick, key = heapq.heappop(self._heap)
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == frequency and entry[2] == tick:
+                del self._entries[key]
+                self._evictions += 1
+                return
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get cache metrics."""
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._entries),
+            "capacity": self.capacity,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "hit_rate": self._hits / lookups if lookups > 0 else 0,
+        }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __repr__(self) -> str:
+        return f"LFUCache(size={len(self._entries)}, capacity={self.capacity})"
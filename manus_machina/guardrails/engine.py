@@ -1,7 +1,8 @@
 """Guardrail engine for orchestrating guards."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from pydantic import BaseModel, Field
+import asyncio
 
 from manus_machina.guardrails.guards import (
     BaseGuard,
@@ -10,6 +11,7 @@ from manus_machina.guardrails.guards import (
     ActionGuard,
     GuardResult,
 )
+from manus_machina.guardrails.cache import LFUCache, prompt_key
 
 
 class GuardrailConfig(BaseModel):
@@ -23,16 +25,49 @@ class GuardrailConfig(BaseModel):
         default=True,
         description="Log all guard violations"
     )
+    cache_capacity: int = Field(
+        default=50000,
+        description="Cached decisions per guard (0 disables caching)"
+    )
 
 
 class GuardrailViolation(Exception):
-    """Raised when a guardrail check fails."""
+    """
+    Raised when a guardrail check fails.
+    
+    A combined violation keeps the individual violations and only builds
+    its metadata view when it is read.
+    """
     
-    def __init__(self, guard_name: str, message: str, metadata: Dict[str, Any]):
+    def __init__(
+        self,
+        guard_name: str,
+        message: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        violations: Sequence["GuardrailViolation"] = ()
+    ):
         self.guard_name = guard_name
         self.message = message
-        self.metadata = metadata
-        super().__init__(f"Guardrail '{guard_name}' failed: {message}")
+        self.violations = tuple(violations)
+        self._metadata = metadata
+        super().__init__(guard_name, message)
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Violation metadata (for combined violations, one entry per guard)."""
+        if self._metadata is None:
+            self._metadata = {"violations": [
+                {
+                    "guard": v.guard_name,
+                    "message": v.message,
+                    "metadata": v.metadata
+                }
+                for v in self.violations
+            ]} if self.violations else {}
+        return self._metadata
+    
+    def __str__(self) -> str:
+        return f"Guardrail '{self.guard_name}' failed: {self.message}"
 
 
 class GuardrailEngine:
@@ -50,6 +85,12 @@ class GuardrailEngine:
         self.output_guards: Dict[str, OutputGuard] = {}
         self.action_guards: Dict[str, ActionGuard] = {}
         
+        # Decision cache per guard, keyed by prompt hash
+        self._caches: Dict[int, LFUCache] = {}
+        
+        # "All guards" snapshot per registry, dropped when a guard registers
+        self._all_guards: Dict[int, Tuple[BaseGuard, ...]] = {}
+        
         # Metrics
         self._total_validations = 0
         self._total_violations = 0
@@ -57,14 +98,25 @@ class GuardrailEngine:
     def register_input_guard(self, guard: InputGuard) -> None:
         """Register an input guard."""
         self.input_guards[guard.name] = guard
+        self._all_guards.pop(id(self.input_guards), None)
+        self._register_cache(guard)
     
     def register_output_guard(self, guard: OutputGuard) -> None:
         """Register an output guard."""
         self.output_guards[guard.name] = guard
+        self._all_guards.pop(id(self.output_guards), None)
+        self._register_cache(guard)
     
     def register_action_guard(self, guard: ActionGuard) -> None:
         """Register an action guard."""
         self.action_guards[guard.name] = guard
+        self._all_guards.pop(id(self.action_guards), None)
+        self._register_cache(guard)
+    
+    def _register_cache(self, guard: BaseGuard) -> None:
+        """Create the decision cache for a guard."""
+        if self.config.cache_capacity > 0:
+            self._caches[id(guard)] = LFUCache(self.config.cache_capacity)
     
     async def validate_input(
         self,
@@ -139,10 +191,13 @@ class GuardrailEngine:
         self,
         guard_dict: Dict[str, BaseGuard],
         guard_names: Optional[List[str]]
-    ) -> List[BaseGuard]:
+    ) -> Sequence[BaseGuard]:
         """Select guards to run."""
         if guard_names is None:
-            return list(guard_dict.values())
+            guards = self._all_guards.get(id(guard_dict))
+            if guards is None:
+                guards = self._all_guards[id(guard_dict)] = tuple(guard_dict.values())
+            return guards
         
         return [
             guard_dict[name]
@@ -152,47 +207,98 @@ class GuardrailEngine:
     
     async def _run_guards(
         self,
-        guards: List[BaseGuard],
+        guards: Sequence[BaseGuard],
         content: str,
         context: Optional[Dict[str, Any]]
     ) -> str:
-        """Run guards and collect results."""
+        """
+        Run guards concurrently and collect results.
+        
+        With fail_fast, the first failing guard to finish raises and the
+        guards still running are cancelled.
+        """
         self._total_validations += 1
         violations = []
         
-        for guard in guards:
-            result = await guard.validate(content, context)
-            
-            if not result.passed:
-                self._total_violations += 1
-                violation = GuardrailViolation(
-                    guard_name=guard.name,
-                    message=result.message or "Validation failed",
-                    metadata=result.metadata
-                )
-                
+        if not guards:
+            return content
+        
+        if len(guards) == 1:
+            # A lone guard has nothing to overlap with; skip the task machinery
+            guard = guards[0]
+            violation = self._check_result(guard, await self._validate_cached(guard, content, context))
+            if violation:
                 if self.config.fail_fast:
                     raise violation
-                
                 violations.append(violation)
+        elif self.config.fail_fast:
+            tasks = {
+                asyncio.create_task(self._validate_cached(guard, content, context)): guard
+                for guard in guards
+            }
+            pending = set(tasks)
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        violation = self._check_result(tasks[task], task.result())
+                        if violation:
+                            raise violation
+            finally:
+                for task in pending:
+                    task.cancel()
+        else:
+            results = await asyncio.gather(*(
+                self._validate_cached(guard, content, context) for guard in guards
+            ))
+            for guard, result in zip(guards, results):
+                violation = self._check_result(guard, result)
+                if violation:
+                    violations.append(violation)
         
         # If not fail_fast and there were violations, raise combined error
         if violations:
             raise GuardrailViolation(
                 guard_name="multiple",
                 message=f"{len(violations)} guard(s) failed",
-                metadata={"violations": [
-                    {
-                        "guard": v.guard_name,
-                        "message": v.message,
-                        "metadata": v.metadata
-                    }
-                    for v in violations
-                ]}
+                violations=violations
             )
         
         return content
     
+    async def _validate_cached(
+        self,
+        guard: BaseGuard,
+        content: str,
+        context: Optional[Dict[str, Any]]
+    ) -> GuardResult:
+        """Run a guard, reusing an earlier decision for the same prompt."""
+        cache = self._caches.get(id(guard))
+        
+        # Context can change the verdict (e.g. factuality sources), so only
+        # context-free checks are cached
+        if cache is None or context:
+            return await guard.validate(content, context)
+        
+        key = prompt_key(content, normalize=guard.case_insensitive)
+        result = await cache.get(key)
+        if result is None:
+            result = await guard.validate(content, context)
+            await cache.put(key, result)
+        return result
+    
+    def _check_result(self, guard: BaseGuard, result: GuardResult) -> Optional[GuardrailViolation]:
+        """Turn a failed guard result into a violation."""
+        if result.passed:
+            return None
+        
+        self._total_violations += 1
+        return GuardrailViolation(
+            guard_name=guard.name,
+            message=result.message or "Validation failed",
+            metadata=result.metadata
+        )
+    
     def get_metrics(self) -> Dict[str, Any]:
         """Get guardrail engine metrics."""
         return {
@@ -203,6 +309,12 @@ class GuardrailEngine:
             "input_guards": len(self.input_guards),
             "output_guards": len(self.output_guards),
             "action_guards": len(self.action_guards),
+            "cache": {
+                guard.name: self._caches[id(guard)].get_metrics()
+                for guards in (self.input_guards, self.output_guards, self.action_guards)
+                for guard in guards.values()
+                if id(guard) in self._caches
+            },
         }
     
     def __repr__(self) -> str:
@@ -1,10 +1,18 @@
 """Guardrail implementations for input/output validation."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 from pydantic import BaseModel, Field
 from abc import ABC, abstractmethod
+import orjson
 import re
 
+try:
+    # C Aho-Corasick automaton; falls back to a case-insensitive regex scan
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 
 class GuardResult(BaseModel):
     """Result of a guard check."""
@@ -17,6 +25,10 @@ class GuardResult(BaseModel):
 class BaseGuard(ABC):
     """Base class for all guards."""
     
+    # Whether the verdict is unaffected by case and whitespace, so cache
+    # lookups may use the normalized prompt
+    case_insensitive: bool = False
+    
     def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
         self.name = name
         self.config = config or {}
@@ -61,7 +73,8 @@ class PromptInjectionGuard(InputGuard):
     Looks for patterns that might indicate attempts to manipulate the prompt.
     """
     
-    INJECTION_PATTERNS = [
+    # Compiled once per class; IGNORECASE spares a lowercased copy of the content
+    INJECTION_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
         r"ignore\s+(previous|above|all)\s+instructions?",
         r"disregard\s+(previous|above|all)\s+instructions?",
         r"forget\s+(previous|above|all)\s+instructions?",
@@ -71,19 +84,27 @@ class PromptInjectionGuard(InputGuard):
         r"you\s+are\s+now",
         r"act\s+as\s+if",
         r"pretend\s+you\s+are",
-    ]
+    )]
+    
+    # All patterns fused into one alternation, so clean content (the common
+    # case) is scanned once; group p<i> names the pattern that matched
+    _COMBINED_PATTERN = re.compile(
+        "|".join(f"(?P<p{i}>{pattern.pattern})" for i, pattern in enumerate(INJECTION_PATTERNS)),
+        re.IGNORECASE
+    )
+    
+    case_insensitive = True
     
     async def validate(self, content: str, context: Optional[Dict[str, Any]] = None) -> GuardResult:
         """Check for prompt injection patterns."""
-        content_lower = content.lower()
-        
-        for pattern in self.INJECTION_PATTERNS:
-            if re.search(pattern, content_lower):
-                return GuardResult(
-                    passed=False,
-                    message=f"Potential prompt injection detected: pattern '{pattern}'",
-                    metadata={"pattern": pattern}
-                )
+        match = self._COMBINED_PATTERN.search(content)
+        if match:
+            pattern = self.INJECTION_PATTERNS[int(match.lastgroup[1:])].pattern
+            return GuardResult(
+                passed=False,
+                message=f"Potential prompt injection detected: pattern '{pattern}'",
+                metadata={"pattern": pattern}
+            )
         
         return GuardResult(passed=True)
 
@@ -96,10 +117,10 @@ class PIIDetectionGuard(InputGuard):
     """
     
     PII_PATTERNS = {
-        "email": r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-        "phone": r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
-        "ssn": r'\b\d{3}-\d{2}-\d{4}\b',
-        "credit_card": r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b',
+        "email": re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+        "phone": re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'),
+        "ssn": re.compile(r'\b\d{3}-\d{2}-\d{4}\b'),
+        "credit_card": re.compile(r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b'),
     }
     
     async def validate(self, content: str, context: Optional[Dict[str, Any]] = None) -> GuardResult:
@@ -107,7 +128,7 @@ class PIIDetectionGuard(InputGuard):
         detected_pii = []
         
         for pii_type, pattern in self.PII_PATTERNS.items():
-            matches = re.findall(pattern, content)
+            matches = pattern.findall(content)
             if matches:
                 detected_pii.append({
                     "type": pii_type,
@@ -136,17 +157,41 @@ class ToxicityGuard(OutputGuard):
         # Add more as needed
     ]
     
+    case_insensitive = True
+    
     def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
         super().__init__(name, config)
         self.threshold = self.config.get("threshold", 0.5)
+        
+        # One matcher over all keywords, so content is scanned once instead
+        # of once per keyword
+        if AHOCORASICK_AVAILABLE and self.TOXIC_KEYWORDS:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self.TOXIC_KEYWORDS:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+        else:
+            self._automaton = None
+        
+        # Fallback: a zero-width lookahead tries every start position, so
+        # overlapping keywords ("attackill") are all found. Longest first,
+        # each match also implies the shorter keywords that prefix it.
+        keywords = sorted({keyword.lower() for keyword in self.TOXIC_KEYWORDS}, key=len, reverse=True)
+        self._keyword_pattern = re.compile(
+            "(?=(" + "|".join(re.escape(keyword) for keyword in keywords) + "))",
+            re.IGNORECASE
+        ) if keywords else None
+        self._implied_keywords = {
+            keyword: {other for other in keywords if keyword.startswith(other)}
+            for keyword in keywords
+        }
     
     async def validate(self, content: str, context: Optional[Dict[str, Any]] = None) -> GuardResult:
         """Check for toxic content."""
-        content_lower = content.lower()
-        
         # Simple keyword-based detection (in production, use ML model)
-        toxic_count = sum(1 for keyword in self.TOXIC_KEYWORDS if keyword in content_lower)
-        toxicity_score = toxic_count / len(content.split()) if content else 0
+        toxic_count = len(self._found_keywords(content))
+        # Clean content (the common case) needs no word count at all
+        toxicity_score = toxic_count / len(content.split()) if toxic_count else 0
         
         if toxicity_score > self.threshold:
             return GuardResult(
@@ -156,6 +201,22 @@ class ToxicityGuard(OutputGuard):
             )
         
         return GuardResult(passed=True)
+    
+    def _found_keywords(self, content: str) -> Set[str]:
+        """Distinct toxic keywords occurring in the content, ignoring case."""
+        if self._automaton is not None:
+            # Reports every match, overlapping ones included; it matches
+            # exact bytes, so it needs lowercased input
+            return {keyword for _, keyword in self._automaton.iter(content.lower())}
+        if self._keyword_pattern is None:
+            return set()
+        # IGNORECASE matches in place, without a lowercased copy
+        found: Set[str] = set()
+        for match in set(self._keyword_pattern.findall(content)):
+            # Unicode case folding can match text that lower() doesn't map
+            # back to a keyword (e.g. "\u017f" for "s"); skip it like lower() would
+            found |= self._implied_keywords.get(match.lower(), set())
+        return found
 
 
 class FactualityGuard(OutputGuard):
@@ -201,18 +262,19 @@ class DomainAllowlistGuard(ActionGuard):
     Useful for preventing agents from accessing unauthorized resources.
     """
     
+    _URL_RE = re.compile(r'https?://([a-zA-Z0-9.-]+)')
+    
     def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
         super().__init__(name, config)
         self.allowed_domains = self.config.get("allowed_domains", [])
+        self._allowed_domain_set = frozenset(self.allowed_domains)
     
     async def validate(self, content: str, context: Optional[Dict[str, Any]] = None) -> GuardResult:
         """Check if action targets allowed domain."""
-        # Extract domain from URL
-        url_pattern = r'https?://([a-zA-Z0-9.-]+)'
-        matches = re.findall(url_pattern, content)
-        
-        for domain in matches:
-            if domain not in self.allowed_domains:
+        # Extract domain from URL, stopping at the first disallowed one
+        for match in self._URL_RE.finditer(content):
+            domain = match.group(1)
+            if domain not in self._allowed_domain_set:
                 return GuardResult(
                     passed=False,
                     message=f"Domain '{domain}' not in allowlist",
@@ -236,11 +298,10 @@ class FormatValidationGuard(OutputGuard):
     async def validate(self, content: str, context: Optional[Dict[str, Any]] = None) -> GuardResult:
         """Validate output format."""
         if self.expected_format == "json":
-            import json
             try:
-                json.loads(content)
+                orjson.loads(content)
                 return GuardResult(passed=True)
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 return GuardResult(
                     passed=False,
                     message=f"Invalid JSON format: {e}",
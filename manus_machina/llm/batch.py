@@ -0,0 +1,105 @@
+"""
+LLM Batch Processor
+
+Runs many LLM-bound calls concurrently without stampeding the provider:
+in-flight calls are capped by a semaphore, new calls are paced by a
+requests-per-minute limiter, and failed calls are retried with
+exponential backoff. Each retry attempt re-enters the limits, so a call
+backing off does not hold a concurrency slot while it sleeps.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+import asyncio
+
+from manus_machina.governance.safety import RateLimiter
+from manus_machina.resilience.retry import RetryConfig, RetryPolicy
+
+
+_RATE_LIMIT_POLL_SECONDS = 0.5
+
+
+def _is_error_result(result: Any) -> bool:
+    """Agents report failures as {'status': 'error', ...} instead of raising."""
+    return isinstance(result, dict) and result.get("status") == "error"
+
+
+class LLMBatchProcessor:
+    """
+    Bounded, rate-limited, retrying executor for LLM calls.
+    
+    Examples:
+        processor = LLMBatchProcessor(max_concurrency=8, requests_per_minute=60)
+        evaluator = Evaluator(agent, eval_set=eval_set, processor=processor)
+    """
+    
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        requests_per_minute: int = 60,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        retry_on_result: Optional[Callable[[Any], bool]] = _is_error_result
+    ):
+        """
+        Initialize processor.
+        
+        Args:
+            max_concurrency: Maximum calls in flight
+            requests_per_minute: Maximum calls started per minute
+            max_attempts: Attempts per call, including the first
+            base_delay: Initial backoff delay in seconds
+            retry_on_result: Predicate marking a returned result as failed
+                (defaults to agent error dicts)
+        """
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._rate_limiter = RateLimiter(requests_per_minute=requests_per_minute)
+        self._retry = RetryPolicy(
+            "llm_batch",
+            RetryConfig(
+                max_attempts=max_attempts,
+                base_delay=base_delay,
+                retry_on_result=retry_on_result
+            )
+        )
+    
+    async def run(self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run one call under the processor's limits, retrying failures.
+        
+        Args:
+            func: Async callable to run
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+            
+        Returns:
+            Call result (the last attempt's result if every attempt failed)
+            
+        Raises:
+            RetryExhaustedError: If every attempt raised
+        """
+        async def attempt() -> Any:
+            async with self._semaphore:
+                while not self._rate_limiter.check_request():
+                    await asyncio.sleep(_RATE_LIMIT_POLL_SECONDS)
+                return await func(*args, **kwargs)
+        
+        return await self._retry.execute(attempt)
+    
+    async def map(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        kwargs_list: Iterable[Dict[str, Any]]
+    ) -> List[Any]:
+        """
+        Run func once per kwargs dict, concurrently, preserving order.
+        
+        Failed calls are returned as exceptions instead of cancelling the rest.
+        """
+        return await asyncio.gather(
+            *(self.run(func, **kwargs) for kwargs in kwargs_list),
+            return_exceptions=True
+        )
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get processor metrics."""
+        return self._retry.get_metrics()
@@ -0,0 +1,384 @@
+"""
+LLM Response Cache
+
+Exact-match cache for deterministic (temperature == 0) LLM calls, and a
+semantic cache that also matches paraphrased prompts. A hit skips the
+network round trip and the model forward pass entirely.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence, Tuple
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import sha256
+from pathlib import Path
+import asyncio
+import sqlite3
+import threading
+import time
+
+import orjson
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class CacheBackend(Protocol):
+    """Storage interface for LLMCache."""
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a value, or None if missing or expired."""
+        ...
+    
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, optionally expiring after `ttl` seconds."""
+        ...
+    
+    async def delete(self, key: str) -> None:
+        """Remove a value."""
+        ...
+
+
+class InMemoryBackend:
+    """
+    In-process LRU backend with per-entry TTL.
+    """
+    
+    def __init__(self, max_size: int = 1024):
+        """
+        Initialize backend.
+        
+        Args:
+            max_size: Maximum number of entries before LRU eviction
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        value, expires_at = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    async def delete(self, key: str) -> None:
+        """Remove a value."""
+        self._entries.pop(key, None)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteBackend:
+    """
+    Persistent backend in a local SQLite file.
+    
+    Entries survive restarts, so repeated eval runs reuse earlier
+    responses. Uses WAL journaling and memory-mapped reads; queries run in
+    a worker thread so disk I/O never blocks the event loop.
+    """
+    
+    def __init__(self, path: str = "~/.manus_machina/llm_cache.sqlite", mmap_size: int = 256 * 1024 * 1024):
+        """
+        Initialize backend.
+        
+        Args:
+            path: Database file path
+            mmap_size: Bytes of the database file to memory-map
+        """
+        db_path = Path(path).expanduser()
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self.db = sqlite3.connect(db_path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)"
+        )
+        self.db.commit()
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a value, or None if missing or expired."""
+        return await asyncio.to_thread(self._get, key)
+    
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, optionally expiring after `ttl` seconds."""
+        expires_at = time.time() + ttl if ttl is not None else None
+        await asyncio.to_thread(self._set, key, orjson.dumps(value), expires_at)
+    
+    async def delete(self, key: str) -> None:
+        """Remove a value."""
+        await asyncio.to_thread(self._delete, key)
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self.db.close()
+    
+    def _get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self.db.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            value, expires_at = row
+            if expires_at is not None and time.time() >= expires_at:
+                self.db.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self.db.commit()
+                return None
+        
+        return orjson.loads(value)
+    
+    def _set(self, key: str, value: bytes, expires_at: Optional[float]) -> None:
+        with self._lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, expires_at)
+            )
+            self.db.commit()
+    
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self.db.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self.db.commit()
+
+
+class LLMCache:
+    """
+    Exact-match response cache for LLM calls.
+    
+    Only deterministic calls should be cached; callers check
+    `temperature == 0` before using it.
+    
+    Examples:
+        cache = LLMCache(ttl=3600)
+        client = LLMClient(cache=cache)
+    """
+    
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl: Optional[float] = 3600.0):
+        """
+        Initialize cache.
+        
+        Args:
+            backend: Storage backend (defaults to InMemoryBackend; use
+                SQLiteBackend to keep responses across runs)
+            ttl: Seconds a response stays valid (None = no expiry)
+        """
+        self.backend = backend or InMemoryBackend()
+        self.ttl = ttl
+        
+        # Metrics
+        self._hits = 0
+        self._misses = 0
+    
+    @staticmethod
+    def make_key(
+        model: str,
+        system_instruction: Optional[str],
+        prompt: str,
+        temperature: float,
+        max_tokens: Optional[int]
+    ) -> str:
+        """Build the cache key for a call."""
+        payload = orjson.dumps(
+            {
+                "model": model,
+                "sys": system_instruction,
+                "prompt": prompt,
+                "temp": temperature,
+                "max": max_tokens,
+            },
+            option=orjson.OPT_SORT_KEYS
+        )
+        return sha256(payload).hexdigest()
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a cached response."""
+        value = await self.backend.get(key)
+        if value is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return value
+    
+    async def set(self, key: str, value: Any) -> None:
+        """Store a response."""
+        await self.backend.set(key, value, self.ttl)
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get cache metrics."""
+        lookups = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups > 0 else 0,
+        }
+
+
+class SemanticCache:
+    """
+    Similarity-based response cache for paraphrased prompts.
+    
+    Prompts are embedded once and compared against every stored prompt
+    embedding with a single matrix-vector product; the closest entry is
+    returned when its cosine similarity reaches `threshold`. Entries are
+    grouped by namespace (model, system instruction, ...) so responses
+    are only reused between otherwise identical calls.
+    
+    Examples:
+        cache = SemanticCache(embed_fn=gemini_embed, threshold=0.92)
+        client = LLMClient(semantic_cache=cache)
+    """
+    
+    def __init__(
+        self,
+        embed_fn: Callable[[str], Sequence[float]],
+        threshold: float = 0.92,
+        max_entries: int = 10000,
+        embed_cache_size: int = 1024
+    ):
+        """
+        Initialize cache.
+        
+        Args:
+            embed_fn: Blocking function returning an embedding for a text
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Maximum entries per namespace (oldest dropped first)
+            embed_cache_size: Embeddings memoized for repeated identical prompts
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError(
+                "numpy is not installed. Install it with: pip install numpy"
+            )
+        
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._embed = lru_cache(maxsize=embed_cache_size)(self._normalized(embed_fn))
+        self._indexes: Dict[str, "_EmbeddingIndex"] = {}
+        
+        # Metrics
+        self._hits = 0
+        self._misses = 0
+    
+    @staticmethod
+    def _normalized(embed_fn: Callable[[str], Sequence[float]]) -> Callable[[str], Any]:
+        """Wrap embed_fn to return read-only, L2-normalized float32 vectors."""
+        def embed(text: str) -> Any:
+            vector = np.asarray(embed_fn(text), dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            if norm > 0:
+                vector = vector / norm
+            vector.setflags(write=False)
+            return vector
+        return embed
+    
+    async def get(self, prompt: str, namespace: str = "") -> Optional[Any]:
+        """
+        Get the response cached for the most similar prompt.
+        
+        Args:
+            prompt: Prompt text
+            namespace: Call parameters the response depends on
+            
+        Returns:
+            Cached response, or None on a miss
+        """
+        index = self._indexes.get(namespace)
+        if index is None or index.size == 0:
+            self._misses += 1
+            return None
+        
+        embedding = await asyncio.to_thread(self._embed, prompt)
+        value = index.search(embedding, self.threshold)
+        if value is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return value
+    
+    async def set(self, prompt: str, value: Any, namespace: str = "") -> None:
+        """
+        Store a response for a prompt.
+        
+        Args:
+            prompt: Prompt text
+            value: Response to cache
+            namespace: Call parameters the response depends on
+        """
+        embedding = await asyncio.to_thread(self._embed, prompt)
+        index = self._indexes.get(namespace)
+        if index is None:
+            index = self._indexes[namespace] = _EmbeddingIndex(embedding.shape[0], self.max_entries)
+        index.add(embedding, prompt, value)
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get cache metrics."""
+        lookups = self._hits + self._misses
+        embed_info = self._embed.cache_info()
+        return {
+            "entries": sum(index.size for index in self._indexes.values()),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups > 0 else 0,
+            "embedding_cache_hits": embed_info.hits,
+            "embedding_cache_misses": embed_info.misses,
+        }
+
+
+class _EmbeddingIndex:
+    """Normalized embedding matrix with parallel (prompt, response) entries."""
+    
+    def __init__(self, dim: int, max_entries: int):
+        self.max_entries = max_entries
+        self.size = 0
+        # Rows beyond `size` are spare capacity; the buffer doubles when full
+        self._matrix = np.empty((16, dim), dtype=np.float32)
+        self._entries: List[Tuple[str, Any]] = []
+    
+    def search(self, embedding: Any, threshold: float) -> Optional[Any]:
+        """Return the response of the closest entry at or above threshold."""
+        scores = self._matrix[:self.size] @ embedding
+        best = int(scores.argmax())
+        if scores[best] >= threshold:
+            return self._entries[best][1]
+        return None
+    
+    def add(self, embedding: Any, prompt: str, value: Any) -> None:
+        """Append an entry, dropping the oldest half when at max_entries."""
+        if self.size >= self.max_entries:
+            keep = self.size // 2
+            self._matrix[:keep] = self._matrix[self.size - keep:self.size]
+            self._entries = self._entries[self.size - keep:]
+            self.size = keep
+        
+        if self.size == self._matrix.shape[0]:
+            grown = np.empty((self.size * 2, self._matrix.shape[1]), dtype=np.float32)
+            grown[:self.size] = self._matrix[:self.size]
+            self._matrix = grown
+        
+        self._matrix[self.size] = embedding
+        self._entries.append((prompt, value))
+        self.size += 1
@@ -0,0 +1,120 @@
+"""
+HTTPX LLM Client
+
+Pooled client for OpenAI-compatible chat completion APIs.
+
+One instance is meant to be shared by every agent in a process (see
+Crew.set_shared_llm_client): all calls reuse the same connection pool,
+and with HTTP/2 concurrent requests are multiplexed over a single TCP/TLS
+connection instead of each agent paying its own handshakes.
+"""
+
+from typing import Any, Dict, Optional
+import os
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class HTTPXLLMClient:
+    """
+    Shared async LLM client backed by a single httpx.AsyncClient.
+    
+    Implements the `complete()` interface used by Agent.
+    
+    Examples:
+        client = HTTPXLLMClient(base_url="https://api.openai.com/v1")
+        crew.set_shared_llm_client(client)
+        ...
+        await client.aclose()
+    """
+    
+    def __init__(
+        self,
+        base_url: str = "https://api.openai.com/v1",
+        api_key: Optional[str] = None,
+        timeout: float = 60.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 50,
+        http2: bool = True
+    ):
+        """
+        Initialize client.
+        
+        Args:
+            base_url: API base URL (OpenAI-compatible)
+            api_key: API key (defaults to OPENAI_API_KEY env var)
+            timeout: Request timeout in seconds
+            max_connections: Connection pool size
+            max_keepalive_connections: Idle connections kept open
+            http2: Use HTTP/2 when the h2 package is installed
+        """
+        self.base_url = base_url
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self.http2 = http2 and HTTP2_AVAILABLE
+        
+        headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+        
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections
+            )
+        )
+    
+    async def complete(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> str:
+        """
+        Complete a prompt.
+        
+        Args:
+            prompt: Prompt text (sent as a single user message)
+            model: Model identifier
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Extra request body fields
+            
+        Returns:
+            Completion text
+        """
+        payload: Dict[str, Any] = {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": temperature,
+            **kwargs
+        }
+        if max_tokens is not None:
+            payload["max_tokens"] = max_tokens
+        
+        response = await self._client.post("/chat/completions", json=payload)
+        response.raise_for_status()
+        
+        return response.json()["choices"][0]["message"]["content"]
+    
+    async def aclose(self) -> None:
+        """Close the connection pool."""
+        await self._client.aclose()
+    
+    async def __aenter__(self) -> "HTTPXLLMClient":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+    
+    def __repr__(self) -> str:
+        return f"HTTPXLLMClient(base_url={self.base_url}, http2={self.http2})"
@@ -65,6 +65,7 @@ class LiteLLMClient:
         max_tokens: int = 4096,
         api_key: Optional[str] = None,
         api_base: Optional[str] = None,
+        keep_raw_response: bool = False,
         **kwargs
     ):
         """
@@ -76,6 +77,8 @@ class LiteLLMClient:
             max_tokens: Maximum tokens to generate
             api_key: API key (if not set in environment)
             api_base: Custom API base URL
+            keep_raw_response: Fill LLMResponse.raw_response with the full
+                provider response (serialized on every call, so off by default)
             **kwargs: Additional provider-specific parameters
         """
         if not LITELLM_AVAILABLE:
@@ -88,6 +91,7 @@ class LiteLLMClient:
         self.max_tokens = max_tokens
         self.api_key = api_key
         self.api_base = api_base
+        self.keep_raw_response = keep_raw_response
         self.extra_params = kwargs
         
         # Set API key in environment if provided
@@ -105,51 +109,44 @@ class LiteLLMClient:
         elif model.startswith("command-"):
             os.environ["COHERE_API_KEY"] = api_key
     
-    async def generate(
+    def _build_params(
         self,
         messages: List[LLMMessage],
-        temperature: Optional[float] = None,
-        max_tokens: Optional[int] = None,
-        **kwargs
-    ) -> LLMResponse:
-        """
-        Generate completion from messages.
-        
-        Args:
-            messages: List of conversation messages
-            temperature: Override default temperature
-            max_tokens: Override default max tokens
-            **kwargs: Additional parameters
-            
-        Returns:
-            LLM response
-        """
-        # Prepare messages
-        formatted_messages = [
-            {"role": msg.role, "content": msg.content}
-            for msg in messages
-        ]
-        
-        # Prepare parameters
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        overrides: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build the LiteLLM call parameters shared by generate and generate_sync."""
+        # Message dicts are built per call rather than cached: they are
+        # handed to LiteLLM, which may modify what it is given
         params = {
             "model": self.model,
-            "messages": formatted_messages,
+            "messages": [
+                {"role": msg.role, "content": msg.content}
+                for msg in messages
+            ],
             "temperature": temperature or self.temperature,
             "max_tokens": max_tokens or self.max_tokens,
             **self.extra_params,
-            **kwargs
+            **overrides
         }
         
         if self.api_base:
             params["api_base"] = self.api_base
         
-        # Call LiteLLM
-        response = await acompletion(**params)
-        
+        return params
+    
+    def _to_response(self, response: Any) -> LLMResponse:
+        """Convert a LiteLLM response into an LLMResponse."""
         # Extract response data
         choice = response.choices[0]
         usage = response.usage
         
+        # model_dump deep-copies the whole response, so only when asked for
+        raw_response = None
+        if self.keep_raw_response and hasattr(response, 'model_dump'):
+            raw_response = response.model_dump()
+        
         return LLMResponse(
             content=choice.message.content,
             model=response.model,
@@ -157,9 +154,35 @@ class LiteLLMClient:
             completion_tokens=usage.completion_tokens,
             total_tokens=usage.total_tokens,
             finish_reason=choice.finish_reason,
-            raw_response=response.model_dump() if hasattr(response, 'model_dump') else None
+            raw_response=raw_response
         )
     
+    async def generate(
+        self,
+        messages: List[LLMMessage],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Generate completion from messages.
+        
+        Args:
+            messages: List of conversation messages
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+            **kwargs: Additional parameters
+            
+        Returns:
+            LLM response
+        """
+        params = self._build_params(messages, temperature, max_tokens, kwargs)
+        
+        # Call LiteLLM
+        response = await acompletion(**params)
+        
+        return self._to_response(response)
+    
     async def generate_text(
         self,
         prompt: str,
@@ -177,12 +200,14 @@ class LiteLLMClient:
         Returns:
             Generated text
         """
+        # Roles are fixed here and the texts are plain strings, so the
+        # messages skip validation
         messages = []
         
         if system_prompt:
-            messages.append(LLMMessage(role="system", content=system_prompt))
+            messages.append(LLMMessage.model_construct(role="system", content=system_prompt))
         
-        messages.append(LLMMessage(role="user", content=prompt))
+        messages.append(LLMMessage.model_construct(role="user", content=prompt))
         
         response = await self.generate(messages, **kwargs)
         return response.content
@@ -206,41 +231,12 @@ class LiteLLMClient:
         Returns:
             LLM response
         """
-        # Prepare messages
-        formatted_messages = [
-            {"role": msg.role, "content": msg.content}
-            for msg in messages
-        ]
-        
-        # Prepare parameters
-        params = {
-            "model": self.model,
-            "messages": formatted_messages,
-            "temperature": temperature or self.temperature,
-            "max_tokens": max_tokens or self.max_tokens,
-            **self.extra_params,
-            **kwargs
-        }
-        
-        if self.api_base:
-            params["api_base"] = self.api_base
+        params = self._build_params(messages, temperature, max_tokens, kwargs)
         
         # Call LiteLLM (sync)
         response = completion(**params)
         
-        # Extract response data
-        choice = response.choices[0]
-        usage = response.usage
-        
-        return LLMResponse(
-            content=choice.message.content,
-            model=response.model,
-            prompt_tokens=usage.prompt_tokens,
-            completion_tokens=usage.completion_tokens,
-            total_tokens=usage.total_tokens,
-            finish_reason=choice.finish_reason,
-            raw_response=response.model_dump() if hasattr(response, 'model_dump') else None
-        )
+        return self._to_response(response)
 
 
 # Convenience functions for common providers
@@ -45,9 +45,10 @@ class BaseVectorStore(ABC):
         self,
         query: str,
         k: int = 5,
-        filter: Optional[Dict[str, Any]] = None
+        filter: Optional[Dict[str, Any]] = None,
+        min_score: Optional[float] = None
     ) -> List[SearchResult]:
-        """Search for similar documents."""
+        """Search for similar documents (only those scoring at least min_score)."""
         pass
     
     @abstractmethod
@@ -71,82 +72,160 @@ class InMemoryVectorStore(BaseVectorStore):
     def __init__(self, embedding_dim: int = 1536):
         self.documents: Dict[str, Document] = {}
         self.embedding_dim = embedding_dim
-        self.embeddings: List[np.ndarray] = []
         self.ids: List[str] = []
+        self._id_to_row: Dict[str, int] = {}
+        # L2-normalized float32 embeddings, row i belonging to ids[i]; rows
+        # beyond len(ids) are spare capacity and the buffer doubles when full
+        self._matrix = np.empty((16, embedding_dim), dtype=np.float32)
+        
+        self._rng = np.random.default_rng()
+        # Reused by every search; holds the query embedding only until it is scored
+        self._query_buffer = np.empty(embedding_dim, dtype=np.float32)
     
     async def add_documents(self, documents: List[Document]) -> None:
-        """Add documents to the store."""
+        """
+        Add documents to the store.
+        
+        Raises:
+            ValueError: If an embedding does not have embedding_dim values
+                (the store is left unchanged)
+        """
+        if not documents:
+            return
+        
         for doc in documents:
             if doc.embedding is None:
                 # In production, this would call an embedding model
                 doc.embedding = self._generate_dummy_embedding()
-            
+        
+        # The whole batch is converted, checked and normalized before any
+        # bookkeeping, so a bad embedding cannot leave a row-less document
+        embeddings = np.asarray([doc.embedding for doc in documents], dtype=np.float32)
+        if embeddings.shape != (len(documents), self.embedding_dim):
+            raise ValueError(
+                f"Expected embeddings of dimension {self.embedding_dim}, "
+                f"got shape {embeddings.shape[1:]}"
+            )
+        embeddings = self._normalize_rows(embeddings)
+        
+        targets = []
+        for doc in documents:
             self.documents[doc.id] = doc
-            self.embeddings.append(np.array(doc.embedding))
-            self.ids.append(doc.id)
+            
+            # A re-added id replaces its row instead of duplicating it
+            row = self._id_to_row.get(doc.id)
+            if row is None:
+                row = self._id_to_row[doc.id] = len(self.ids)
+                self.ids.append(doc.id)
+            targets.append(row)
+        
+        self._reserve(len(self.ids))
+        self._matrix[targets] = embeddings
     
     async def search(
         self,
         query: str,
         k: int = 5,
-        filter: Optional[Dict[str, Any]] = None
+        filter: Optional[Dict[str, Any]] = None,
+        min_score: Optional[float] = None
     ) -> List[SearchResult]:
-        """Search for similar documents."""
+        """Search for similar documents (only those scoring at least min_score)."""
+        if not self.ids or k <= 0:
+            return []
+        
         # Generate query embedding
-        query_embedding = self._generate_dummy_embedding()
+        query_embedding = self._dummy_query_embedding()
         
-        # Compute similarities
-        similarities = []
-        for i, doc_embedding in enumerate(self.embeddings):
-            similarity = self._cosine_similarity(query_embedding, doc_embedding)
-            similarities.append((similarity, self.ids[i]))
+        # Apply filter if provided, before scoring, so only matching
+        # documents are scored
+        matrix = self._matrix[:len(self.ids)]
+        rows = None
+        if filter:
+            rows = np.flatnonzero(np.fromiter(
+                (self._matches_filter(self.documents[doc_id], filter) for doc_id in self.ids),
+                dtype=bool,
+                count=len(self.ids)
+            ))
+            matrix = matrix[rows]
         
-        # Sort by similarity
-        similarities.sort(reverse=True)
+        # Cosine similarity against every candidate in one matrix-vector product
+        scores = matrix @ query_embedding
+        candidates = np.arange(len(scores))
+        if min_score is not None:
+            candidates = np.flatnonzero(scores >= min_score)
         
-        # Apply filter if provided
-        if filter:
-            similarities = [
-                (score, doc_id)
-                for score, doc_id in similarities
-                if self._matches_filter(self.documents[doc_id], filter)
-            ]
+        # Top k by similarity, without sorting the rest
+        if k < len(candidates):
+            candidates = candidates[np.argpartition(scores[candidates], -k)[-k:]]
+        top = candidates[np.argsort(scores[candidates])[::-1]]
         
-        # Return top k
-        results = []
-        for score, doc_id in similarities[:k]:
-            results.append(
-                SearchResult(
-                    document=self.documents[doc_id],
-                    score=score
-                )
+        return [
+            SearchResult(
+                document=self.documents[self.ids[i if rows is None else rows[i]]],
+                score=float(scores[i])
             )
-        
-        return results
+            for i in top
+        ]
     
     async def delete(self, ids: List[str]) -> None:
         """Delete documents by ID."""
         for doc_id in ids:
-            if doc_id in self.documents:
-                idx = self.ids.index(doc_id)
-                del self.documents[doc_id]
-                del self.embeddings[idx]
-                del self.ids[idx]
+            row = self._id_to_row.pop(doc_id, None)
+            if row is None:
+                continue
+            del self.documents[doc_id]
+            
+            # Move the last row into the gap: O(1) instead of shifting every later row
+            last = len(self.ids) - 1
+            if row != last:
+                moved_id = self.ids[last]
+                self._matrix[row] = self._matrix[last]
+                self.ids[row] = moved_id
+                self._id_to_row[moved_id] = row
+            self.ids.pop()
     
     async def update(self, document: Document) -> None:
         """Update a document."""
-        if document.id in self.documents:
-            await self.delete([document.id])
+        # add_documents replaces an existing id's row in place
         await self.add_documents([document])
     
     def _generate_dummy_embedding(self) -> List[float]:
         """Generate a dummy embedding for testing."""
-        return np.random.randn(self.embedding_dim).tolist()
+        return self._rng.standard_normal(self.embedding_dim, dtype=np.float32).tolist()
+    
+    def _dummy_query_embedding(self) -> np.ndarray:
+        """
+        Generate a normalized dummy query embedding for testing.
+        
+        Written into the reused float32 query buffer (float32 like the
+        matrix, so the product is not upcast to float64); never becomes a
+        Python list since queries are not stored.
+        """
+        self._rng.standard_normal(dtype=np.float32, out=self._query_buffer)
+        norm = np.linalg.norm(self._query_buffer)
+        if norm > 0:
+            self._query_buffer /= norm
+        return self._query_buffer
+    
+    def _reserve(self, rows: int) -> None:
+        """Grow the matrix buffer (doubling) until it holds at least `rows` rows."""
+        capacity = self._matrix.shape[0]
+        if rows <= capacity:
+            return
+        
+        while capacity < rows:
+            capacity *= 2
+        grown = np.empty((capacity, self.embedding_dim), dtype=self._matrix.dtype)
+        # Rows being added in this batch are written by the caller afterwards
+        grown[:self._matrix.shape[0]] = self._matrix
+        self._matrix = grown
     
-    def _cosine_similarity(self, a: List[float], b: np.ndarray) -> float:
-        """Compute cosine similarity between two vectors."""
-        a_arr = np.array(a)
-        return float(np.dot(a_arr, b) / (np.linalg.norm(a_arr) * np.linalg.norm(b)))
+    @staticmethod
+    def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+        """Scale each row to unit length in place, so dot products are cosine similarities."""
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
     
     def _matches_filter(self, document: Document, filter: Dict[str, Any]) -> bool:
         """Check if document matches filter."""
@@ -168,7 +247,8 @@ class VectorMemory:
         provider: VectorStoreProvider = VectorStoreProvider.FAISS,
         index_name: str = "agent_memory",
         embedding_model: str = "text-embedding-3-large",
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        embedding_cache: Optional[Any] = None
     ):
         """
         Initialize vector memory.
@@ -178,11 +258,15 @@ class VectorMemory:
             index_name: Name of the index
             embedding_model: Embedding model to use
             config: Provider-specific configuration
+            embedding_cache: Optional cache exposing key(text, model),
+                get(key) -> bytes and set(key, bytes); cached float32
+                vectors are reused instead of re-embedding content
         """
         self.provider = provider
         self.index_name = index_name
         self.embedding_model = embedding_model
         self.config = config or {}
+        self.embedding_cache = embedding_cache
         
         # Initialize store
         self.store = self._create_store()
@@ -224,7 +308,23 @@ class VectorMemory:
             metadata=metadata or {}
         )
         
+        cache_key = None
+        if self.embedding_cache is not None:
+            cache_key = self.embedding_cache.key(content, self.embedding_model)
+            cached = self.embedding_cache.get(cache_key)
+            if cached is not None:
+                document.embedding = np.frombuffer(cached, dtype=np.float32).tolist()
+                cache_key = None
+        
         await self.store.add_documents([document])
+        
+        # The store filled in the embedding on a miss; keep it for next time
+        if cache_key is not None and document.embedding is not None:
+            self.embedding_cache.set(
+                cache_key,
+                np.asarray(document.embedding, dtype=np.float32).tobytes()
+            )
+        
         return doc_id
     
     async def search(
@@ -246,12 +346,13 @@ class VectorMemory:
         Returns:
             List of search results
         """
-        results = await self.store.search(query, k=k, filter=filter)
-        
-        # Filter by threshold
-        results = [r for r in results if r.score >= similarity_threshold]
-        
-        return results
+        # The store drops results below the threshold before picking the top k
+        return await self.store.search(
+            query,
+            k=k,
+            filter=filter,
+            min_score=similarity_threshold
+        )
     
     async def delete(self, ids: List[str]) -> None:
         """Delete documents from memory."""
@@ -44,29 +44,44 @@ class MetricsCollector:
             'Total number of guardrail violations',
             ['guard_name', 'guard_type']
         )
+        
+        # Metric name -> metric, so recording is one dict lookup instead
+        # of a chain of string comparisons
+        self._counters: Dict[str, Counter] = {
+            "agent.executions": self.agent_executions,
+            "retry.attempts": self.retry_attempts,
+            "guardrail.violations": self.guardrail_violations,
+        }
+        self._histograms: Dict[str, Histogram] = {
+            "agent.execution_time": self.agent_execution_duration,
+        }
+        self._gauges: Dict[str, Gauge] = {
+            "circuit_breaker.state": self.circuit_breaker_state,
+        }
     
     def increment(self, metric_name: str, tags: Optional[Dict[str, str]] = None) -> None:
         """Increment a counter metric."""
-        if metric_name == "agent.executions":
-            self.agent_executions.labels(**tags or {}).inc()
-        elif metric_name == "retry.attempts":
-            self.retry_attempts.labels(**tags or {}).inc()
-        elif metric_name == "guardrail.violations":
-            self.guardrail_violations.labels(**tags or {}).inc()
+        counter = self._counters.get(metric_name)
+        if counter is not None:
+            counter.labels(**tags or {}).inc()
     
     @contextmanager
     def timer(self, metric_name: str, tags: Optional[Dict[str, str]] = None):
         """Context manager for timing operations."""
-        start_time = time.time()
+        histogram = self._histograms.get(metric_name)
+        
+        # Monotonic and ns-resolution, unlike wall-clock time.time()
+        start_ns = time.perf_counter_ns()
         try:
             yield
         finally:
-            duration = time.time() - start_time
-            if metric_name == "agent.execution_time":
-                self.agent_execution_duration.labels(**tags or {}).observe(duration)
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
+            if histogram is not None:
+                histogram.labels(**tags or {}).observe(duration)
     
     def set_gauge(self, metric_name: str, value: float, tags: Optional[Dict[str, str]] = None) -> None:
         """Set a gauge metric value."""
-        if metric_name == "circuit_breaker.state":
-            self.circuit_breaker_state.labels(**tags or {}).set(value)
+        gauge = self._gauges.get(metric_name)
+        if gauge is not None:
+            gauge.labels(**tags or {}).set(value)
 
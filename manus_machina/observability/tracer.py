@@ -1,10 +1,16 @@
 """Distributed tracing for observability."""
 
+from typing import Optional
 from opentelemetry import trace
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import ConsoleSpanExporter, BatchSpanProcessor
 
 
+# Installed once: each BatchSpanProcessor starts its own export thread, and
+# OpenTelemetry ignores any provider set after the first
+_provider: Optional[TracerProvider] = None
+
+
 def get_tracer(name: str) -> trace.Tracer:
     """
     Get a distributed tracer.
@@ -15,11 +21,14 @@ def get_tracer(name: str) -> trace.Tracer:
     Returns:
         Tracer instance
     """
+    global _provider
+    
     # Setup tracer provider
-    provider = TracerProvider()
-    processor = BatchSpanProcessor(ConsoleSpanExporter())
-    provider.add_span_processor(processor)
-    trace.set_tracer_provider(provider)
+    if _provider is None:
+        _provider = TracerProvider()
+        processor = BatchSpanProcessor(ConsoleSpanExporter())
+        _provider.add_span_processor(processor)
+        trace.set_tracer_provider(_provider)
     
     return trace.get_tracer(name)
 
@@ -1,12 +1,18 @@
 """Saga pattern implementation for distributed transactions."""
 
-from typing import Callable, Any, Dict, List, Optional, Awaitable
-from pydantic import BaseModel, Field
+from typing import Callable, Any, Dict, List, Optional, Awaitable, Tuple
 from enum import Enum
 from datetime import datetime
+from functools import lru_cache
 import asyncio
 
 
+@lru_cache(maxsize=4096)
+def _isoformat(timestamp: Optional[datetime]) -> Optional[str]:
+    """Format a timestamp; each one is written once but read on every status poll."""
+    return timestamp.isoformat() if timestamp else None
+
+
 class SagaStepStatus(str, Enum):
     """Status of a saga step."""
     PENDING = "pending"
@@ -27,7 +33,7 @@ class SagaStatus(str, Enum):
     COMPENSATED = "compensated"
 
 
-class SagaStep(BaseModel):
+class SagaStep:
     """
     A step in a saga transaction.
     
@@ -36,17 +42,51 @@ class SagaStep(BaseModel):
     - A compensation action to undo (rollback)
     """
     
-    name: str = Field(..., description="Step name")
-    action: Any = Field(..., description="Forward action callable")
-    compensation: Any = Field(..., description="Compensation action callable")
-    status: SagaStepStatus = Field(default=SagaStepStatus.PENDING)
-    result: Optional[Any] = Field(default=None, description="Step execution result")
-    error: Optional[str] = Field(default=None, description="Error message if failed")
-    started_at: Optional[datetime] = Field(default=None)
-    completed_at: Optional[datetime] = Field(default=None)
+    # Steps only hold callables and bookkeeping, so there is nothing for
+    # model validation to check; no per-instance __dict__ either
+    __slots__ = (
+        "name",
+        "action",
+        "compensation",
+        "depends_on",
+        "result_key",
+        "status",
+        "result",
+        "error",
+        "started_at",
+        "completed_at",
+    )
+    
+    def __init__(
+        self,
+        name: str,
+        action: Callable[..., Awaitable[Any]],
+        compensation: Callable[..., Awaitable[Any]],
+        depends_on: Optional[List[str]] = None
+    ):
+        """
+        Initialize step.
+        
+        Args:
+            name: Step name
+            action: Forward action callable
+            compensation: Compensation action callable
+            depends_on: Steps that must complete first (None = all prior steps)
+        """
+        self.name = name
+        self.action = action
+        self.compensation = compensation
+        self.depends_on = depends_on
+        # Context key the step's result is stored under, built once
+        self.result_key = f"{name}_result"
+        self.status = SagaStepStatus.PENDING
+        self.result: Optional[Any] = None  # Step execution result
+        self.error: Optional[str] = None  # Error message if failed
+        self.started_at: Optional[datetime] = None
+        self.completed_at: Optional[datetime] = None
     
-    class Config:
-        arbitrary_types_allowed = True
+    def __repr__(self) -> str:
+        return f"SagaStep(name={self.name}, status={self.status})"
 
 
 class SagaCoordinationType(str, Enum):
@@ -81,12 +121,16 @@ class Saga:
         self.started_at: Optional[datetime] = None
         self.completed_at: Optional[datetime] = None
         self.error: Optional[str] = None
+        
+        # Validated dependency graph, built on first execute
+        self._graph: Optional[Tuple[Dict[str, List[str]], Dict[str, List[str]]]] = None
     
     def add_step(
         self,
         name: str,
         action: Callable[..., Awaitable[Any]],
-        compensation: Callable[..., Awaitable[Any]]
+        compensation: Callable[..., Awaitable[Any]],
+        depends_on: Optional[List[str]] = None
     ) -> "Saga":
         """
         Add a step to the saga.
@@ -95,16 +139,27 @@ class Saga:
             name: Step name
             action: Forward action (async function)
             compensation: Compensation action (async function)
+            depends_on: Steps this one needs. Defaults to every step added
+                before it; pass [] for a step that can run right away
             
         Returns:
             Self for chaining
+            
+        Raises:
+            ValueError: If the saga already has a step with this name
         """
+        # Dependencies refer to steps by name, so names must be unique
+        if any(step.name == name for step in self.steps):
+            raise ValueError(f"Saga '{self.name}' already has a step named '{name}'")
+        
         step = SagaStep(
             name=name,
             action=action,
-            compensation=compensation
+            compensation=compensation,
+            depends_on=depends_on
         )
         self.steps.append(step)
+        self._graph = None
         return self
     
     async def execute(self, initial_context: Optional[Dict[str, Any]] = None) -> Any:
@@ -127,41 +182,58 @@ class Saga:
         self.status = SagaStatus.RUNNING
         self.started_at = datetime.utcnow()
         
+        # Completed steps in the order they actually finished
         completed_steps: List[SagaStep] = []
         
+        by_name = {step.name: step for step in self.steps}
+        running: Dict[asyncio.Task, SagaStep] = {}
+        failure: Optional[Tuple[SagaStep, BaseException]] = None
+        
+        def launch(names: List[str]) -> None:
+            for name in names:
+                step = by_name[name]
+                running[asyncio.create_task(self._run_step(step, completed_steps))] = step
+        
         try:
-            # Execute each step in sequence
-            for step in self.steps:
-                step.status = SagaStepStatus.RUNNING
-                step.started_at = datetime.utcnow()
-                
-                try:
-                    # Execute the action
-                    result = await step.action(self.context)
-                    
-                    # Store result in context for next steps
-                    self.context[f"{step.name}_result"] = result
-                    
-                    step.result = result
-                    step.status = SagaStepStatus.COMPLETED
-                    step.completed_at = datetime.utcnow()
-                    completed_steps.append(step)
-                    
-                except Exception as e:
-                    # Step failed, trigger compensation
-                    step.status = SagaStepStatus.FAILED
-                    step.error = str(e)
-                    step.completed_at = datetime.utcnow()
-                    
-                    self.status = SagaStatus.FAILED
-                    self.error = f"Step '{step.name}' failed: {e}"
-                    
-                    # Compensate all completed steps in reverse order
-                    await self._compensate(completed_steps)
+            if self._graph is None:
+                self._graph = self._dependency_graph()
+            dependencies, dependents = self._graph
+            pending = {name: len(deps) for name, deps in dependencies.items()}
+            
+            # Each step starts as soon as its own dependencies complete,
+            # not when every step started alongside it has finished
+            launch([name for name, count in pending.items() if count == 0])
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step = running.pop(task)
+                    error = task.exception()
+                    if error is not None:
+                        if failure is None:
+                            failure = (step, error)
+                        continue
                     
-                    raise SagaFailedError(
-                        f"Saga '{self.name}' failed at step '{step.name}': {e}"
-                    ) from e
+                    # After a failure nothing new starts; running steps finish
+                    # so they can be compensated
+                    if failure is None:
+                        ready = []
+                        for dependent in dependents[step.name]:
+                            pending[dependent] -= 1
+                            if pending[dependent] == 0:
+                                ready.append(dependent)
+                        launch(ready)
+            
+            if failure is not None:
+                step, e = failure
+                self.status = SagaStatus.FAILED
+                self.error = f"Step '{step.name}' failed: {e}"
+                
+                # Compensate all completed steps in reverse completion order
+                await self._compensate(completed_steps, dependencies, dependents)
+                
+                raise SagaFailedError(
+                    f"Saga '{self.name}' failed at step '{step.name}': {e}"
+                ) from e
             
             # All steps completed successfully
             self.status = SagaStatus.COMPLETED
@@ -177,30 +249,148 @@ class Saga:
                 self.status = SagaStatus.FAILED
             self.completed_at = datetime.utcnow()
             raise
+        
+        finally:
+            # Only left running if execute itself was cancelled
+            for task in running:
+                task.cancel()
+    
+    async def _run_step(self, step: SagaStep, completed_steps: List[SagaStep]) -> Any:
+        """Run one step's action, recording its result or failure."""
+        step.status = SagaStepStatus.RUNNING
+        step.started_at = datetime.utcnow()
+        
+        try:
+            # Execute the action
+            result = await step.action(self.context)
+        except Exception as e:
+            step.status = SagaStepStatus.FAILED
+            step.error = str(e)
+            step.completed_at = datetime.utcnow()
+            raise
+        
+        # Store result in context for next steps
+        self.context[step.result_key] = result
+        
+        step.result = result
+        step.status = SagaStepStatus.COMPLETED
+        step.completed_at = datetime.utcnow()
+        completed_steps.append(step)
+        return result
+    
+    def _dependency_graph(self) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+        """
+        Build the step dependency graph, checked before anything runs.
+        
+        Returns:
+            The steps each step depends on (in step order), and the steps
+            depending on each step
+            
+        Raises:
+            ValueError: On an unknown dependency or a dependency cycle
+        """
+        names = {step.name for step in self.steps}
+        dependencies: Dict[str, List[str]] = {}
+        dependents: Dict[str, List[str]] = {step.name: [] for step in self.steps}
+        
+        for i, step in enumerate(self.steps):
+            if step.depends_on is None:
+                deps = [prior.name for prior in self.steps[:i]]
+            else:
+                deps = step.depends_on
+            for dep in deps:
+                if dep not in names:
+                    raise ValueError(f"Step '{step.name}' depends on unknown step '{dep}'")
+                dependents[dep].append(step.name)
+            dependencies[step.name] = deps
+        
+        # Kahn's algorithm: every step must become ready at some point
+        remaining = {name: len(deps) for name, deps in dependencies.items()}
+        ready = [name for name, count in remaining.items() if count == 0]
+        visited = 0
+        while ready:
+            name = ready.pop()
+            visited += 1
+            for dependent in dependents[name]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+        
+        if visited != len(self.steps):
+            raise ValueError(f"Saga '{self.name}' has a dependency cycle")
+        
+        return dependencies, dependents
     
-    async def _compensate(self, completed_steps: List[SagaStep]) -> None:
+    async def _compensate(
+        self,
+        completed_steps: List[SagaStep],
+        dependencies: Dict[str, List[str]],
+        dependents: Dict[str, List[str]]
+    ) -> None:
         """
-        Execute compensation for completed steps in reverse order.
+        Execute compensation for completed steps in reverse dependency order.
+        
+        A step is undone only after every completed step that depends on it
+        has been undone; steps unrelated to each other are undone
+        concurrently. With the default dependencies (all prior steps) this
+        is strictly reverse completion order.
         
         Args:
-            completed_steps: Steps to compensate
+            completed_steps: Steps to compensate, in the order they completed
+            dependencies: The steps each step depends on
+            dependents: The steps depending on each step
         """
         self.status = SagaStatus.COMPENSATING
         
-        # Compensate in reverse order
-        for step in reversed(completed_steps):
-            step.status = SagaStepStatus.COMPENSATING
-            
-            try:
-                await step.compensation(self.context)
-                step.status = SagaStepStatus.COMPENSATED
-                
-            except Exception as e:
-                # Compensation failed - this is critical
-                step.error = f"Compensation failed: {e}"
-                raise SagaCompensationError(
-                    f"Failed to compensate step '{step.name}': {e}"
-                ) from e
+        by_name = {step.name: step for step in completed_steps}
+        blocking = {
+            step.name: sum(1 for dependent in dependents[step.name] if dependent in by_name)
+            for step in completed_steps
+        }
+        running: Dict[asyncio.Task, SagaStep] = {}
+        failures: List[Tuple[SagaStep, BaseException]] = []
+        
+        def launch(steps: List[SagaStep]) -> None:
+            for step in steps:
+                step.status = SagaStepStatus.COMPENSATING
+                running[asyncio.create_task(step.compensation(self.context))] = step
+        
+        try:
+            launch([step for step in reversed(completed_steps) if blocking[step.name] == 0])
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step = running.pop(task)
+                    error = task.exception()
+                    if error is not None:
+                        # Compensation failed - this is critical
+                        step.error = f"Compensation failed: {error}"
+                        failures.append((step, error))
+                        continue
+                    
+                    step.status = SagaStepStatus.COMPENSATED
+                    
+                    # After a failure nothing new starts, so no step is undone
+                    # while something depending on it may still be in effect
+                    if not failures:
+                        ready = []
+                        for dep in dependencies[step.name]:
+                            if dep in blocking:
+                                blocking[dep] -= 1
+                                if blocking[dep] == 0:
+                                    ready.append(by_name[dep])
+                        launch(ready)
+        finally:
+            # Only left running if compensation itself was cancelled
+            for task in running:
+                task.cancel()
+        
+        if failures:
+            step, e = failures[0]
+            error = SagaCompensationError(f"Failed to compensate step '{step.name}': {e}")
+            for other, other_error in failures[1:]:
+                error.add_note(f"Also failed to compensate step '{other.name}': {other_error}")
+            raise error from e
         
         self.status = SagaStatus.COMPENSATED
     
@@ -210,15 +400,15 @@ class Saga:
             "name": self.name,
             "status": self.status,
             "coordination_type": self.coordination_type,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "started_at": _isoformat(self.started_at),
+            "completed_at": _isoformat(self.completed_at),
             "error": self.error,
             "steps": [
                 {
                     "name": step.name,
                     "status": step.status,
-                    "started_at": step.started_at.isoformat() if step.started_at else None,
-                    "completed_at": step.completed_at.isoformat() if step.completed_at else None,
+                    "started_at": _isoformat(step.started_at),
+                    "completed_at": _isoformat(step.completed_at),
                     "error": step.error,
                 }
                 for step in self.steps
@@ -250,13 +440,75 @@ class SagaBuilder:
         self,
         name: str,
         action: Callable[..., Awaitable[Any]],
-        compensation: Callable[..., Awaitable[Any]]
+        compensation: Callable[..., Awaitable[Any]],
+        depends_on: Optional[List[str]] = None
     ) -> "SagaBuilder":
         """Add a step to the saga."""
-        self.saga.add_step(name, action, compensation)
+        self.saga.add_step(name, action, compensation, depends_on)
         return self
     
     def build(self) -> Saga:
         """Build and return the saga."""
         return self.saga
 
+
+class SagaTemplate:
+    """
+    Reusable saga definition for sagas run once per request.
+    
+    Steps are declared once; instantiate() returns a fresh Saga (steps
+    carry per-run status, so they are not shared) that reuses the
+    template's already validated dependency graph.
+    
+    Examples:
+        booking = SagaTemplate("booking")
+        booking.add_step("reserve", reserve, release)
+        booking.add_step("charge", charge, refund)
+        
+        result = await booking.instantiate().execute({"order": order})
+    """
+    
+    __slots__ = ("name", "coordination_type", "_specs", "_graph")
+    
+    def __init__(
+        self,
+        name: str,
+        coordination_type: SagaCoordinationType = SagaCoordinationType.ORCHESTRATION
+    ):
+        self.name = name
+        self.coordination_type = coordination_type
+        self._specs: List[Tuple[Any, ...]] = []  # Saga.add_step arguments
+        self._graph: Optional[Tuple[Dict[str, List[str]], Dict[str, List[str]]]] = None
+    
+    def add_step(
+        self,
+        name: str,
+        action: Callable[..., Awaitable[Any]],
+        compensation: Callable[..., Awaitable[Any]],
+        depends_on: Optional[List[str]] = None
+    ) -> "SagaTemplate":
+        """Add a step to the template (same arguments and errors as Saga.add_step)."""
+        if any(spec[0] == name for spec in self._specs):
+            raise ValueError(f"Saga '{self.name}' already has a step named '{name}'")
+        
+        if depends_on is not None:
+            depends_on = list(depends_on)
+        self._specs.append((name, action, compensation, depends_on))
+        self._graph = None
+        return self
+    
+    def instantiate(self) -> Saga:
+        """
+        Create a saga ready to execute.
+        
+        Raises:
+            ValueError: On an unknown dependency or a dependency cycle
+        """
+        saga = Saga(self.name, self.coordination_type)
+        for spec in self._specs:
+            saga.add_step(*spec)
+        
+        if self._graph is None:
+            self._graph = saga._dependency_graph()
+        saga._graph = self._graph
+        return saga
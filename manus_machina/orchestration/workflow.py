@@ -1,10 +1,13 @@
 """Workflow orchestration similar to LangGraph."""
 
 from typing import Any, Dict, List, Optional, Callable, Awaitable
-from pydantic import BaseModel, Field
 from enum import Enum
 
 
+# Name of the implicit terminal node
+END = "__end__"
+
+
 class NodeType(str, Enum):
     """Type of workflow node."""
     AGENT = "agent"
@@ -12,15 +15,30 @@ class NodeType(str, Enum):
     CONDITION = "condition"
 
 
-class WorkflowNode(BaseModel):
+class WorkflowNode:
     """A node in the workflow graph."""
     
-    name: str = Field(..., description="Node name")
-    node_type: NodeType = Field(..., description="Node type")
-    handler: Any = Field(..., description="Node handler (agent or function)")
+    # Plain slotted class: the handler is arbitrary, so validation has
+    # nothing to check
+    __slots__ = ("name", "node_type", "handler", "result_key")
+    
+    def __init__(self, name: str, node_type: NodeType, handler: Any):
+        """
+        Initialize node.
+        
+        Args:
+            name: Node name
+            node_type: Node type
+            handler: Node handler (agent or function)
+        """
+        self.name = name
+        self.node_type = node_type
+        self.handler = handler
+        # State key the node's result is stored under, built once
+        self.result_key = f"{name}_result"
     
-    class Config:
-        arbitrary_types_allowed = True
+    def __repr__(self) -> str:
+        return f"WorkflowNode(name={self.name}, node_type={self.node_type})"
 
 
 class Workflow:
@@ -36,6 +54,10 @@ class Workflow:
         self.edges: Dict[str, List[str]] = {}
         self.conditional_edges: Dict[str, Callable] = {}
         self.entry_point: Optional[str] = None
+        
+        # Node -> function of the state returning the next node; built on
+        # first execute and dropped whenever an edge is added
+        self._transitions: Optional[Dict[str, Callable[[Any], str]]] = None
     
     def add_node(
         self,
@@ -75,6 +97,7 @@ class Workflow:
         if from_node not in self.edges:
             self.edges[from_node] = []
         self.edges[from_node].append(to_node)
+        self._transitions = None
         return self
     
     def add_conditional_edge(
@@ -94,11 +117,14 @@ class Workflow:
         Returns:
             Self for chaining
         """
+        # Called straight from the transition table on every step
+        lookup = edge_mapping.get
+        
         def conditional_router(state: Any) -> str:
-            edge_key = condition(state)
-            return edge_mapping.get(edge_key, "__end__")
+            return lookup(condition(state), END)
         
         self.conditional_edges[from_node] = conditional_router
+        self._transitions = None
         return self
     
     def set_entry_point(self, node_name: str) -> "Workflow":
@@ -122,7 +148,11 @@ class Workflow:
         state = initial_state or {}
         current_node = self.entry_point
         
-        while current_node != "__end__":
+        transitions = self._transitions
+        if transitions is None:
+            transitions = self._transitions = self._compile_transitions()
+        
+        while current_node != END:
             # Execute current node
             node = self.nodes.get(current_node)
             if not node:
@@ -139,19 +169,32 @@ class Workflow:
             
             # Update state
             state["last_result"] = result
-            state[f"{current_node}_result"] = result
+            state[node.result_key] = result
             
             # Determine next node
-            if current_node in self.conditional_edges:
-                current_node = self.conditional_edges[current_node](state)
-            elif current_node in self.edges:
-                next_nodes = self.edges[current_node]
-                current_node = next_nodes[0] if next_nodes else "__end__"
-            else:
-                current_node = "__end__"
+            current_node = transitions.get(current_node, _to_end)(state)
         
         return state
     
+    def _compile_transitions(self) -> Dict[str, Callable[[Any], str]]:
+        """Resolve each node's outgoing edge once, conditional edges first."""
+        transitions: Dict[str, Callable[[Any], str]] = {}
+        for name, next_nodes in self.edges.items():
+            transitions[name] = _static_transition(next_nodes[0]) if next_nodes else _to_end
+        transitions.update(self.conditional_edges)
+        return transitions
+    
     def __repr__(self) -> str:
         return f"Workflow(name={self.name}, nodes={len(self.nodes)}, edges={len(self.edges)})"
 
+
+def _to_end(state: Any) -> str:
+    """Transition of a node without outgoing edges."""
+    return END
+
+
+def _static_transition(next_node: str) -> Callable[[Any], str]:
+    """Transition of a node with a fixed outgoing edge."""
+    def transition(state: Any) -> str:
+        return next_node
+    return transition
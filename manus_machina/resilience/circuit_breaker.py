@@ -1,14 +1,24 @@
 """Circuit Breaker pattern implementation."""
 
-from typing import Callable, Any, Optional, TypeVar, ParamSpec
-from pydantic import BaseModel, Field
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Any, Optional, Tuple, Type
+from pydantic import BaseModel, Field, field_validator
 from enum import Enum
 from datetime import datetime, timedelta
 import asyncio
+import time
 from functools import wraps
 
-T = TypeVar('T')
-P = ParamSpec('P')
+# Annotations are never evaluated at runtime, so the type variables only
+# need to exist for type checkers
+if TYPE_CHECKING:
+    from typing import ParamSpec, TypeVar
+    
+    T = TypeVar('T')
+    P = ParamSpec('P')
+
+_EPOCH = datetime(1970, 1, 1)
 
 
 class CircuitState(str, Enum):
@@ -36,10 +46,20 @@ class CircuitBreakerConfig(BaseModel):
         description="Seconds to wait before attempting recovery (half-open)",
         gt=0
     )
-    expected_exceptions: tuple = Field(
+    expected_exceptions: Tuple[Type[BaseException], ...] = Field(
         default=(Exception,),
         description="Exceptions that count as failures"
     )
+    
+    @field_validator("expected_exceptions", mode="before")
+    @classmethod
+    def _to_exception_tuple(cls, value: Any) -> Tuple[Type[BaseException], ...]:
+        """Accept a single exception class as well as a tuple of them."""
+        exceptions = (value,) if isinstance(value, type) else tuple(value)
+        for exc in exceptions:
+            if not (isinstance(exc, type) and issubclass(exc, BaseException)):
+                raise ValueError(f"{exc!r} is not an exception type")
+        return exceptions
 
 
 class CircuitBreakerOpenError(Exception):
@@ -65,10 +85,17 @@ class CircuitBreaker:
         self.config = config
         self.state = CircuitState.CLOSED
         
+        # Looked up by every call's except clause
+        self._expected_exceptions = config.expected_exceptions
+        
         self._failure_count = 0
         self._success_count = 0
-        self._last_failure_time: Optional[datetime] = None
-        self._last_state_change: datetime = datetime.utcnow()
+        
+        # Monotonic timestamps: cheap to take on every call and immune to
+        # wall-clock jumps; converted to datetimes only for display
+        self._clock_offset = time.time() - time.monotonic()
+        self._last_failure_at: Optional[float] = None
+        self._last_state_change_at = time.monotonic()
         
         # Metrics
         self._total_calls = 0
@@ -92,42 +119,56 @@ class CircuitBreaker:
             CircuitBreakerOpenError: If circuit is open
             Exception: Original exception if call fails
         """
+        return await self._call(func, asyncio.iscoroutinefunction(func), args, kwargs)
+    
+    async def _call(
+        self,
+        func: Callable[..., Any],
+        is_async: bool,
+        args: tuple,
+        kwargs: dict
+    ) -> Any:
+        """Run a protected call with func's sync/async kind already resolved."""
         self._total_calls += 1
         
         # Check if circuit should transition from OPEN to HALF_OPEN
-        if self.state == CircuitState.OPEN:
+        if self.state is CircuitState.OPEN:
             if self._should_attempt_reset():
                 self._transition_to_half_open()
             else:
                 self._total_rejected += 1
                 raise CircuitBreakerOpenError(
                     f"Circuit breaker '{self.name}' is OPEN. "
-                    f"Last failure: {self._last_failure_time}"
+                    f"Last failure: {self._to_datetime(self._last_failure_at)}"
                 )
         
         try:
             # Execute the function
-            if asyncio.iscoroutinefunction(func):
+            if is_async:
                 result = await func(*args, **kwargs)
             else:
                 result = func(*args, **kwargs)
-            
-            # Record success
-            self._on_success()
-            return result
-            
-        except self.config.expected_exceptions as e:
+        except self._expected_exceptions:
             # Record failure
             self._on_failure()
             raise
+        
+        # Record success; while CLOSED a success cannot change state, so
+        # skip the general handler on this (by far most common) path
+        if self.state is CircuitState.CLOSED:
+            self._total_successes += 1
+            self._failure_count = 0
+            self._success_count += 1
+        else:
+            self._on_success()
+        return result
     
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt reset."""
-        if self._last_failure_time is None:
+        if self._last_failure_at is None:
             return True
         
-        elapsed = datetime.utcnow() - self._last_failure_time
-        return elapsed >= timedelta(seconds=self.config.timeout_seconds)
+        return time.monotonic() - self._last_failure_at >= self.config.timeout_seconds
     
     def _on_success(self) -> None:
         """Handle successful call."""
@@ -144,7 +185,7 @@ class CircuitBreaker:
         self._total_failures += 1
         self._failure_count += 1
         self._success_count = 0
-        self._last_failure_time = datetime.utcnow()
+        self._last_failure_at = time.monotonic()
         
         if self.state == CircuitState.CLOSED:
             if self._failure_count >= self.config.failure_threshold:
@@ -156,20 +197,20 @@ class CircuitBreaker:
     def _transition_to_open(self) -> None:
         """Transition to OPEN state."""
         self.state = CircuitState.OPEN
-        self._last_state_change = datetime.utcnow()
+        self._last_state_change_at = time.monotonic()
         self._success_count = 0
     
     def _transition_to_half_open(self) -> None:
         """Transition to HALF_OPEN state."""
         self.state = CircuitState.HALF_OPEN
-        self._last_state_change = datetime.utcnow()
+        self._last_state_change_at = time.monotonic()
         self._failure_count = 0
         self._success_count = 0
     
     def _transition_to_closed(self) -> None:
         """Transition to CLOSED state."""
         self.state = CircuitState.CLOSED
-        self._last_state_change = datetime.utcnow()
+        self._last_state_change_at = time.monotonic()
         self._failure_count = 0
         self._success_count = 0
     
@@ -188,10 +229,17 @@ class CircuitBreaker:
             "total_rejected": self._total_rejected,
             "failure_count": self._failure_count,
             "success_count": self._success_count,
-            "last_failure_time": self._last_failure_time.isoformat() if self._last_failure_time else None,
-            "last_state_change": self._last_state_change.isoformat(),
+            "last_failure_time": self._to_datetime(self._last_failure_at).isoformat()
+                if self._last_failure_at is not None else None,
+            "last_state_change": self._to_datetime(self._last_state_change_at).isoformat(),
         }
     
+    def _to_datetime(self, monotonic_time: Optional[float]) -> Optional[datetime]:
+        """Convert a monotonic timestamp to a naive UTC datetime."""
+        if monotonic_time is None:
+            return None
+        return _EPOCH + timedelta(seconds=self._clock_offset + monotonic_time)
+    
     def __repr__(self) -> str:
         return f"CircuitBreaker(name={self.name}, state={self.state})"
 
@@ -211,9 +259,12 @@ def circuit_breaker(name: str, config: Optional[CircuitBreakerConfig] = None):
     cb = CircuitBreaker(name, config)
     
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        # The wrapped function never changes, so its kind is resolved once
+        is_async = asyncio.iscoroutinefunction(func)
+        
         @wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            return await cb.call(func, *args, **kwargs)
+            return await cb._call(func, is_async, args, kwargs)
         return wrapper
     
     return decorator
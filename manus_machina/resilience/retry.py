@@ -1,15 +1,24 @@
 """Retry pattern implementation with exponential backoff and jitter."""
 
-from typing import Callable, Any, Optional, TypeVar, ParamSpec, Type
-from pydantic import BaseModel, Field
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Any, Dict, List, Optional, Tuple, Type
+from pydantic import BaseModel, Field, field_validator
 from enum import Enum
 import asyncio
+import math
 import random
 import time
+import weakref
 from functools import wraps
 
-T = TypeVar('T')
-P = ParamSpec('P')
+# Annotations are never evaluated at runtime, so the type variables only
+# need to exist for type checkers
+if TYPE_CHECKING:
+    from typing import ParamSpec, TypeVar
+    
+    T = TypeVar('T')
+    P = ParamSpec('P')
 
 
 class BackoffStrategy(str, Enum):
@@ -38,7 +47,7 @@ class RetryConfig(BaseModel):
     multiplier: float = Field(default=2.0, description="Backoff multiplier", gt=1.0)
     
     # Retry conditions
-    retry_on_exceptions: tuple = Field(
+    retry_on_exceptions: Tuple[Type[BaseException], ...] = Field(
         default=(Exception,),
         description="Exceptions to retry on"
     )
@@ -46,6 +55,16 @@ class RetryConfig(BaseModel):
         default=None,
         description="Function to determine if result should trigger retry"
     )
+    
+    @field_validator("retry_on_exceptions", mode="before")
+    @classmethod
+    def _to_exception_tuple(cls, value: Any) -> Tuple[Type[BaseException], ...]:
+        """Accept a single exception class as well as a tuple of them."""
+        exceptions = (value,) if isinstance(value, type) else tuple(value)
+        for exc in exceptions:
+            if not (isinstance(exc, type) and issubclass(exc, BaseException)):
+                raise ValueError(f"{exc!r} is not an exception type")
+        return exceptions
 
 
 class RetryExhaustedError(Exception):
@@ -53,6 +72,56 @@ class RetryExhaustedError(Exception):
     pass
 
 
+class RetryScheduler:
+    """
+    Backoff sleep that coalesces wakeups of concurrent retries.
+    
+    Deadlines are rounded up to slots of `granularity` seconds and every
+    retry due in the same slot waits on one shared event-loop timer, so a
+    burst of failing calls costs one timer per slot instead of one per
+    call. Wakeups are never early and at most about one slot late.
+    """
+    
+    def __init__(self, granularity: float = 0.01):
+        """
+        Initialize scheduler.
+        
+        Args:
+            granularity: Slot width in seconds
+        """
+        self.granularity = granularity
+        # Futures belong to one loop, so slots are kept per loop
+        self._slots: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    
+    async def sleep(self, delay: float) -> None:
+        """Sleep for at least `delay` seconds."""
+        loop = asyncio.get_running_loop()
+        slots = self._slots.get(loop)
+        if slots is None:
+            slots = self._slots[loop] = {}
+        
+        slot = math.ceil((loop.time() + delay) / self.granularity)
+        waiters = slots.get(slot)
+        if waiters is None:
+            waiters = slots[slot] = []
+            loop.call_at(slot * self.granularity, self._wake, slots, slot)
+        
+        future = loop.create_future()
+        waiters.append(future)
+        await future
+    
+    @staticmethod
+    def _wake(slots: Dict[int, List[asyncio.Future]], slot: int) -> None:
+        for future in slots.pop(slot):
+            # Cancelled sleepers are already done
+            if not future.done():
+                future.set_result(None)
+
+
+# Shared by every RetryPolicy so their backoff timers coalesce
+_retry_scheduler = RetryScheduler()
+
+
 class RetryPolicy:
     """
     Retry policy with exponential backoff and jitter.
@@ -65,6 +134,13 @@ class RetryPolicy:
         self.name = name
         self.config = config
         
+        # Jitter draws from the policy's own generator, leaving the global
+        # random state to the application (and seedable per policy)
+        self._rng = random.Random()
+        
+        # Looked up by every attempt's except clause
+        self._retry_exceptions = config.retry_on_exceptions
+        
         # Metrics
         self._total_calls = 0
         self._total_retries = 0
@@ -91,6 +167,16 @@ class RetryPolicy:
         Raises:
             RetryExhaustedError: If all retry attempts fail
         """
+        return await self._execute(func, asyncio.iscoroutinefunction(func), args, kwargs)
+    
+    async def _execute(
+        self,
+        func: Callable[..., Any],
+        is_async: bool,
+        args: tuple,
+        kwargs: dict
+    ) -> Any:
+        """Run the retry loop with func's sync/async kind already resolved."""
         self._total_calls += 1
         last_exception: Optional[Exception] = None
         previous_delay = self.config.base_delay
@@ -98,7 +184,7 @@ class RetryPolicy:
         for attempt in range(1, self.config.max_attempts + 1):
             try:
                 # Execute the function
-                if asyncio.iscoroutinefunction(func):
+                if is_async:
                     result = await func(*args, **kwargs)
                 else:
                     result = func(*args, **kwargs)
@@ -108,7 +194,7 @@ class RetryPolicy:
                     if attempt < self.config.max_attempts:
                         delay = self._calculate_delay(attempt, previous_delay)
                         previous_delay = delay
-                        await asyncio.sleep(delay)
+                        await _retry_scheduler.sleep(delay)
                         self._total_retries += 1
                         continue
                 
@@ -116,14 +202,14 @@ class RetryPolicy:
                 self._total_successes += 1
                 return result
                 
-            except self.config.retry_on_exceptions as e:
+            except self._retry_exceptions as e:
                 last_exception = e
                 
                 if attempt < self.config.max_attempts:
                     # Calculate delay and retry
                     delay = self._calculate_delay(attempt, previous_delay)
                     previous_delay = delay
-                    await asyncio.sleep(delay)
+                    await _retry_scheduler.sleep(delay)
                     self._total_retries += 1
                 else:
                     # Last attempt failed
@@ -160,15 +246,15 @@ class RetryPolicy:
         
         elif self.config.jitter_type == JitterType.FULL:
             # Full jitter: random(0, base_delay)
-            return random.uniform(0, base_delay)
+            return self._rng.uniform(0, base_delay)
         
         elif self.config.jitter_type == JitterType.EQUAL:
             # Equal jitter: base_delay/2 + random(0, base_delay/2)
-            return base_delay / 2 + random.uniform(0, base_delay / 2)
+            return base_delay / 2 + self._rng.uniform(0, base_delay / 2)
         
         elif self.config.jitter_type == JitterType.DECORRELATED:
             # Decorrelated jitter: random(base, previous_delay * 3)
-            return random.uniform(self.config.base_delay, min(previous_delay * 3, self.config.max_delay))
+            return self._rng.uniform(self.config.base_delay, min(previous_delay * 3, self.config.max_delay))
         
         return base_delay
     
@@ -202,9 +288,12 @@ def retry(name: str, config: Optional[RetryConfig] = None):
     policy = RetryPolicy(name, config)
     
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        # The wrapped function never changes, so its kind is resolved once
+        is_async = asyncio.iscoroutinefunction(func)
+        
         @wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            return await policy.execute(func, *args, **kwargs)
+            return await policy._execute(func, is_async, args, kwargs)
         return wrapper
     
     return decorator
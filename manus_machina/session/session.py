@@ -5,14 +5,60 @@ Represents a single, ongoing interaction between a user and the agent system.
 Contains the chronological sequence of events and maintains state.
 """
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 from uuid import UUID, uuid4
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, computed_field, model_validator
+import itertools
+import orjson
+import time
 
 from ..state.state import State
 from ..artifacts.artifact import Artifact
-from ..core.events import DomainEvent
+from ..events import DomainEvent
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _to_ns(timestamp: datetime) -> int:
+    """UTC datetime (naive, or aware in any zone) to integer nanoseconds since the epoch."""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return (timestamp - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def _json_default(obj: Any) -> Any:
+    """orjson fallback: nested session objects encode through their own to_dict."""
+    if isinstance(obj, (DomainEvent, Artifact)):
+        return obj.to_dict()
+    # Same fallback as DomainEvent.to_json_bytes for odd values in event data
+    return str(obj)
+
+
+class _TypeIndex:
+    """Items of a list grouped by type, caught up with the list on each lookup."""
+    
+    __slots__ = ("_source", "_count", "_buckets")
+    
+    def __init__(self):
+        self._source: Optional[List[Any]] = None
+        self._count = 0
+        self._buckets: Dict[Any, List[Any]] = {}
+    
+    def get(self, items: List[Any], attr: str, type_value: Any) -> List[Any]:
+        """Items whose `attr` equals type_value, in list order."""
+        if items is not self._source or len(items) < self._count:
+            # The list was replaced or shrunk: start over
+            self._source, self._count, self._buckets = items, 0, {}
+        
+        # Only items appended since the last lookup are looked at
+        buckets = self._buckets
+        for item in itertools.islice(items, self._count, None):
+            buckets.setdefault(getattr(item, attr), []).append(item)
+        self._count = len(items)
+        
+        return list(buckets.get(type_value, ()))
 
 
 class SessionMetadata(BaseModel):
@@ -54,92 +100,167 @@ class Session(BaseModel):
     
     # Timestamps
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    # Bumped by every mutation, so kept as an integer clock reading and
+    # only turned into a datetime on access. Dumps and the constructor use
+    # updated_at, as before.
+    updated_ns: int = Field(
+        default_factory=time.time_ns,
+        exclude=True,
+        description="Last update time (ns since epoch)"
+    )
     
     # Status
     is_active: bool = True
     
+    # Per-type lookups over events and artifacts
+    _events_by_type: _TypeIndex = PrivateAttr(default_factory=_TypeIndex)
+    _artifacts_by_type: _TypeIndex = PrivateAttr(default_factory=_TypeIndex)
+    
     class Config:
         arbitrary_types_allowed = True
     
+    @model_validator(mode="before")
+    @classmethod
+    def _updated_at_to_ns(cls, data: Any) -> Any:
+        """Store an updated_at argument (datetime or ISO string) as updated_ns"""
+        if isinstance(data, dict) and "updated_at" in data:
+            data = dict(data)
+            updated_at = data.pop("updated_at")
+            if isinstance(updated_at, str):
+                updated_at = datetime.fromisoformat(updated_at)
+            data.setdefault("updated_ns", _to_ns(updated_at))
+        return data
+    
+    @computed_field
+    @property
+    def updated_at(self) -> datetime:
+        """Last update time (naive UTC, like created_at)"""
+        return _EPOCH + timedelta(microseconds=self.updated_ns // 1000)
+    
+    @updated_at.setter
+    def updated_at(self, value: datetime) -> None:
+        self.updated_ns = _to_ns(value)
+    
     def add_event(self, event: DomainEvent) -> None:
         """Add an event to the session history"""
         self.events.append(event)
-        self.updated_at = datetime.utcnow()
+        self.updated_ns = time.time_ns()
+    
+    def add_events(self, events: Iterable[DomainEvent]) -> None:
+        """Add several events (e.g. one agent turn) with a single update-time bump"""
+        self.events.extend(events)
+        self.updated_ns = time.time_ns()
     
     def add_artifact(self, artifact: Artifact) -> None:
         """Add an artifact to the session"""
         self.artifacts.append(artifact)
-        self.updated_at = datetime.utcnow()
+        self.updated_ns = time.time_ns()
+    
+    def add_artifacts(self, artifacts: Iterable[Artifact]) -> None:
+        """Add several artifacts with a single update-time bump"""
+        self.artifacts.extend(artifacts)
+        self.updated_ns = time.time_ns()
     
     def get_state(self, key: str, default: Any = None) -> Any:
         """Get a value from session state"""
-        return self.state.get(key, default)
+        return self.state.raw().get(key, default)
     
     def set_state(self, key: str, value: Any) -> None:
         """Set a value in session state"""
         self.state.set(key, value)
-        self.updated_at = datetime.utcnow()
+        self.updated_ns = time.time_ns()
     
     def get_user_state(self, key: str, default: Any = None) -> Any:
         """Get a value from user state (user: prefix)"""
-        return self.state.get(f"user:{key}", default)
+        return self.state.raw().get(f"user:{key}", default)
     
     def set_user_state(self, key: str, value: Any) -> None:
         """Set a value in user state (user: prefix)"""
         self.state.set(f"user:{key}", value)
-        self.updated_at = datetime.utcnow()
+        self.updated_ns = time.time_ns()
     
     def get_app_state(self, key: str, default: Any = None) -> Any:
         """Get a value from app state (app: prefix)"""
-        return self.state.get(f"app:{key}", default)
+        return self.state.raw().get(f"app:{key}", default)
     
     def set_app_state(self, key: str, value: Any) -> None:
         """Set a value in app state (app: prefix)"""
         self.state.set(f"app:{key}", value)
-        self.updated_at = datetime.utcnow()
+        self.updated_ns = time.time_ns()
     
     def get_temp_state(self, key: str, default: Any = None) -> Any:
         """Get a value from temporary invocation state (temp: prefix)"""
-        return self.state.get(f"temp:{key}", default)
+        return self.state.raw().get(f"temp:{key}", default)
     
     def set_temp_state(self, key: str, value: Any) -> None:
-        """Set a value in temporary invocation state (temp: prefix)"""
-        self.state.set(f"temp:{key}", value)
+        """
+        Set a value in temporary invocation state (temp: prefix).
+        
+        Temp state is never serialized, so the value is not checked and
+        need not be JSON-serializable.
+        """
+        self.state.set_unchecked(f"temp:{key}", value)
         # Note: temp state is not persisted, so we don't update updated_at
     
     def clear_temp_state(self) -> None:
         """Clear all temporary state after invocation completes"""
         self.state.clear_prefix("temp:")
     
-    def get_event_history(self, event_type: Optional[str] = None) -> List[DomainEvent]:
-        """Get event history, optionally filtered by type"""
+    def get_event_history(self, event_type: Optional[str] = None) -> Sequence[DomainEvent]:
+        """
+        Get event history, optionally filtered by type.
+        
+        The unfiltered history is the session's own event list, returned
+        without a copy; treat it as read-only and use add_event to append.
+        """
         if event_type:
-            return [e for e in self.events if e.event_type == event_type]
-        return self.events.copy()
+            return self._events_by_type.get(self.events, "event_type", event_type)
+        return self.events
     
     def get_artifacts_by_type(self, artifact_type: str) -> List[Artifact]:
         """Get artifacts filtered by type"""
-        return [a for a in self.artifacts if a.type == artifact_type]
+        return self._artifacts_by_type.get(self.artifacts, "type", artifact_type)
     
     def close(self) -> None:
         """Mark session as inactive"""
         self.is_active = False
-        self.updated_at = datetime.utcnow()
+        self.updated_ns = time.time_ns()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert session to dictionary for serialization"""
         return {
             "id": str(self.id),
             "metadata": self.metadata.model_dump(),
-            "state": self.state.to_dict(),
-            "events": [e.model_dump() for e in self.events],
-            "artifacts": [a.model_dump() for a in self.artifacts],
+            "state": self.state.to_persistent_dict(),
+            "events": [e.to_dict() for e in self.events],
+            "artifacts": [a.to_dict() for a in self.artifacts],
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
             "is_active": self.is_active,
         }
     
+    def to_json(self) -> bytes:
+        """
+        Serialize session to JSON bytes (same shape as to_dict).
+        
+        orjson asks for each event and artifact as it reaches it, so only
+        one nested dict exists at a time instead of the whole tree.
+        """
+        return orjson.dumps(
+            {
+                "id": str(self.id),
+                "metadata": self.metadata.model_dump(),
+                "state": self.state.to_persistent_dict(),
+                "events": self.events,
+                "artifacts": self.artifacts,
+                "created_at": self.created_at.isoformat(),
+                "updated_at": self.updated_at.isoformat(),
+                "is_active": self.is_active,
+            },
+            default=_json_default,
+            option=orjson.OPT_NON_STR_KEYS
+        )
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Session":
         """Create session from dictionary"""
@@ -150,7 +271,27 @@ class Session(BaseModel):
             events=[DomainEvent(**e) for e in data["events"]],
             artifacts=[Artifact(**a) for a in data["artifacts"]],
             created_at=datetime.fromisoformat(data["created_at"]),
-            updated_at=datetime.fromisoformat(data["updated_at"]),
+            updated_ns=_to_ns(datetime.fromisoformat(data["updated_at"])),
+            is_active=data["is_active"],
+        )
+    
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]) -> "Session":
+        """
+        Create session from a dictionary produced by to_dict, skipping validation.
+        
+        For reloading sessions this application stored itself: values are
+        parsed back from their serialized form but not re-validated. Use
+        from_dict for data from anywhere else.
+        """
+        return cls.model_construct(
+            id=UUID(data["id"]),
+            metadata=SessionMetadata.model_construct(**data["metadata"]),
+            state=State.from_dict(data["state"]),
+            events=[DomainEvent.from_dict(e) for e in data["events"]],
+            artifacts=[Artifact.from_trusted_dict(a) for a in data["artifacts"]],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_ns=_to_ns(datetime.fromisoformat(data["updated_at"])),
             is_active=data["is_active"],
         )
 
@@ -12,8 +12,10 @@ Implementations:
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
+import heapq
+import threading
 
 from .session import Session, SessionMetadata
 
@@ -132,10 +134,26 @@ class InMemorySessionService(SessionService):
     
     ⚠️ WARNING: All data is lost when the application restarts.
     Use only for testing and local development.
+    
+    The service's methods never await, so coroutines cannot interleave
+    inside them; a lock additionally keeps the store and its indices
+    consistent when tools call in from worker threads. Concurrent
+    mutation of the same Session object still needs the caller's own
+    synchronization.
     """
     
     def __init__(self):
         self._sessions: dict[UUID, Session] = {}
+        
+        # Secondary indices for list_sessions filters. Values are dicts used
+        # as insertion-ordered sets, so sessions tied on updated_at come
+        # back in the same order as unfiltered. Metadata changes are picked
+        # up on update_session.
+        self._by_user: Dict[str, Dict[UUID, None]] = {}
+        self._by_app: Dict[str, Dict[UUID, None]] = {}
+        self._index_keys: Dict[UUID, Tuple[Optional[str], str]] = {}
+        
+        self._lock = threading.Lock()
     
     async def create_session(
         self,
@@ -151,7 +169,9 @@ class InMemorySessionService(SessionService):
         )
         
         session = Session(metadata=metadata)
-        self._sessions[session.id] = session
+        with self._lock:
+            self._sessions[session.id] = session
+            self._index(session)
         
         return session
     
@@ -161,13 +181,17 @@ class InMemorySessionService(SessionService):
     
     async def update_session(self, session: Session) -> None:
         """Update session in memory"""
-        self._sessions[session.id] = session
+        with self._lock:
+            self._sessions[session.id] = session
+            self._index(session)
     
     async def delete_session(self, session_id: UUID) -> bool:
         """Delete session from memory"""
-        if session_id in self._sessions:
-            del self._sessions[session_id]
-            return True
+        with self._lock:
+            if session_id in self._sessions:
+                del self._sessions[session_id]
+                self._unindex(session_id)
+                return True
         return False
     
     async def list_sessions(
@@ -179,21 +203,28 @@ class InMemorySessionService(SessionService):
         offset: int = 0
     ) -> List[Session]:
         """List sessions from memory with filtering"""
-        sessions = list(self._sessions.values())
+        # Narrow to the indexed candidates first
+        with self._lock:
+            candidates: Optional[Dict[UUID, None]] = None
+            if user_id:
+                candidates = self._by_user.get(user_id, {})
+            if app_name:
+                app_ids = self._by_app.get(app_name, {})
+                candidates = app_ids if candidates is None else {
+                    session_id: None for session_id in candidates if session_id in app_ids
+                }
+            
+            if candidates is None:
+                sessions = list(self._sessions.values())
+            else:
+                sessions = [self._sessions[session_id] for session_id in candidates]
         
-        # Apply filters
-        if user_id:
-            sessions = [s for s in sessions if s.metadata.user_id == user_id]
-        if app_name:
-            sessions = [s for s in sessions if s.metadata.app_name == app_name]
         if is_active is not None:
             sessions = [s for s in sessions if s.is_active == is_active]
         
-        # Sort by updated_at descending
-        sessions.sort(key=lambda s: s.updated_at, reverse=True)
-        
-        # Pagination
-        return sessions[offset:offset + limit]
+        # Newest first; only the sessions up to the requested page are ordered
+        page_end = offset + limit
+        return heapq.nlargest(page_end, sessions, key=lambda s: s.updated_ns)[offset:page_end]
     
     async def get_user_sessions(
         self,
@@ -210,11 +241,42 @@ class InMemorySessionService(SessionService):
     
     def clear_all(self) -> None:
         """Clear all sessions (for testing)"""
-        self._sessions.clear()
+        with self._lock:
+            self._sessions.clear()
+            self._by_user.clear()
+            self._by_app.clear()
+            self._index_keys.clear()
     
     def count(self) -> int:
         """Get total number of sessions"""
         return len(self._sessions)
+    
+    def _index(self, session: Session) -> None:
+        """Add a session to the secondary indices (re-indexing changed metadata)."""
+        keys = (session.metadata.user_id, session.metadata.app_name)
+        old_keys = self._index_keys.get(session.id, (None, None))
+        self._index_keys[session.id] = keys
+        
+        # Only a changed key moves; an unchanged one keeps its position
+        for index, old_key, key in zip((self._by_user, self._by_app), old_keys, keys):
+            if key != old_key:
+                self._discard(index, old_key, session.id)
+                if key is not None:
+                    index.setdefault(key, {})[session.id] = None
+    
+    def _unindex(self, session_id: UUID) -> None:
+        """Remove a session from the secondary indices."""
+        keys = self._index_keys.pop(session_id, (None, None))
+        for index, key in zip((self._by_user, self._by_app), keys):
+            self._discard(index, key, session_id)
+    
+    @staticmethod
+    def _discard(index: Dict[str, Dict[UUID, None]], key: Optional[str], session_id: UUID) -> None:
+        ids = index.get(key) if key is not None else None
+        if ids is not None:
+            ids.pop(session_id, None)
+            if not ids:
+                del index[key]
 
 
 # Note: DatabaseSessionService will be implemented in infrastructure/database/
@@ -10,12 +10,27 @@ Implements the session state scratchpad with prefix-based scoping:
 Inspired by Google ADK's state model.
 """
 
-from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+import re
 import orjson
 
 
-class State(BaseModel):
+# Pattern: {key} or {key?}
+_PLACEHOLDER_RE = re.compile(r'\{([a-zA-Z0-9_:]+)(\?)?\}')
+
+_MISSING = object()
+
+# Prefixes of the non-session scopes
+_SCOPED_PREFIXES = ("user:", "app:", "temp:")
+
+# Shared by the set() check and to_json so both accept the same values.
+# UUIDs and datetimes are native to orjson; numpy arrays and scalars
+# (common in tool results) need the option, and load back as lists/numbers.
+_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+
+class State:
     """
     State represents the scratchpad for a session.
     
@@ -28,16 +43,38 @@ class State(BaseModel):
     All values must be JSON-serializable.
     """
     
-    _data: Dict[str, Any] = Field(default_factory=dict, alias="data")
+    # Plain slotted class: the only field is a free-form dict that model
+    # validation had nothing to check in, and sessions create one per
+    # construction and reload
+    __slots__ = ("_data",)
     
-    class Config:
-        arbitrary_types_allowed = True
-        populate_by_name = True
+    # set() checks each value by encoding it, work that is repeated when the
+    # session is persisted. Set State.validate_on_set = False to skip the
+    # check on write-heavy paths; bad values then fail at persistence time.
+    validate_on_set: bool = True
+    
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        """
+        Initialize state.
+        
+        Args:
+            data: Initial key-value pairs (copied)
+        """
+        self._data: Dict[str, Any] = dict(data) if data else {}
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get a value from state"""
         return self._data.get(key, default)
     
+    def raw(self) -> Dict[str, Any]:
+        """
+        The underlying dict, for read-only fast paths.
+        
+        Lookups on it skip a method call per key. Writing to it bypasses
+        set()'s serializability check, so use set() to modify state.
+        """
+        return self._data
+    
     def set(self, key: str, value: Any) -> None:
         """
         Set a value in state.
@@ -47,17 +84,27 @@ class State(BaseModel):
             value: JSON-serializable value
             
         Raises:
-            ValueError: If value is not JSON-serializable
+            ValueError: If value is not JSON-serializable (only checked
+                while validate_on_set is on)
+        """
+        if self.validate_on_set:
+            try:
+                orjson.dumps(value, option=_JSON_OPTIONS)
+            except TypeError as e:
+                raise ValueError(
+                    f"State value for key '{key}' must be JSON-serializable. "
+                    f"Got type: {type(value).__name__}"
+                ) from e
+        
+        self._data[key] = value
+    
+    def set_unchecked(self, key: str, value: Any) -> None:
         """
-        # Validate serializability
-        try:
-            orjson.dumps(value)
-        except TypeError as e:
-            raise ValueError(
-                f"State value for key '{key}' must be JSON-serializable. "
-                f"Got type: {type(value).__name__}"
-            ) from e
+        Set a value without the serializability check.
         
+        For values that are never serialized (temp: state), which may then
+        be any object, e.g. open file handles or generators.
+        """
         self._data[key] = value
     
     def delete(self, key: str) -> None:
@@ -94,7 +141,7 @@ class State(BaseModel):
         """Get all session-specific state (no prefix)"""
         return {
             k: v for k, v in self._data.items()
-            if not any(k.startswith(p) for p in ["user:", "app:", "temp:"])
+            if not k.startswith(_SCOPED_PREFIXES)
         }
     
     def get_user_state(self) -> Dict[str, Any]:
@@ -117,6 +164,10 @@ class State(BaseModel):
         """Convert state to dictionary"""
         return self._data.copy()
     
+    def to_persistent_dict(self) -> Dict[str, Any]:
+        """Convert state to dictionary, leaving out temp: state"""
+        return {k: v for k, v in self._data.items() if not k.startswith("temp:")}
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "State":
         """Create state from dictionary"""
@@ -124,13 +175,15 @@ class State(BaseModel):
     
     def to_json(self) -> bytes:
         """Serialize state to JSON bytes"""
-        return orjson.dumps(self._data)
+        return orjson.dumps(self._data, option=_JSON_OPTIONS)
     
     @classmethod
     def from_json(cls, json_bytes: bytes) -> "State":
         """Deserialize state from JSON bytes"""
-        data = orjson.loads(json_bytes)
-        return cls(data=data)
+        # The parsed dict is fresh, so the state takes it without a copy
+        state = cls()
+        state._data = orjson.loads(json_bytes)
+        return state
     
     def __len__(self) -> int:
         """Get number of keys in state"""
@@ -187,27 +240,21 @@ class StateTemplate:
             >>> StateTemplate.render("Optional: {missing?}", state)
             "Optional: "
         """
-        import re
+        literals, placeholders = _parse_template(template)
+        data = state.raw()
         
-        # Pattern: {key} or {key?}
-        pattern = r'\{([a-zA-Z0-9_:]+)(\?)?\}'
-        
-        def replacer(match):
-            key = match.group(1)
-            optional = match.group(2) is not None
-            
-            if state.has(key):
-                value = state.get(key)
-                return str(value)
-            elif optional:
-                return ""
-            else:
+        pieces = [literals[0]]
+        for (key, optional), literal in zip(placeholders, literals[1:]):
+            value = data.get(key, _MISSING)
+            if value is not _MISSING:
+                pieces.append(str(value))
+            elif not optional:
                 raise KeyError(
                     f"Required state key '{key}' not found. "
                     f"Use {{key?}} for optional keys."
                 )
-        
-        return re.sub(pattern, replacer, template)
+            pieces.append(literal)
+        return "".join(pieces)
     
     @staticmethod
     def extract_keys(template: str) -> List[tuple[str, bool]]:
@@ -224,10 +271,21 @@ class StateTemplate:
             >>> StateTemplate.extract_keys("Hello {name}, topic: {topic?}")
             [('name', False), ('topic', True)]
         """
-        import re
-        
-        pattern = r'\{([a-zA-Z0-9_:]+)(\?)?\}'
-        matches = re.findall(pattern, template)
-        
-        return [(key, optional == '?') for key, optional in matches]
+        return list(_parse_template(template)[1])
+
 
+@lru_cache(maxsize=256)
+def _parse_template(template: str) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, bool], ...]]:
+    """
+    Split a template into literal text and placeholders, once per template.
+    
+    Returns:
+        The literal pieces (one more than there are placeholders) and the
+        (key, is_optional) placeholders between them
+    """
+    parts = _PLACEHOLDER_RE.split(template)
+    placeholders = tuple(
+        (key, optional is not None)
+        for key, optional in zip(parts[1::3], parts[2::3])
+    )
+    return tuple(parts[0::3]), placeholders
@@ -1,8 +1,15 @@
 """Base tool implementation."""
 
-from typing import Any, Dict, Optional, Callable, Awaitable
+from typing import Any, Dict, Optional, Callable, Awaitable, Tuple
 from pydantic import BaseModel, Field
 from abc import ABC, abstractmethod
+import asyncio
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 
 class ToolConfig(BaseModel):
@@ -26,8 +33,13 @@ class Tool(ABC):
     Tools are functions that agents can use to interact with the world.
     """
     
+    __slots__ = ("config", "_schema")
+    
     def __init__(self, config: ToolConfig):
         self.config = config
+        
+        # Schema sent to the model on every turn, with the config it was built from
+        self._schema: Optional[Tuple[ToolConfig, Dict[str, Any]]] = None
     
     @abstractmethod
     async def execute(self, **kwargs: Any) -> Any:
@@ -43,12 +55,23 @@ class Tool(ABC):
         pass
     
     def get_schema(self) -> Dict[str, Any]:
-        """Get OpenAPI schema for the tool."""
-        return {
+        """
+        Get OpenAPI schema for the tool.
+        
+        Built once per config object (assigning a new config rebuilds it);
+        the returned dict is shared, so treat it as read-only.
+        """
+        cached = self._schema
+        if cached is not None and cached[0] is self.config:
+            return cached[1]
+        
+        schema = {
             "name": self.config.name,
             "description": self.config.description,
             "parameters": self.config.parameters
         }
+        self._schema = (self.config, schema)
+        return schema
     
     def __repr__(self) -> str:
         return f"Tool(name={self.config.name})"
@@ -59,6 +82,8 @@ class FunctionTool(Tool):
     Tool that wraps a Python function.
     """
     
+    __slots__ = ("func",)
+    
     def __init__(
         self,
         config: ToolConfig,
@@ -71,3 +96,52 @@ class FunctionTool(Tool):
         """Execute the wrapped function."""
         return await self.func(**kwargs)
 
+
+class NumbaFunctionTool(FunctionTool):
+    """
+    Tool that JIT-compiles a numeric Python function with Numba.
+    
+    For compute-bound tool bodies (scoring, re-ranking, embedding math).
+    The function must be synchronous and nopython-compatible: numbers and
+    numpy arrays in and out, no Python objects. It is compiled without the
+    GIL and run in a worker thread, so the event loop keeps serving other
+    tasks while it runs. I/O-bound tools belong on FunctionTool.
+    
+    Examples:
+        def top_score(scores):
+            best = 0.0
+            for s in scores:
+                best = max(best, s)
+            return best
+        
+        tool = NumbaFunctionTool(config, top_score)
+    """
+    
+    __slots__ = ()
+    
+    def __init__(
+        self,
+        config: ToolConfig,
+        func: Callable[..., Any],
+        parallel: bool = False
+    ):
+        """
+        Initialize tool.
+        
+        Args:
+            config: Tool configuration
+            func: Synchronous, nopython-compatible function
+            parallel: Let Numba parallelize the loops in func (numba.prange)
+        """
+        if not NUMBA_AVAILABLE:
+            raise ImportError(
+                "numba is not installed. Install it with: pip install numba"
+            )
+        
+        # Compiled lazily on the first call, per argument types; cache=True
+        # keeps the machine code on disk for later processes
+        super().__init__(config, numba.njit(cache=True, nogil=True, parallel=parallel)(func))
+    
+    async def execute(self, **kwargs: Any) -> Any:
+        """Execute the compiled function in a worker thread."""
+        return await asyncio.to_thread(self.func, **kwargs)
@@ -0,0 +1,56 @@
+"""Tests for agent and workflow state."""
+
+from datetime import datetime
+
+import orjson
+import pytest
+
+from manus_machina.agents import state as state_module
+from manus_machina.agents.state import State
+
+
+@pytest.fixture(autouse=True, params=["immutables", "dict"])
+def data_backend(request, monkeypatch):
+    if request.param == "immutables":
+        if not state_module.IMMUTABLES_AVAILABLE:
+            pytest.skip("immutables is not installed")
+    else:
+        monkeypatch.setattr(state_module, "IMMUTABLES_AVAILABLE", False)
+
+
+def test_updates_return_new_versions():
+    state = State(data={"a": 1})
+    updated = state.set("b", 2).update({"c": 3})
+    
+    assert dict(state.data) == {"a": 1}
+    assert dict(updated.data) == {"a": 1, "b": 2, "c": 3}
+    assert updated.version == 3
+
+
+def test_data_dumps_as_dict():
+    state = State(data={"a": 1}).set("b", 2)
+    
+    assert state.model_dump()["data"] == {"a": 1, "b": 2}
+    assert orjson.loads(state.model_dump_json())["data"] == {"a": 1, "b": 2}
+
+
+def test_updated_at_argument_is_kept_and_dumped():
+    updated_at = datetime(2024, 5, 1, 12, 30, 15, 123456)
+    state = State(data={"a": 1}, updated_at=updated_at)
+    
+    assert state.updated_at == updated_at
+    dumped = state.model_dump()
+    assert dumped["updated_at"] == updated_at
+    assert "updated_ns" not in dumped
+    assert State.model_validate(dumped).updated_at == updated_at
+
+
+def test_model_copy_applies_updated_at():
+    updated_at = datetime(2024, 5, 1, 12, 30, 15, 123456)
+    state = State(data={"a": 1})
+    
+    copied = state.model_copy(update={"updated_at": updated_at})
+    
+    assert copied.updated_at == updated_at
+    assert "updated_at" not in copied.__dict__
+    assert state.model_copy(update={"updated_at": updated_at.isoformat()}).updated_at == updated_at
@@ -0,0 +1,90 @@
+"""Tests for the agent communication bus."""
+
+import asyncio
+
+from manus_machina.communication.bus import CommunicationBus
+
+
+async def test_handler_can_send_more_than_queue_room():
+    bus = CommunicationBus(max_queue_size=4)
+    received = []
+    done = asyncio.Event()
+    
+    async def relay(message):
+        for i in range(5):
+            await bus.send("relay", "sink", {"i": i})
+    
+    async def sink(message):
+        received.append(message.content["i"])
+        if len(received) == 5:
+            done.set()
+    
+    bus.subscribe("relay", relay)
+    bus.subscribe("sink", sink)
+    await bus.start()
+    
+    await bus.send("user", "relay", {})
+    await asyncio.wait_for(done.wait(), timeout=5)
+    await bus.stop()
+    
+    assert received == [0, 1, 2, 3, 4]
+
+
+async def test_messages_to_one_recipient_are_delivered_in_order():
+    bus = CommunicationBus()
+    received = []
+    
+    async def slow_sink(message):
+        # Earlier messages take longer, so concurrent delivery would reorder them
+        await asyncio.sleep(0.01 * (3 - message.content["i"]))
+        received.append(message.content["i"])
+    
+    bus.subscribe("sink", slow_sink)
+    for i in range(3):
+        await bus.send("user", "sink", {"i": i})
+    
+    await bus.start()
+    await asyncio.wait_for(bus.stop(), timeout=5)
+    
+    assert received == [0, 1, 2]
+
+
+async def test_stop_delivers_messages_sent_by_handlers():
+    bus = CommunicationBus()
+    received = []
+    
+    async def relay(message):
+        await bus.send("relay", "sink", message.content)
+    
+    async def sink(message):
+        received.append(message.content)
+    
+    bus.subscribe("relay", relay)
+    bus.subscribe("sink", sink)
+    await bus.send("user", "relay", {"hop": 1})
+    
+    await bus.start()
+    await asyncio.wait_for(bus.stop(), timeout=5)
+    
+    assert received == [{"hop": 1}]
+
+
+async def test_failing_handler_does_not_stop_delivery():
+    bus = CommunicationBus()
+    received = []
+    
+    async def failing(message):
+        raise RuntimeError("boom")
+    
+    async def sink(message):
+        received.append(message.content)
+    
+    bus.subscribe("sink", failing)
+    bus.subscribe("sink", sink)
+    await bus.send("user", "sink", {"n": 1})
+    await bus.send("user", "sink", {"n": 2})
+    
+    await bus.start()
+    await asyncio.wait_for(bus.stop(), timeout=5)
+    
+    assert received == [{"n": 1}, {"n": 2}]
@@ -0,0 +1,100 @@
+"""Tests for crew task scheduling."""
+
+import asyncio
+
+import pytest
+
+from manus_machina.agents.crew import Crew, CrewConfig
+from manus_machina.agents.task import Task, TaskConfig
+
+
+class _AgentConfig:
+    def __init__(self, name):
+        self.name = name
+
+
+class _RecordingAgent:
+    """Agent stand-in that records the context and overlap of each task."""
+    
+    def __init__(self, name="worker"):
+        self.config = _AgentConfig(name)
+        self.contexts = {}
+        self.running = 0
+        self.max_running = 0
+    
+    async def execute(self, task, context=None):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        self.contexts[task] = dict(context or {})
+        await asyncio.sleep(0)
+        self.running -= 1
+        return f"{task}-result"
+
+
+def _crew(agent, *tasks):
+    crew = Crew(CrewConfig(name="crew"), agents=[agent])
+    for name, depends_on in tasks:
+        crew.add_task(Task(TaskConfig(description=name, name=name, depends_on=depends_on)))
+    return crew
+
+
+def test_levels_follow_declared_dependencies():
+    crew = _crew(
+        _RecordingAgent(),
+        ("fetch", []),
+        ("parse", []),
+        ("merge", ["fetch", "parse"]),
+        ("report", None),
+    )
+    
+    assert crew._task_levels() == [[0, 1], [2], [3]]
+
+
+async def test_independent_tasks_overlap_and_dependents_see_results():
+    agent = _RecordingAgent()
+    crew = _crew(agent, ("fetch", []), ("parse", []), ("merge", ["fetch", "parse"]))
+    
+    result = await crew.kickoff({"topic": "x"})
+    
+    assert result == "merge-result"
+    assert agent.max_running == 2
+    merge_context = agent.contexts["merge"]
+    assert merge_context["fetch"] == "fetch-result"
+    assert merge_context["parse"] == "parse-result"
+    assert merge_context["topic"] == "x"
+
+
+def test_default_dependencies_run_one_task_per_level():
+    crew = _crew(_RecordingAgent(), ("a", None), ("b", None), ("c", None))
+    
+    assert crew._task_levels() == [[0], [1], [2]]
+
+
+def test_dependency_cycle_is_rejected():
+    crew = _crew(_RecordingAgent(), ("a", ["b"]), ("b", ["a"]))
+    
+    with pytest.raises(ValueError, match="cycle"):
+        crew._task_levels()
+
+
+def test_duplicate_task_name_is_rejected():
+    crew = _crew(_RecordingAgent(), ("fetch", []), ("fetch", []))
+    
+    with pytest.raises(ValueError, match="Duplicate task name in crew: fetch"):
+        crew._task_levels()
+
+
+def test_reserved_task_name_is_rejected():
+    crew = _crew(_RecordingAgent(), ("previous_result", []))
+    
+    with pytest.raises(ValueError, match="reserved"):
+        crew._task_levels()
+
+
+async def test_task_name_colliding_with_input_is_rejected():
+    agent = _RecordingAgent()
+    crew = _crew(agent, ("topic", []))
+    
+    with pytest.raises(ValueError, match="collides with an input key"):
+        await crew.kickoff({"topic": "x"})
+    assert agent.contexts == {}
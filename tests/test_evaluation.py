@@ -0,0 +1,57 @@
+"""Tests for the evaluation framework."""
+
+import asyncio
+
+from manus_machina.evaluation import framework
+from manus_machina.evaluation.framework import EvalSet, Evaluator, Turn
+
+
+def test_expected_tokens_follow_model_copy_updates():
+    turn = Turn(user_content="q", expected_final_response="Alpha beta")
+    assert turn.expected_tokens == {"alpha", "beta"}
+    
+    copy = turn.model_copy(update={"expected_final_response": "gamma"})
+    
+    assert copy.expected_tokens == {"gamma"}
+    assert turn.expected_tokens == {"alpha", "beta"}
+
+
+class _TrackingAgent:
+    """Records how many executions overlap."""
+    
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    async def execute(self, task, context=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return {"response": task}
+
+
+def _eval_set(n):
+    return EvalSet(name="set", test_cases=[
+        framework.TestCase(name=f"case {i}", turns=[Turn(user_content=f"answer {i}", expected_final_response=f"answer {i}")])
+        for i in range(n)
+    ])
+
+
+async def test_test_cases_run_sequentially_by_default():
+    agent = _TrackingAgent()
+    
+    results = await Evaluator(agent, eval_set=_eval_set(3)).run()
+    
+    assert agent.max_in_flight == 1
+    assert [result.test_case_name for result in results] == ["case 0", "case 1", "case 2"]
+    assert all(result.passed for result in results)
+
+
+async def test_concurrent_test_cases_are_opt_in():
+    agent = _TrackingAgent()
+    
+    results = await Evaluator(agent, eval_set=_eval_set(3), concurrent=True).run()
+    
+    assert agent.max_in_flight == 3
+    assert [result.test_case_name for result in results] == ["case 0", "case 1", "case 2"]
@@ -0,0 +1,23 @@
+"""Tests for domain events."""
+
+from uuid import uuid4
+
+from manus_machina.events import DomainEvent, EventType
+
+
+def test_to_dict_reflects_model_copy_updates():
+    event = DomainEvent(event_type=EventType.TASK_STARTED, session_id=uuid4())
+    event.to_dict()  # caches the string forms
+    
+    session_id = uuid4()
+    copy = event.model_copy(update={"session_id": session_id, "event_type": EventType.TASK_COMPLETED})
+    
+    assert copy.to_dict()["session_id"] == str(session_id)
+    assert copy.to_dict()["event_type"] == "task.completed"
+    assert event.to_dict()["event_type"] == "task.started"
+
+
+def test_from_dict_round_trip():
+    event = DomainEvent(event_type=EventType.STATE_UPDATED, agent_name="agent", data={"k": 1})
+    
+    assert DomainEvent.from_dict(event.to_dict()) == event
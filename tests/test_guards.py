@@ -0,0 +1,46 @@
+"""Tests for guardrail guards."""
+
+import pytest
+
+from manus_machina.guardrails import guards
+from manus_machina.guardrails.guards import ToxicityGuard
+
+
+@pytest.fixture(params=["automaton", "fallback"])
+def toxicity_guard(request, monkeypatch):
+    if request.param == "automaton":
+        if not guards.AHOCORASICK_AVAILABLE:
+            pytest.skip("pyahocorasick is not installed")
+    else:
+        monkeypatch.setattr(guards, "AHOCORASICK_AVAILABLE", False)
+    return ToxicityGuard("toxicity", {"threshold": 0.4})
+
+
+async def test_overlapping_keywords_are_counted(toxicity_guard):
+    # "attack" and "kill" overlap; both count, as in the original scan
+    result = await toxicity_guard.validate("the attackill plan now")
+    
+    assert not result.passed
+    assert result.metadata["toxicity_score"] == pytest.approx(0.5)
+
+
+async def test_clean_content_passes(toxicity_guard):
+    result = await toxicity_guard.validate("a friendly greeting")
+    
+    assert result.passed
+
+
+async def test_keywords_match_regardless_of_case(toxicity_guard):
+    result = await toxicity_guard.validate("HATE and Kill")
+    
+    assert not result.passed
+    assert result.metadata["toxicity_score"] == pytest.approx(2 / 3)
+
+
+def test_fallback_finds_keywords_prefixing_one_another(monkeypatch):
+    monkeypatch.setattr(guards, "AHOCORASICK_AVAILABLE", False)
+    monkeypatch.setattr(ToxicityGuard, "TOXIC_KEYWORDS", ["harm", "harmful", "fulfil"])
+    guard = ToxicityGuard("toxicity")
+    
+    assert guard._found_keywords("Harmfulfil") == {"harm", "harmful", "fulfil"}
+    assert guard._found_keywords("harmless") == {"harm"}
@@ -0,0 +1,15 @@
+"""Import smoke tests for the infrastructure packages."""
+
+
+def test_database_models_importable():
+    from infrastructure.database.models import EventModel, SessionModel, uuid7
+    
+    assert EventModel.__tablename__ == "events"
+    assert SessionModel.__tablename__ == "sessions"
+    assert uuid7().version == 7
+
+
+def test_event_writer_importable():
+    from infrastructure.database.event_writer import EventWriter
+    
+    assert callable(EventWriter)
@@ -0,0 +1,73 @@
+"""Tests for LLMClient caching, with the Gemini model replaced by a fake."""
+
+import pytest
+
+from manus_machina.agents.llm_integration import LLMClient
+from manus_machina.llm.cache import SemanticCache
+
+
+pytest.importorskip("numpy")
+
+
+class _Response:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeModel:
+    """Stands in for genai.GenerativeModel; answers with a call counter."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    async def generate_content_async(self, prompt, generation_config=None):
+        self.calls += 1
+        return _Response(f"answer {self.calls}")
+
+
+@pytest.fixture
+def make_client(monkeypatch):
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    
+    def make(embed_fn=lambda text: [1.0, 0.0]):
+        client = LLMClient(semantic_cache=SemanticCache(embed_fn=embed_fn))
+        client.model = FakeModel()
+        return client
+    
+    return make
+
+
+async def test_sampled_calls_skip_semantic_cache(make_client):
+    client = make_client()
+    
+    first = await client.generate("prompt")
+    second = await client.generate("prompt")
+    
+    assert first["text"] != second["text"]
+    assert client.model.calls == 2
+
+
+async def test_deterministic_paraphrase_hits_semantic_cache(make_client):
+    client = make_client()
+    
+    first = await client.generate("prompt", temperature=0.0)
+    second = await client.generate("a paraphrased prompt", temperature=0.0)
+    
+    assert second == first
+    assert client.model.calls == 1
+
+
+async def test_embedding_failure_is_a_cache_miss(make_client):
+    def flaky_embed(text):
+        if text != "prompt":
+            raise RuntimeError("embedding service down")
+        return [1.0, 0.0]
+    
+    client = make_client(embed_fn=flaky_embed)
+    await client.generate("prompt", temperature=0.0)
+    
+    # Both the lookup and the store fail to embed this prompt
+    result = await client.generate("another prompt", temperature=0.0)
+    
+    assert result["text"] == "answer 2"
+    assert result["finish_reason"] == "stop"
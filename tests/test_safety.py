@@ -0,0 +1,53 @@
+"""Tests for the keyword safety filter."""
+
+import pytest
+
+from manus_machina.governance import safety
+from manus_machina.governance.safety import SafetyCategory, SafetyFilter
+
+
+# Verdicts of the original per-category substring scan
+BASELINE_VERDICTS = [
+    ("Hello, how are you?", True, {}),
+    ("the attackill plan", False, {SafetyCategory.VIOLENCE: 0.6}),
+    ("murderattack", False, {SafetyCategory.VIOLENCE: 0.6}),
+    ("KILL the murderer with a bomb", False, {
+        SafetyCategory.VIOLENCE: 0.6,
+        SafetyCategory.DANGEROUS: 0.3,
+    }),
+    ("racist hate speech and discrimination", False, {SafetyCategory.HATE: 0.9}),
+    ("poisonous weaponry bombs", False, {SafetyCategory.DANGEROUS: 0.9}),
+    ("explicit sexual content", False, {SafetyCategory.SEXUAL: 0.6}),
+]
+
+
+@pytest.fixture(params=["automaton", "fallback"])
+def safety_filter(request, monkeypatch):
+    if request.param == "automaton":
+        if not safety.AHOCORASICK_AVAILABLE:
+            pytest.skip("pyahocorasick is not installed")
+    else:
+        monkeypatch.setattr(safety, "AHOCORASICK_AVAILABLE", False)
+    return SafetyFilter()
+
+
+@pytest.mark.parametrize("content,passed,scores", BASELINE_VERDICTS)
+async def test_verdicts_match_baseline(safety_filter, content, passed, scores):
+    result = await safety_filter.check(content)
+    
+    assert result.passed is passed
+    for category in safety_filter.categories:
+        assert result.scores[category] == pytest.approx(scores.get(category, 0.0))
+
+
+async def test_clean_results_are_independent():
+    safety_filter = SafetyFilter()
+    first = await safety_filter.check("a friendly greeting")
+    first.blocked_categories.append(SafetyCategory.HATE)
+    first.scores[SafetyCategory.HATE] = 1.0
+    
+    second = await safety_filter.check("another friendly greeting")
+    
+    assert second.passed
+    assert second.blocked_categories == []
+    assert second.scores[SafetyCategory.HATE] == 0.0
@@ -0,0 +1,48 @@
+"""Tests for the saga orchestrator."""
+
+import pytest
+
+from manus_machina.orchestration.saga import Saga, SagaFailedError, SagaTemplate
+
+
+async def _noop(context):
+    return None
+
+
+def test_duplicate_step_name_is_rejected():
+    saga = Saga("order").add_step("reserve", _noop, _noop)
+    
+    with pytest.raises(ValueError, match="already has a step named 'reserve'"):
+        saga.add_step("reserve", _noop, _noop)
+
+
+def test_template_rejects_duplicate_step_name():
+    template = SagaTemplate("order").add_step("reserve", _noop, _noop)
+    
+    with pytest.raises(ValueError, match="already has a step named 'reserve'"):
+        template.add_step("reserve", _noop, _noop)
+
+
+async def test_failure_compensates_completed_steps_in_reverse():
+    calls = []
+    
+    def step(name, fail=False):
+        async def action(context):
+            if fail:
+                raise RuntimeError(name)
+            calls.append(name)
+        
+        async def compensation(context):
+            calls.append(f"undo {name}")
+        
+        return action, compensation
+    
+    saga = Saga("order")
+    for name in ("reserve", "charge"):
+        saga.add_step(name, *step(name))
+    saga.add_step("ship", *step("ship", fail=True))
+    
+    with pytest.raises(SagaFailedError):
+        await saga.execute()
+    
+    assert calls == ["reserve", "charge", "undo charge", "undo reserve"]
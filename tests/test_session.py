@@ -0,0 +1,56 @@
+"""Tests for the Session entity."""
+
+from datetime import datetime, timezone
+
+from manus_machina.events import DomainEvent, EventType
+from manus_machina.session.session import Session, SessionMetadata
+
+
+def _session(**kwargs):
+    return Session(metadata=SessionMetadata(app_name="app", user_id="user"), **kwargs)
+
+
+def test_updated_at_argument_is_kept():
+    updated_at = datetime(2024, 5, 1, 12, 30, 15, 123456)
+    
+    assert _session(updated_at=updated_at).updated_at == updated_at
+    assert _session(updated_at=updated_at.isoformat()).updated_at == updated_at
+    assert _session(
+        updated_at=updated_at.replace(tzinfo=timezone.utc)
+    ).updated_at == updated_at
+
+
+def test_updated_at_is_dumped_and_assignable():
+    session = _session()
+    session.updated_at = datetime(2024, 5, 1)
+    
+    dumped = session.model_dump()
+    assert dumped["updated_at"] == datetime(2024, 5, 1)
+    assert "updated_ns" not in dumped
+    assert Session.model_validate(dumped).updated_at == datetime(2024, 5, 1)
+
+
+def test_dict_round_trip():
+    session = _session()
+    session.set_state("topic", "ai")
+    session.add_event(DomainEvent(event_type=EventType.TASK_STARTED, session_id=session.id))
+    
+    restored = Session.from_dict(session.to_dict())
+    
+    assert restored.id == session.id
+    assert restored.updated_at == session.updated_at
+    assert restored.get_state("topic") == "ai"
+    assert restored.get_event_history(EventType.TASK_STARTED)[0].id == session.events[0].id
+
+
+def test_scoped_state_getters():
+    session = _session()
+    session.set_user_state("lang", "pt")
+    session.set_app_state("endpoint", "https://example.com")
+    session.set_temp_state("scratch", object())
+    
+    assert session.get_user_state("lang") == "pt"
+    assert session.get_app_state("endpoint") == "https://example.com"
+    assert session.get_temp_state("scratch") is not None
+    assert session.get_state("missing", "default") == "default"
+    assert "temp:scratch" not in session.to_dict()["state"]
@@ -0,0 +1,128 @@
+"""Tests for SimpleAgent, with the Gemini model replaced by a fake."""
+
+import pytest
+
+from manus_machina.agents.simple_agent import SimpleAgent, SimpleAgentConfig, StreamError
+from manus_machina.llm.cache import LLMCache, SemanticCache
+
+
+class _Chunk:
+    def __init__(self, text):
+        self.text = text
+
+
+class _Stream:
+    """Async iterator over chunks, optionally failing after them."""
+    
+    def __init__(self, texts, error=None):
+        self._texts = list(texts)
+        self._error = error
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self):
+        if self._texts:
+            return _Chunk(self._texts.pop(0))
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+        raise StopAsyncIteration
+
+
+class FakeModel:
+    """Stands in for genai.GenerativeModel."""
+    
+    def __init__(self, texts, error=None):
+        self.texts = texts
+        self.error = error
+        self.calls = 0
+    
+    async def generate_content_async(self, prompt, generation_config=None, stream=False):
+        self.calls += 1
+        if stream:
+            return _Stream(self.texts, self.error)
+        return _Chunk("".join(self.texts))
+
+
+@pytest.fixture
+def make_agent(monkeypatch):
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    
+    def make(model, temperature=0.0, **kwargs):
+        config = SimpleAgentConfig(name="tester", role="tester", goal="test", temperature=temperature)
+        agent = SimpleAgent(config, **kwargs)
+        agent.model = model
+        return agent
+    
+    return make
+
+
+async def test_stream_failure_ends_with_stream_error(make_agent):
+    agent = make_agent(FakeModel(["partial "], error=RuntimeError("boom")))
+    
+    chunks = [chunk async for chunk in agent.execute_stream("task")]
+    
+    assert chunks == ["partial ", "Error: boom"]
+    assert isinstance(chunks[-1], StreamError)
+    assert not any(isinstance(chunk, StreamError) for chunk in chunks[:-1])
+
+
+async def test_successful_stream_has_no_stream_error(make_agent):
+    agent = make_agent(FakeModel(["a", "b"]))
+    
+    chunks = [chunk async for chunk in agent.execute_stream("task")]
+    
+    assert chunks == ["a", "b"]
+    assert not any(isinstance(chunk, StreamError) for chunk in chunks)
+
+
+async def test_stream_reads_and_fills_exact_cache(make_agent):
+    model = FakeModel(["a", "b"])
+    agent = make_agent(model, cache=LLMCache())
+    
+    first = [chunk async for chunk in agent.execute_stream("task")]
+    second = [chunk async for chunk in agent.execute_stream("task")]
+    result = await agent.execute("task")
+    
+    assert first == ["a", "b"]
+    assert second == ["ab"]
+    assert result["response"] == "ab"
+    assert model.calls == 1
+
+
+async def test_failed_stream_is_not_cached(make_agent):
+    model = FakeModel(["partial "], error=RuntimeError("boom"))
+    agent = make_agent(model, cache=LLMCache())
+    
+    [chunk async for chunk in agent.execute_stream("task")]
+    [chunk async for chunk in agent.execute_stream("task")]
+    
+    assert model.calls == 2
+
+
+async def test_stream_uses_semantic_cache(make_agent):
+    pytest.importorskip("numpy")
+    model = FakeModel(["a", "b"])
+    agent = make_agent(model, semantic_cache=SemanticCache(embed_fn=lambda text: [1.0, 0.0]))
+    
+    [chunk async for chunk in agent.execute_stream("task")]
+    chunks = [chunk async for chunk in agent.execute_stream("a paraphrased task")]
+    
+    assert chunks == ["ab"]
+    assert model.calls == 1
+
+
+async def test_sampled_calls_skip_semantic_cache(make_agent):
+    pytest.importorskip("numpy")
+    model = FakeModel(["a", "b"])
+    agent = make_agent(
+        model,
+        temperature=0.7,
+        semantic_cache=SemanticCache(embed_fn=lambda text: [1.0, 0.0])
+    )
+    
+    await agent.execute("task")
+    await agent.execute("a paraphrased task")
+    
+    assert model.calls == 2
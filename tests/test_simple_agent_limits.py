@@ -0,0 +1,63 @@
+"""Tests for the shared Gemini concurrency and rate limits."""
+
+import asyncio
+
+import pytest
+from google.api_core import exceptions as google_exceptions
+
+from manus_machina.agents import simple_agent
+from manus_machina.governance.safety import RateLimiter
+from manus_machina.resilience.retry import RetryConfig, RetryPolicy
+
+
+class CountingLimiter(RateLimiter):
+    def __init__(self):
+        super().__init__(requests_per_minute=10_000)
+        self.checks = 0
+    
+    def check_request(self) -> bool:
+        self.checks += 1
+        return super().check_request()
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    limiter = CountingLimiter()
+    monkeypatch.setattr(simple_agent, "_rate_limiter", limiter)
+    return limiter
+
+
+def test_limits_work_across_event_loops(limiter):
+    async def burst():
+        async def call():
+            await asyncio.sleep(0)
+            return "ok"
+        
+        # More calls than slots, so callers contend on the semaphore
+        calls = simple_agent._MAX_CONCURRENCY * 2
+        return await asyncio.gather(*(simple_agent._throttled(call) for _ in range(calls)))
+    
+    assert set(asyncio.run(burst())) == {"ok"}
+    assert set(asyncio.run(burst())) == {"ok"}
+
+
+async def test_each_retry_is_readmitted(limiter, monkeypatch):
+    monkeypatch.setattr(simple_agent, "_rate_limit_retry", RetryPolicy(
+        "test_rate_limit",
+        RetryConfig(
+            max_attempts=3,
+            base_delay=0.001,
+            retry_on_exceptions=(google_exceptions.TooManyRequests,)
+        )
+    ))
+    attempts = []
+    
+    async def call():
+        attempts.append(None)
+        if len(attempts) < 3:
+            raise google_exceptions.TooManyRequests("slow down")
+        return "ok"
+    
+    assert await simple_agent._throttled(call) == "ok"
+    assert len(attempts) == 3
+    assert limiter.checks == 3
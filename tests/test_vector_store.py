@@ -0,0 +1,58 @@
+"""Tests for the in-memory vector store."""
+
+import numpy as np
+import pytest
+
+from manus_machina.memory.vector_store import Document, InMemoryVectorStore
+
+
+def _doc(doc_id, embedding):
+    return Document(id=doc_id, content=doc_id, embedding=embedding)
+
+
+def _row(store, doc_id):
+    return store._matrix[store._id_to_row[doc_id]]
+
+
+async def test_wrong_dimension_leaves_store_unchanged():
+    store = InMemoryVectorStore(embedding_dim=3)
+    await store.add_documents([_doc("a", [1.0, 0.0, 0.0])])
+    
+    with pytest.raises(ValueError):
+        await store.add_documents([_doc("b", [0.0, 1.0])])
+    with pytest.raises(ValueError):
+        await store.add_documents([_doc("b", [0.0, 1.0, 0.0]), _doc("c", [1.0, 0.0])])
+    
+    assert store.ids == ["a"]
+    assert set(store.documents) == {"a"}
+    results = await store.search("query", k=10)
+    assert [result.document.id for result in results] == ["a"]
+
+
+async def test_delete_moves_last_row_into_gap():
+    store = InMemoryVectorStore(embedding_dim=3)
+    await store.add_documents([
+        _doc("a", [1.0, 0.0, 0.0]),
+        _doc("b", [0.0, 1.0, 0.0]),
+        _doc("c", [0.0, 0.0, 2.0]),
+    ])
+    
+    await store.delete(["a", "missing"])
+    
+    assert store.ids == ["c", "b"]
+    assert store._id_to_row == {"c": 0, "b": 1}
+    np.testing.assert_allclose(_row(store, "c"), [0.0, 0.0, 1.0])
+    np.testing.assert_allclose(_row(store, "b"), [0.0, 1.0, 0.0])
+    
+    results = await store.search("query", k=10)
+    assert sorted(result.document.id for result in results) == ["b", "c"]
+
+
+async def test_re_added_id_replaces_its_row():
+    store = InMemoryVectorStore(embedding_dim=3)
+    await store.add_documents([_doc("a", [1.0, 0.0, 0.0]), _doc("b", [0.0, 1.0, 0.0])])
+    
+    await store.update(_doc("a", [0.0, 0.0, 3.0]))
+    
+    assert store.ids == ["a", "b"]
+    np.testing.assert_allclose(_row(store, "a"), [0.0, 0.0, 1.0])